@@ -0,0 +1,162 @@
+"""Frame-time benchmark: times Game.step_frame and Game.draw per scenario.
+
+Runs under the SDL dummy video/audio drivers, reports p50/p95/p99 frame times and
+per-frame allocation high-water marks, and saves results as JSON for comparison:
+
+    python -m benchmarks.frame_bench --out before.json
+    python -m benchmarks.frame_bench --out after.json --compare before.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Must be set before pygame initializes any subsystem
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+from snake_game import settings as s
+from snake_game.game import Game
+from .scenarios import get_scenarios, SCENARIOS
+
+def percentiles(samples):
+    """Summarizes a list of millisecond samples."""
+    arr = np.asarray(samples, dtype=float)
+    return {
+        "p50": float(np.percentile(arr, 50)),
+        "p95": float(np.percentile(arr, 95)),
+        "p99": float(np.percentile(arr, 99)),
+        "mean": float(arr.mean()),
+        "max": float(arr.max()),
+    }
+
+def run_scenario(game, scenario, frames, warmup, alloc_frames, seed):
+    """Measures one scenario. Returns its result dict."""
+    dt = 1.0 / s.FPS
+    scenario.prepare(game, seed)
+    rebuilds = 0
+
+    def frame(timed):
+        nonlocal rebuilds
+        if game.game_state == "PLAYING" and not game.player_snake.alive or \
+           scenario.name not in ("menu", "game_over") and game.game_state != "PLAYING":
+            scenario.prepare(game, seed) # Workload died (e.g. head-on collision): rebuild outside timing
+            rebuilds += 1
+        if scenario.tick: scenario.tick(game)
+        t0 = time.perf_counter()
+        game.step_frame(dt) # One fixed tick per frame at the default rates
+        t1 = time.perf_counter()
+        game.draw()
+        t2 = time.perf_counter()
+        if timed:
+            update_ms.append((t1 - t0) * 1000)
+            draw_ms.append((t2 - t1) * 1000)
+
+    update_ms, draw_ms = [], []
+    for _ in range(warmup): frame(False)
+    for _ in range(frames): frame(True)
+
+    # Separate pass for allocations, since tracing slows every allocation down
+    alloc_kib = []
+    tracemalloc.start()
+    for _ in range(alloc_frames):
+        tracemalloc.reset_peak()
+        start, _ = tracemalloc.get_traced_memory()
+        frame(False)
+        _, peak = tracemalloc.get_traced_memory()
+        alloc_kib.append((peak - start) / 1024)
+    tracemalloc.stop()
+
+    frame_ms = [u + d for u, d in zip(update_ms, draw_ms)]
+    return {
+        "description": scenario.description,
+        "frames": frames,
+        "update_ms": percentiles(update_ms),
+        "draw_ms": percentiles(draw_ms),
+        "frame_ms": percentiles(frame_ms),
+        "alloc_peak_kib": percentiles(alloc_kib) if alloc_kib else None,
+        "rebuilds": rebuilds,
+        "entities": {
+            "player_length": len(game.player_snake.body) if game.player_snake else 0,
+            "particles": len(game.particles),
+            "hazards": len(game.hazards),
+            "powerups": len(game.powerups),
+        },
+    }
+
+def compare(current, baseline):
+    """Prints p50/p95 frame-time deltas against a previous results file."""
+    print(f"\n{'scenario':<12} {'p50 ms':>16} {'p95 ms':>16}")
+    for name, res in current["scenarios"].items():
+        old = baseline.get("scenarios", {}).get(name)
+        if not old: continue
+        cells = []
+        for key in ("p50", "p95"):
+            new_v, old_v = res["frame_ms"][key], old["frame_ms"][key]
+            change = (new_v - old_v) / old_v * 100 if old_v else 0.0
+            cells.append(f"{old_v:6.2f}->{new_v:6.2f} {change:+4.0f}%")
+        print(f"{name:<12} {cells[0]:>16} {cells[1]:>16}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Game.step_frame / Game.draw frame times.")
+    parser.add_argument("--scenario", action="append", help=f"Scenario to run (repeatable). Default: all of {', '.join(sc.name for sc in SCENARIOS)}")
+    parser.add_argument("--frames", type=int, default=600, help="Timed frames per scenario")
+    parser.add_argument("--warmup", type=int, default=60, help="Untimed frames before measuring")
+    parser.add_argument("--alloc-frames", type=int, default=120, help="Frames traced for allocations (0 disables)")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--dirty-rects", action="store_true", help="Render in dirty-rectangle mode")
+    parser.add_argument("--out", help="Write results JSON here")
+    parser.add_argument("--compare", help="Previous results JSON to diff against")
+    args = parser.parse_args(argv)
+
+    # Keep the benchmark from touching the player's highscore and replay files
+    scratch_dir = tempfile.mkdtemp(prefix="snake_bench_")
+    s.HIGHSCORE_FILE = os.path.join(scratch_dir, "highscore.json")
+    s.RECORD_REPLAYS = False
+    s.DIRTY_RECTS = args.dirty_rects
+
+    game = Game(seed=args.seed)
+    game.assets.wait() # Keep background asset loading out of the timed frames
+    game.poll_assets() # Merge the warmed font and sprite caches before timing
+    results = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "video_driver": pygame.display.get_driver(),
+            "seed": args.seed,
+            "dirty_rects": args.dirty_rects,
+        },
+        "scenarios": {},
+    }
+    for scenario in get_scenarios(args.scenario):
+        with contextlib.redirect_stdout(io.StringIO()): # Silence "Game Over!" prints from rebuilds
+            res = run_scenario(game, scenario, args.frames, args.warmup, args.alloc_frames, args.seed)
+        results["scenarios"][scenario.name] = res
+        u, d, f = res["update_ms"], res["draw_ms"], res["frame_ms"]
+        print(f"{scenario.name:<12} update p50 {u['p50']:6.2f}  draw p50 {d['p50']:6.2f}  "
+              f"frame p50/p95/p99 {f['p50']:6.2f}/{f['p95']:6.2f}/{f['p99']:6.2f} ms")
+    pygame.quit()
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.out}")
+    if args.compare:
+        with open(args.compare) as f:
+            compare(results, json.load(f))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""Synthetic workloads built directly against Game for frame-time benchmarks.
+
+Each scenario sets up a game state once (setup) and may top it back up before
+every frame (tick), so the workload stays constant for the whole measurement.
+"""
+from snake_game import settings as s
+from snake_game import utils
+from snake_game import grid
+from snake_game.pathfinding import DIRECTIONS
+
+class Scenario:
+    def __init__(self, name, description, setup, tick=None):
+        self.name = name
+        self.description = description
+        self.setup = setup # setup(game), called after game.start_new_game()
+        self.tick = tick # tick(game), called before every measured frame
+
+    def prepare(self, game, seed):
+        """(Re)builds the scenario on `game` from a fresh seeded game."""
+        game.start_new_game(seed=seed)
+        self.setup(game)
+
+
+# --- Helpers ---
+def lay_out_snake(snake, length):
+    """Replaces the snake's body with a `length`-cell serpentine through the top rows, head last laid."""
+    cells = []
+    for y in range(s.WORLD_GRID_HEIGHT):
+        xs = range(s.WORLD_GRID_WIDTH) if y % 2 == 0 else range(s.WORLD_GRID_WIDTH - 1, -1, -1)
+        cells.extend((x, y) for x in xs)
+        if len(cells) >= length: break
+    cells = cells[:length] # Tail first
+    heads = snake.game.snake_heads
+    if heads.get(snake.body.head) is snake: del heads[snake.body.head]
+    heads[cells[-1]] = snake
+    snake.body.release()
+    snake.body.reset(cells[0])
+    for cell in cells[1:]:
+        snake.body.push_head(cell)
+    snake.length = length
+    snake.grow_pending = 0
+    snake.visual_pos = [utils.grid_to_screen(p) for p in snake.body]
+    snake.prev_visual_pos = list(snake.visual_pos)
+    snake.direction = snake.next_direction = (0, 1) # Head into the open rows below
+
+def autopilot(game):
+    """Keeps the player alive: phases through itself and steers away from walls and bombs."""
+    snake = game.player_snake
+    if not snake or not snake.alive: return
+    snake.activate_powerup('phase')
+    head = snake.body.head
+    options = [snake.direction] + [d for d in DIRECTIONS if d != snake.direction]
+    for d in options:
+        if d[0] == -snake.direction[0] and d[1] == -snake.direction[1]: continue
+        nxt = (head[0] + d[0], head[1] + d[1])
+        if game.grid.in_bounds(nxt) and not game.grid.has(grid.HAZARD, nxt):
+            snake.change_direction(d)
+            return
+
+def fill_hazards_and_powerups(game):
+    """Tops hazards and powerups up to their max counts with long lifetimes."""
+    while len(game.hazards) < s.HAZARD_MAX_COUNT:
+        handle = game.hazards.spawn()
+        if handle is None: break
+        game.hazards.view(handle).lifetime = 1e9
+    while len(game.powerups) < s.POWERUP_MAX_COUNT:
+        if game.powerups.spawn() is None: break
+
+def keep_particles(game, count=2000):
+    missing = count - len(game.particles)
+    if missing > 0:
+        game.particles.emit((s.WIDTH / 2, s.HEIGHT / 2), missing, s.FOOD_COLOR)
+
+def keep_frenzy(game):
+    game.frenzy_active = True
+    game.frenzy_timer = s.FRENZY_DURATION
+    game.combo_count = max(game.combo_count, s.FRENZY_THRESHOLD)
+    game.combo_timer = s.COMBO_TIME_LIMIT
+    snake = game.player_snake
+    if snake and snake.alive:
+        for p_type in snake.powerup_timers:
+            if p_type != 'burst': snake.activate_powerup(p_type) # Burst would double-step into walls
+
+
+# --- Scenario setups ---
+def _noop(game):
+    pass
+
+def _menu(game):
+    game.game_state = "MENU"
+
+def _long_snake(game):
+    for competitor in game.competitors: competitor.die() # Their start cells may lie inside the laid-out body
+    lay_out_snake(game.player_snake, 500)
+
+def _game_over(game):
+    game.trigger_game_over("benchmark")
+
+def _stress_tick(game):
+    autopilot(game)
+    fill_hazards_and_powerups(game)
+    keep_particles(game)
+    keep_frenzy(game)
+
+
+SCENARIOS = [
+    Scenario("menu", "Menu screen: background fireflies and static text", _menu),
+    Scenario("baseline", "Fresh game, both snakes at start length", _noop, autopilot),
+    Scenario("long_snake", "500-segment player snake", _long_snake, autopilot),
+    Scenario("particles", "2,000 live particles", _noop, lambda g: (autopilot(g), keep_particles(g))),
+    Scenario("crowded", "Max hazards and powerups on the board", _noop, lambda g: (autopilot(g), fill_hazards_and_powerups(g))),
+    Scenario("frenzy", "Frenzy active with combo and all powerup timers in the HUD", _noop, lambda g: (autopilot(g), keep_frenzy(g))),
+    Scenario("game_over", "Game over overlay with screen shake", _game_over),
+    Scenario("stress", "500-segment snake, 2,000 particles, max entities and frenzy", _long_snake, _stress_tick),
+]
+
+def get_scenarios(names=None):
+    if not names: return list(SCENARIOS)
+    by_name = {sc.name: sc for sc in SCENARIOS}
+    unknown = [n for n in names if n not in by_name]
+    if unknown:
+        raise ValueError(f"Unknown scenario(s): {', '.join(unknown)}. Available: {', '.join(by_name)}")
+    return [by_name[n] for n in names]
@@ -0,0 +1,112 @@
+import time
+from os import path
+import pygame
+from .. import settings as s
+
+# Sound name -> settings path
+SOUND_PATHS = {
+    "eat": "SOUND_EAT_PATH",
+    "powerup": "SOUND_POWERUP_PATH",
+    "gameover": "SOUND_GAMEOVER_PATH",
+    **{f"combo_{i}": f"SOUND_COMBO_{i}_PATH" for i in range(1, 6)},
+}
+# Sound name -> voice category (limits and priorities are per category, see settings.py)
+CATEGORIES = {
+    "eat": "eat",
+    "powerup": "powerup",
+    "gameover": "event",
+    **{f"combo_{i}": "combo" for i in range(1, 6)},
+}
+
+class _Voice:
+    __slots__ = ("channel", "category", "priority")
+    def __init__(self, channel, category, priority):
+        self.channel = channel
+        self.category = category
+        self.priority = priority
+
+
+class SoundManager:
+    """Plays the game's sound effects through a fixed pool of mixer channels.
+
+    Effects are decoded once into Sound buffers and played on SOUND_CHANNELS channels the
+    manager owns, so a frenzy can't pile up voices. Each category has a voice limit: past
+    it, the category's oldest voice is cut for the new one. When every channel is busy, the
+    lowest-priority, oldest voice is stolen if it ranks no higher than the new sound;
+    otherwise the new sound is dropped. Retriggers of one sound within SOUND_MIN_INTERVAL
+    are dropped too. The ambient loop streams from disk through pygame.mixer.music.
+    """
+    def __init__(self):
+        self.sounds = {} # Name -> decoded Sound
+        self.music_path = None
+        self.channels = []
+        self.voices = [] # Playing (or recently played) voices, oldest first
+        self.last_played = {} # Name -> time of its last accepted play
+        self.stats = {"played": 0, "rate_limited": 0, "limited": 0, "stolen": 0, "dropped": 0}
+
+    def load(self):
+        """Opens the mixer's channel pool and decodes the effects. Raises pygame.error without audio."""
+        if not pygame.mixer.get_init(): pygame.mixer.init()
+        pygame.mixer.set_num_channels(s.SOUND_CHANNELS)
+        self.channels = [pygame.mixer.Channel(i) for i in range(s.SOUND_CHANNELS)]
+        for name, setting in SOUND_PATHS.items():
+            file_path = getattr(s, setting, None)
+            if file_path and path.exists(file_path):
+                try:
+                    self.sounds[name] = pygame.mixer.Sound(file_path) # Decodes with the GIL released
+                except pygame.error as e:
+                    print(f"Warning: Could not load sound '{file_path}': {e}")
+        ambient_path = getattr(s, "SOUND_AMBIENT_PATH", None)
+        if ambient_path and path.exists(ambient_path):
+            self.music_path = ambient_path
+        return self
+
+    def start_music(self):
+        """Streams the ambient loop (never held in memory as a whole)."""
+        if not self.music_path: return
+        try:
+            pygame.mixer.music.load(self.music_path)
+            pygame.mixer.music.set_volume(s.AMBIENT_VOLUME)
+            pygame.mixer.music.play(loops=-1)
+        except pygame.error as e:
+            print(f"Warning: Could not stream music '{self.music_path}': {e}")
+
+    def play(self, name, now=None):
+        """Plays a loaded sound, subject to rate, voice and pool limits. Returns the channel or None."""
+        sound = self.sounds.get(name)
+        if sound is None: return None
+        if now is None: now = time.perf_counter()
+        last = self.last_played.get(name)
+        if last is not None and now - last < s.SOUND_MIN_INTERVAL:
+            self.stats["rate_limited"] += 1
+            return None
+
+        category = CATEGORIES.get(name, "event")
+        priority = s.SOUND_PRIORITIES.get(category, 0)
+        self.voices = [v for v in self.voices if v.channel.get_busy()] # Forget finished voices
+
+        channel = None
+        same = [v for v in self.voices if v.category == category]
+        if len(same) >= s.SOUND_VOICE_LIMITS.get(category, len(self.channels)):
+            victim = same[0] # Oldest voice of this category makes room
+            self.stats["limited"] += 1
+        else:
+            victim = None
+            busy = {v.channel for v in self.voices}
+            channel = next((c for c in self.channels if c not in busy and not c.get_busy()), None)
+            if channel is None: # Pool full: steal the lowest-priority, oldest voice
+                lowest = min(self.voices, key=lambda v: v.priority, default=None)
+                if lowest is None or lowest.priority > priority:
+                    self.stats["dropped"] += 1
+                    return None
+                victim = lowest
+                self.stats["stolen"] += 1
+        if victim is not None:
+            self.voices.remove(victim)
+            channel = victim.channel
+
+        channel.play(sound) # Replaces whatever the channel was playing
+        self.voices.append(_Voice(channel, category, priority))
+        self.last_played[name] = now
+        self.stats["played"] += 1
+        return channel
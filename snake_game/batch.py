@@ -0,0 +1,194 @@
+"""Batch runner: plays many headless games across a process pool and summarizes the results.
+
+Each job is one game: a seed, a set of settings overrides and a player policy. Games
+with the same index share a seed across parameter sets, so sweeps compare like with like:
+
+    python -m snake_game.batch --games 2000 --sweep HAZARD_SPAWN_CHANCE=0.002,0.005,0.01 --out sweep.json
+"""
+import argparse
+import ast
+import importlib
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+import time
+from collections import Counter
+
+from . import settings as s
+from .pathfinding import DIRECTIONS
+from .simulation import SimulationCore
+from .entities.snake import Snake
+
+TIMEOUT_REASON = "max_ticks" # Recorded when a game hits --max-ticks without ending
+DEFAULT_MAX_SECONDS = 600 # Default game cap in simulated seconds, converted to ticks at each set's SIMULATION_HZ
+
+# --- Player policies ---
+def _safe_random_policy(seed):
+    """Turns at random, but never into a wall, snake or bomb if any other move is open."""
+    rng = random.Random(seed) # Own stream, so the policy never shifts the game's spawns
+
+    def policy(snake):
+        head = snake.body.head
+        is_blocked = snake.game.grid.blocks_movement
+        moves = [d for d in DIRECTIONS if not (d[0] == -snake.direction[0] and d[1] == -snake.direction[1])]
+        open_moves = [d for d in moves if not is_blocked((head[0] + d[0], head[1] + d[1]))]
+        if open_moves: snake.change_direction(rng.choice(open_moves))
+    return policy
+
+POLICIES = {
+    "ai": lambda seed: Snake.update_ai, # The competitor's AI (AI_MODE) steering the player
+    "safe_random": _safe_random_policy,
+}
+
+def make_policy(name, seed):
+    """Builds a policy(snake) by name, or from a "module:function" path to a policy(snake)."""
+    if name in POLICIES: return POLICIES[name](seed)
+    module_name, _, attr = name.partition(":")
+    if not attr:
+        raise ValueError(f"Unknown policy '{name}'. Use one of {', '.join(POLICIES)} or module:function")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+# --- Jobs ---
+def run_game(job):
+    """Plays one game headless. Runs in a worker process; returns (set index, result dict)."""
+    set_index, overrides, seed, policy_name, max_ticks = job
+    saved = {name: getattr(s, name) for name in overrides}
+    try:
+        for name, value in overrides.items(): setattr(s, name, value)
+        core = SimulationCore(seed=seed)
+        core.start_new_game(seed=seed)
+        core.player_snake.policy = make_policy(policy_name, seed)
+        if max_ticks is None: max_ticks = round(s.SIMULATION_HZ * DEFAULT_MAX_SECONDS) # Under this set's overrides
+        ticks = core.advance(max_ticks)
+        return set_index, {
+            "seed": seed,
+            "score": core.score,
+            "ticks": ticks,
+            "seconds": ticks / s.SIMULATION_HZ, # Simulated time, at this set's tick rate
+            "length": core.player_snake.length,
+            "reason": core.game_over_reason or TIMEOUT_REASON,
+        }
+    finally:
+        for name, value in saved.items(): setattr(s, name, value) # Pool workers are reused across jobs
+
+
+# --- Aggregation ---
+def distribution(values):
+    """Summary statistics of a list of numbers."""
+    ordered = sorted(values)
+    n = len(ordered)
+    pick = lambda q: ordered[min(n - 1, int(n * q))]
+    return {
+        "mean": statistics.fmean(ordered),
+        "stdev": statistics.stdev(ordered) if n > 1 else 0.0,
+        "min": ordered[0], "p10": pick(0.10), "p50": pick(0.50), "p90": pick(0.90), "max": ordered[-1],
+    }
+
+def summarize(overrides, results):
+    """Aggregates one parameter set's game results."""
+    return {
+        "overrides": overrides,
+        "games": len(results),
+        "score": distribution([r["score"] for r in results]),
+        "seconds": distribution([r["seconds"] for r in results]), # Game length in simulated time
+        "length": distribution([r["length"] for r in results]),
+        "reasons": dict(Counter(r["reason"] for r in results).most_common()),
+    }
+
+
+# --- CLI ---
+def parse_assignment(text):
+    """Parses NAME=VALUE[,VALUE...] into (name, [values]), checking NAME is a setting."""
+    name, sep, raw = text.partition("=")
+    name = name.strip()
+    if not sep or not name:
+        raise ValueError(f"Expected NAME=VALUE, got '{text}'")
+    if not name.isupper() or not hasattr(s, name):
+        raise ValueError(f"Unknown setting '{name}'")
+    values = []
+    for item in raw.split(","):
+        try:
+            values.append(ast.literal_eval(item.strip()))
+        except (ValueError, SyntaxError):
+            values.append(item.strip()) # Bare words are strings, e.g. AI_MODE=greedy
+    return name, values
+
+def parameter_sets(fixed, sweeps):
+    """Every combination of the swept values, each merged over the fixed overrides."""
+    names = [name for name, _ in sweeps]
+    combos = itertools.product(*(values for _, values in sweeps))
+    return [{**fixed, **dict(zip(names, combo))} for combo in combos]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play many headless games per settings override and summarize the results.")
+    parser.add_argument("--games", type=int, default=1000, help="Games per parameter set")
+    parser.add_argument("--set", action="append", default=[], metavar="NAME=VALUE", help="Fixed settings override (repeatable)")
+    parser.add_argument("--sweep", action="append", default=[], metavar="NAME=V1,V2", help="Settings values to sweep (repeatable; combined as a grid)")
+    parser.add_argument("--policy", default="ai", help=f"Player policy: {', '.join(POLICIES)} or module:function (default: ai)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of game 0; game i uses seed + i")
+    parser.add_argument("--max-ticks", type=int, default=None, help=f"Ends a game after this many ticks (default: {DEFAULT_MAX_SECONDS // 60} simulated minutes at each set's SIMULATION_HZ)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes (default: all cores)")
+    parser.add_argument("--out", default="batch_summary.json", help="Summary JSON path")
+    args = parser.parse_args(argv)
+
+    try:
+        fixed = {}
+        for text in args.set:
+            name, values = parse_assignment(text)
+            if len(values) != 1: raise ValueError(f"--set takes a single value, use --sweep for '{name}'")
+            fixed[name] = values[0]
+        sets = parameter_sets(fixed, [parse_assignment(text) for text in args.sweep])
+        make_policy(args.policy, 0) # Fail fast on a bad policy name
+    except (ValueError, ImportError, AttributeError) as e:
+        print(f"Error: {e}")
+        return 2
+
+    jobs = [(i, overrides, args.seed + game, args.policy, args.max_ticks)
+            for i, overrides in enumerate(sets) for game in range(args.games)]
+    results = [[] for _ in sets]
+    started = time.perf_counter()
+    print(f"Running {len(jobs)} games ({len(sets)} parameter set(s) x {args.games}) on {args.workers} worker(s)...")
+    if args.workers <= 1:
+        for set_index, result in map(run_game, jobs): results[set_index].append(result)
+    else:
+        chunksize = max(1, len(jobs) // (args.workers * 8)) # Few round trips, still balanced at the end
+        with multiprocessing.Pool(args.workers) as pool:
+            for set_index, result in pool.imap_unordered(run_game, jobs, chunksize):
+                results[set_index].append(result)
+    elapsed = time.perf_counter() - started
+
+    summary = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "games_per_set": args.games,
+            "policy": args.policy,
+            "seed": args.seed,
+            "max_ticks": args.max_ticks, # None: DEFAULT_MAX_SECONDS at each set's SIMULATION_HZ
+            "workers": args.workers,
+            "elapsed_s": elapsed,
+        },
+        "sets": [summarize(overrides, set_results) for overrides, set_results in zip(sets, results)],
+    }
+    for entry in summary["sets"]:
+        label = ", ".join(f"{k}={v}" for k, v in entry["overrides"].items()) or "defaults"
+        score, seconds = entry["score"], entry["seconds"]
+        top_reason = next(iter(entry["reasons"]), "-")
+        print(f"{label}: score mean {score['mean']:.1f} p50 {score['p50']}  length p50 {seconds['p50']:.1f}s  top death: {top_reason}")
+    print(f"{len(jobs)} games in {elapsed:.1f}s ({len(jobs) / elapsed:.0f} games/s)")
+
+    try:
+        with open(args.out, "w") as f:
+            json.dump(summary, f, indent=2)
+    except IOError:
+        print(f"Warning: Could not write summary to file: {args.out}")
+        return 1
+    print(f"Summary written to {args.out}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
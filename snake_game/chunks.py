@@ -0,0 +1,72 @@
+import math
+from . import settings as s
+from .grid import NUM_KINDS
+
+class ChunkIndex:
+    """Sparse index of entities by square chunk of cells, so a view only visits nearby chunks.
+
+    Per occupancy kind (grid.FOOD, grid.POWERUP, grid.HAZARD), each chunk key maps to an
+    insertion-ordered dict of the entities whose cell lies in it. Entities register on
+    spawn and unregister on despawn, so queries cost the chunks in view, not the world.
+    """
+    def __init__(self, world_cells, chunk_size=None):
+        # world_cells is the indexed grid's (width, height), passed in so a runtime world override is honoured
+        self.chunk_size = s.CHUNK_SIZE if chunk_size is None else chunk_size
+        self.max_ring = math.ceil(max(world_cells) / self.chunk_size) # Rings past this lie outside the world
+        self.chunks = [{} for _ in range(NUM_KINDS)]
+
+    def clear(self):
+        for kind_chunks in self.chunks:
+            kind_chunks.clear()
+
+    def add(self, kind, pos, item):
+        key = (pos[0] // self.chunk_size, pos[1] // self.chunk_size)
+        self.chunks[kind].setdefault(key, {})[item] = None
+
+    def remove(self, kind, pos, item):
+        key = (pos[0] // self.chunk_size, pos[1] // self.chunk_size)
+        bucket = self.chunks[kind].get(key)
+        if bucket is None: return
+        bucket.pop(item, None)
+        if not bucket: del self.chunks[kind][key] # Keep the index as sparse as the world
+
+    def query(self, kind, cells):
+        """Entities of `kind` in chunks overlapping the inclusive (x0, y0, x1, y1) cell range."""
+        size = self.chunk_size
+        x0, y0, x1, y1 = cells
+        kind_chunks = self.chunks[kind]
+        found = []
+        for cy in range(y0 // size, y1 // size + 1):
+            for cx in range(x0 // size, x1 // size + 1):
+                bucket = kind_chunks.get((cx, cy))
+                if bucket: found.extend(bucket)
+        return found
+
+    def nearest(self, kind, pos, max_distance=None):
+        """The entity of `kind` whose `grid_pos` is closest to `pos` (Manhattan), or None.
+
+        Walks square rings of chunks outward from `pos`'s chunk and stops once no
+        unvisited chunk can hold anything closer, so cost follows the distance to the
+        nearest entity rather than the number of entities.
+        """
+        size = self.chunk_size
+        kind_chunks = self.chunks[kind]
+        if not kind_chunks: return None
+        cx, cy = pos[0] // size, pos[1] // size
+        best, best_dist = None, None
+        for ring in range(self.max_ring + 1):
+            reach = (ring - 1) * size + 1 # Closest any cell in this ring or beyond can be
+            if best_dist is not None and best_dist <= reach: break
+            if max_distance is not None and reach > max_distance: break
+            for ky in range(cy - ring, cy + ring + 1):
+                step = 1 if ky in (cy - ring, cy + ring) else 2 * ring # Ring edge only
+                for kx in range(cx - ring, cx + ring + 1, max(1, step)):
+                    bucket = kind_chunks.get((kx, ky))
+                    if not bucket: continue
+                    for item in bucket:
+                        gx, gy = item.grid_pos
+                        dist = abs(gx - pos[0]) + abs(gy - pos[1])
+                        if best_dist is None or dist < best_dist:
+                            best, best_dist = item, dist
+        if max_distance is not None and best_dist is not None and best_dist > max_distance: return None
+        return best
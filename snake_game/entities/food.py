@@ -1,45 +1,160 @@
 import pygame
-import random
 import math
 from .. import settings as s
 from .. import utils
+from .. import grid
+from ..graphics.sprite_cache import SpriteCache, glow_cache
+
+def glow_sprite(scale, cache=glow_cache):
+    """The food's cached glow at a perspective scale (brighter nearer the bottom)."""
+    radius = int(s.GRID_SIZE // 2 * scale)
+    glow_radius = int(radius * 1.5)
+    # Use COLOR constants from settings
+    glow_color_base = s.FOOD_GLOW_COLOR
+    glow_color = (*glow_color_base[:3], int(glow_color_base[3] * (scale/((s.MIN_SCALE+s.MAX_SCALE)/2))))
+    return cache.get_circle(glow_radius, glow_color)
+
+def warm_sprites(scales):
+    """Pre-renders the food glow for each perspective scale, so the first frames don't stall.
+
+    Renders into a new SpriteCache (safe off the main thread); merge it into glow_cache on the main thread.
+    """
+    cache = SpriteCache(glow_cache.max_size)
+    for scale in sorted(set(scales.tolist())):
+        if int(s.GRID_SIZE // 2 * scale) >= 1: glow_sprite(scale, cache)
+    return cache
 
 class Food:
     def __init__(self, game):
         self.game = game # Store reference to game state
+        self.grid_pos = None
+        self.visual_pos = None
+        self.prev_visual_pos = None # Position as of the previous tick (render interpolation)
         self.spawn()
 
     def spawn(self):
-        occupied_positions = set()
-        if self.game.player_snake and self.game.player_snake.alive:
-            occupied_positions.update(self.game.player_snake.grid_pos)
-        if self.game.competitor_snake and self.game.competitor_snake.alive:
-            occupied_positions.update(self.game.competitor_snake.grid_pos)
-        for hazard in self.game.hazards:
-            occupied_positions.update(hazard.grid_positions) # Correctly update from hazard sets
-        occupied_positions.update(p.grid_pos for p in self.game.powerups)
-
-        while True:
-            self.grid_pos = (random.randrange(0, s.GRID_WIDTH), random.randrange(0, s.GRID_HEIGHT))
-            if self.grid_pos not in occupied_positions:
-                self.visual_pos = utils.grid_to_screen(self.grid_pos)
-                break
-
-    def draw(self, surface):
-        screen_pos = self.visual_pos
-        scale = utils.get_perspective_scale(screen_pos[1])
-        radius = int(s.GRID_SIZE // 2 * scale)
-        glow_radius = int(radius * 1.5)
-        if radius < 1: return
+        """Moves the food to a random free cell. Returns False (and hides it) if the board is full."""
+        occupancy = self.game.grid
+        if self.grid_pos is not None:
+            occupancy.remove(grid.FOOD, self.grid_pos) # Vacate the old cell before moving
+            self.game.chunks.remove(grid.FOOD, self.grid_pos, self)
+
+        self.grid_pos = occupancy.random_free_cell(self.game.rng)
+        if self.grid_pos is None: # Board full, the game retries every tick
+            self.visual_pos = self.prev_visual_pos = None
+            return False
+        self.visual_pos = self.prev_visual_pos = utils.grid_to_screen(self.grid_pos) # Jumps, never slides
+        occupancy.add(grid.FOOD, self.grid_pos)
+        self.game.chunks.add(grid.FOOD, self.grid_pos, self)
+        return True
+
+    def despawn(self):
+        """Frees the food's cell (when an extra item is eaten and not replaced)."""
+        if self.grid_pos is None: return
+        self.game.grid.remove(grid.FOOD, self.grid_pos)
+        self.game.chunks.remove(grid.FOOD, self.grid_pos, self)
+        self.grid_pos = self.visual_pos = self.prev_visual_pos = None
+
+    def snapshot_visuals(self):
+        """Remembers this tick's position so frames between ticks can interpolate from it."""
+        self.prev_visual_pos = self.visual_pos
 
-        # Use COLOR constants from settings
-        glow_color_base = s.FOOD_GLOW_COLOR
-        glow_color = (*glow_color_base[:3], int(glow_color_base[3] * (scale/((s.MIN_SCALE+s.MAX_SCALE)/2))))
+    def screen_points(self):
+        """Screen position handed to the projection stage (none while unplaced)."""
+        return (self.visual_pos,) if self.visual_pos is not None else ()
 
+    def previous_screen_points(self):
+        """Screen position as of the previous tick."""
+        return (self.prev_visual_pos,) if self.prev_visual_pos is not None else ()
+
+    def draw(self, surface, points, scales):
+        """Draws the food at its projected point. Returns the screen rects it touched."""
+        screen_pos = points[0].tolist()
+        scale = scales.item(0)
+        radius = int(s.GRID_SIZE // 2 * scale)
+        if radius < 1: return []
+        glow = glow_sprite(scale)
+        glow_radius = glow.get_width() // 2
+
+        rects = []
         try:
-            temp_surf_glow = pygame.Surface((glow_radius*2, glow_radius*2), pygame.SRCALPHA)
-            pygame.draw.circle(temp_surf_glow, glow_color, (glow_radius, glow_radius), glow_radius)
-            surface.blit(temp_surf_glow, (screen_pos[0] - glow_radius, screen_pos[1] - glow_radius))
-            pygame.draw.circle(surface, s.FOOD_COLOR, screen_pos, radius)
+            rects.append(surface.blit(glow, (screen_pos[0] - glow_radius, screen_pos[1] - glow_radius)))
+            rects.append(pygame.draw.circle(surface, s.FOOD_COLOR, screen_pos, radius))
         except pygame.error:
-            pass # Ignore drawing errors if size is invalid
\ No newline at end of file
+            pass # Ignore drawing errors if size is invalid
+        return rects
+
+
+class FoodField:
+    """Every food item on the board, indexed by cell.
+
+    `by_cell` maps each placed item's cell to it, so checking whether any head
+    landed on food costs one lookup per head. The field keeps `target` items on the
+    board (FOOD_COUNT): eaten items respawn while the field is at or below it, and
+    extras beyond it (frenzy bursts) are removed when eaten.
+    """
+    SCAN_LIMIT = 32 # Up to this many items, a linear scan beats walking chunk rings
+
+    def __init__(self, game, target=None):
+        self.game = game
+        self.target = s.FOOD_COUNT if target is None else target # Read per game, so runtime overrides apply
+        self.items = []
+        self.by_cell = {}
+        self.spawn(self.target)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def spawn(self, count):
+        """Places `count` new items on random free cells, then indexes them in one update.
+
+        Items that find the board full stay unplaced and are retried by retry_unplaced().
+        """
+        new_items = [Food(self.game) for _ in range(count)]
+        self.items.extend(new_items)
+        self.by_cell.update((food.grid_pos, food) for food in new_items if food.grid_pos is not None)
+        return new_items
+
+    def respawn(self, food):
+        """Moves an item to a new random free cell."""
+        if food.grid_pos is not None: del self.by_cell[food.grid_pos]
+        if food.spawn(): self.by_cell[food.grid_pos] = food
+
+    def remove(self, food):
+        self.by_cell.pop(food.grid_pos, None)
+        food.despawn()
+        self.items.remove(food)
+
+    def eat(self, food):
+        """Respawns an eaten item, or removes it if it was an extra beyond `target`."""
+        if len(self.items) > self.target: self.remove(food)
+        else: self.respawn(food)
+
+    def retry_unplaced(self):
+        """Places items that found the board full earlier, now that cells may have freed up."""
+        if len(self.by_cell) == len(self.items): return
+        for food in self.items:
+            if food.grid_pos is None and food.spawn(): self.by_cell[food.grid_pos] = food
+
+    def at(self, pos):
+        """The item on cell `pos`, or None."""
+        return self.by_cell.get(pos)
+
+    def nearest(self, pos, max_distance=None):
+        """The placed item closest to cell `pos` by Manhattan distance, or None."""
+        if len(self.by_cell) > self.SCAN_LIMIT:
+            return self.game.chunks.nearest(grid.FOOD, pos, max_distance)
+        best, best_dist = None, None
+        for cell, food in self.by_cell.items():
+            dist = abs(cell[0] - pos[0]) + abs(cell[1] - pos[1])
+            if best_dist is None or dist < best_dist:
+                best, best_dist = food, dist
+        if max_distance is not None and best_dist is not None and best_dist > max_distance: return None
+        return best
+
+    def snapshot_visuals(self):
+        for food in self.items:
+            food.snapshot_visuals()
@@ -1,43 +1,97 @@
 import pygame
-import random
 import math
+import numpy as np
 from .. import settings as s # Relative import for settings
-from .. import utils       # Relative import for utils
-
-class Particle:
-    def __init__(self, pos, color, life, speed_range=(1, 5), size_range=(2, 5), gravity=0.1):
-        self.pos = list(pos)
-        self.color = color
-        self.life = life
-        self.max_life = life
-        angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(*speed_range)
-        self.vel = [math.cos(angle) * speed, math.sin(angle) * speed]
-        self.initial_size = random.uniform(*size_range)
-        self.size = self.initial_size
-        self.gravity = gravity
+from .. import utils
+from ..graphics.sprite_cache import get_glow
+
+class ParticleSystem:
+    """Fixed-capacity particle pool stored as NumPy struct-of-arrays.
+
+    Live particles occupy the first `count` rows. Update (gravity, motion, shrink),
+    dead-particle compaction and alpha/scale math each run as one batched pass, and
+    drawing submits every particle in a single Surface.blits call.
+    """
+    def __init__(self, capacity=s.PARTICLE_CAPACITY, rng=None):
+        self.capacity = capacity
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.pos = np.zeros((capacity, 2))
+        self.vel = np.zeros((capacity, 2))
+        self.life = np.zeros(capacity)
+        self.max_life = np.ones(capacity)
+        self.initial_size = np.zeros(capacity)
+        self.size = np.zeros(capacity)
+        self.gravity = np.zeros(capacity)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.count = 0
+
+    def emit(self, pos, count, color, life_range=(0.5, 1.2), speed_range=(1, 5), size_range=(2, 5), gravity=0.1):
+        """Spawns `count` particles at `pos`. Extra particles are dropped once the pool is full."""
+        n = min(count, self.capacity - self.count)
+        if n <= 0: return
+        start, end = self.count, self.count + n
+        rng = self.rng
+        angle = rng.uniform(0, 2 * math.pi, n)
+        speed = rng.uniform(*speed_range, n)
+        life = rng.uniform(*life_range, n)
+        self.pos[start:end] = pos
+        self.vel[start:end, 0] = np.cos(angle) * speed
+        self.vel[start:end, 1] = np.sin(angle) * speed
+        self.life[start:end] = life
+        self.max_life[start:end] = life
+        self.initial_size[start:end] = rng.uniform(*size_range, n)
+        self.size[start:end] = self.initial_size[start:end]
+        self.gravity[start:end] = gravity
+        self.color[start:end] = color[:3]
+        self.count = end
+
+    def _compact(self):
+        """Drops dead particles, keeping live ones packed at the front."""
+        n = self.count
+        alive = self.life[:n] > 0
+        live_count = int(np.count_nonzero(alive))
+        if live_count == n: return
+        for arr in (self.pos, self.vel, self.life, self.max_life, self.initial_size, self.size, self.gravity, self.color):
+            arr[:live_count] = arr[:n][alive]
+        self.count = live_count
 
     def update(self, dt):
-        self.life -= dt
-        self.vel[1] += self.gravity
-        self.pos[0] += self.vel[0] * dt * s.FPS # Use FPS from settings
-        self.pos[1] += self.vel[1] * dt * s.FPS
-        self.size = self.initial_size * max(0, self.life / self.max_life) # Linear shrink
-
-    def draw(self, surface):
-        if self.life > 0 and self.size >= 1:
-            scale = utils.get_perspective_scale(self.pos[1]) # Use utils function
-            current_size = max(1, self.size * scale)
-            radius = int(current_size / 2)
-            if radius < 1: return
-
-            alpha = int(150 * (self.life / self.max_life)**0.5) # Fade alpha non-linearly
-            color = (*self.color[:3], max(0, min(255,alpha)))
-
-            try:
-                temp_surf = pygame.Surface((radius*2, radius*2), pygame.SRCALPHA)
-                pygame.draw.circle(temp_surf, color, (radius, radius), radius)
-                # Use additive blending for glow effect
-                surface.blit(temp_surf, (int(self.pos[0] - radius), int(self.pos[1] - radius)), special_flags=pygame.BLEND_RGBA_ADD)
-            except pygame.error:
-                 pass # Ignore if surface size invalid
\ No newline at end of file
+        self._compact() # Filter out dead particles before updating the rest
+        n = self.count
+        if not n: return
+        self.life[:n] -= dt
+        self.vel[:n, 1] += self.gravity[:n]
+        self.pos[:n] += self.vel[:n] * (dt * s.FPS) # Use FPS from settings
+        self.size[:n] = self.initial_size[:n] * np.maximum(0, self.life[:n] / self.max_life[:n]) # Linear shrink
+
+    def draw(self, surface, offset=(0, 0)):
+        """Draws the live particles, shifted by the camera `offset`. Returns the rects they touched."""
+        n = self.count
+        if not n: return []
+        life = self.life[:n]
+        visible = (life > 0) & (self.size[:n] >= 1)
+        if not visible.any(): return []
+
+        pos = self.pos[:n][visible] - offset
+        life_frac = life[visible] / self.max_life[:n][visible]
+        scale = utils.perspective_scales(pos[:, 1])
+        radius = (np.maximum(1, self.size[:n][visible] * scale) / 2).astype(int)
+        # Fade alpha non-linearly; quantized so the sprite cache sees a bounded set of looks
+        alpha = np.clip((150 * np.sqrt(life_frac)).astype(int) // 5 * 5, 0, 255)
+        dest_x = (pos[:, 0] - radius).astype(int)
+        dest_y = (pos[:, 1] - radius).astype(int)
+
+        blend = pygame.BLEND_RGBA_ADD # Additive blending for glow effect
+        blit_sequence = [
+            (get_glow(r, (cr, cg, cb, a)), (x, y), None, blend)
+            for r, (cr, cg, cb), a, x, y in zip(radius.tolist(), self.color[:n][visible].tolist(),
+                                                alpha.tolist(), dest_x.tolist(), dest_y.tolist())
+            if r >= 1
+        ]
+        return surface.blits(blit_sequence) # Touched rects, for dirty-rect rendering
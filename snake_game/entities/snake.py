@@ -1,10 +1,12 @@
 import pygame
-import random
 import math
+import numpy as np
 from .. import settings as s
 from .. import utils
-# Import Hazard only needed if AI checks specific hazard types beyond collision
-from .hazard import Hazard # If AI needs to know hazard.h_type
+from .. import grid
+from ..graphics.sprite_cache import get_glow, segment_cache
+from .snake_body import SnakeBody
+from ..pathfinding import DIRECTIONS, NodeBudget, bfs_first_step, reachable_area
 
 class Snake:
     def __init__(self, game, is_player=True, start_pos=None, direction=None):
@@ -12,16 +14,20 @@ class Snake:
         self.is_player = is_player
 
         if start_pos is None:
-            start_x = s.GRID_WIDTH // 4 if is_player else s.GRID_WIDTH * 3 // 4
-            start_y = s.GRID_HEIGHT // 2
+            start_x = s.WORLD_GRID_WIDTH // 4 if is_player else s.WORLD_GRID_WIDTH * 3 // 4
+            start_y = s.WORLD_GRID_HEIGHT // 2
             start_pos = (start_x, start_y)
         self.start_pos = start_pos # Store initial start position
+        self.grid_kind = grid.PLAYER if is_player else grid.COMPETITOR # Occupancy layer for this snake
 
         if direction is None:
-            direction = random.choice([(0, 1), (0, -1), (1, 0), (-1, 0)])
+            direction = game.rng.choice([(0, 1), (0, -1), (1, 0), (-1, 0)])
 
-        self.grid_pos = [start_pos]
+        self.body = SnakeBody(game.grid, self.grid_kind) # Deque + multiset, mirrored into the grid
+        self.body.reset(start_pos)
+        game.snake_heads[start_pos] = self
         self.visual_pos = [utils.grid_to_screen(start_pos)] * s.SNAKE_START_LEN
+        self.prev_visual_pos = list(self.visual_pos) # Visual positions as of the previous tick (render interpolation)
         self.direction = direction
         self.next_direction = self.direction
         self.length = s.SNAKE_START_LEN
@@ -29,8 +35,12 @@ class Snake:
         self.speed = s.SNAKE_SPEED_BASE if is_player else s.COMPETITOR_SPEED_BASE
         self.grow_pending = 0
         self.alive = True
-        self.pulse_timer = random.random() * 2 * math.pi
+        self.pulse_timer = game.fx_rng.random() * 2 * math.pi
         self.pulse_intensity = 0
+        self.ai_nodes_used = 0 # Nodes expanded by the last pathfinding decision
+        self.policy = None # Optional policy(snake) steering the player on each step (batch runs); kept across resets
+        self._gradient_len = 0 # Body color gradient, cached per length (see _body_gradient)
+        self._gradient = []
 
         # Assign colors and power-up states based on type
         if is_player:
@@ -50,16 +60,18 @@ class Snake:
             self.powerup_timers = {} # AI doesn't use player powerups
 
     def reset(self):
-        """Resets the snake to its starting state."""
-        self.grid_pos = [self.start_pos]
+        """Resets the snake to its starting state. Expects the occupancy grid and head index to be cleared first."""
+        self.body.reset(self.start_pos)
+        self.game.snake_heads[self.start_pos] = self
         self.visual_pos = [utils.grid_to_screen(self.start_pos)] * s.SNAKE_START_LEN
-        self.direction = random.choice([(0, 1), (0, -1), (1, 0), (-1, 0)]) # New random direction
+        self.prev_visual_pos = list(self.visual_pos) # Don't interpolate from the last game's body
+        self.direction = self.game.rng.choice([(0, 1), (0, -1), (1, 0), (-1, 0)]) # New random direction
         self.next_direction = self.direction
         self.length = s.SNAKE_START_LEN
         self.timer = 0
         self.grow_pending = 0
         self.alive = True
-        self.pulse_timer = random.random() * 2 * math.pi # Reset pulse phase
+        self.pulse_timer = self.game.fx_rng.random() * 2 * math.pi # Reset pulse phase
         # Reset player-specific powerups
         if self.is_player:
              self.phase_active = False; self.magnet_active = False
@@ -67,6 +79,21 @@ class Snake:
              self.powerup_timers = {'phase': 0, 'magnet': 0, 'multiplier': 0, 'burst': 0}
 
 
+    @property
+    def grid_pos(self):
+        """Read-only sequence view of the body cells, head first."""
+        return self.body
+
+
+    def die(self):
+        """Kills the snake and frees its cells in the occupancy grid and head index."""
+        if not self.alive: return
+        self.alive = False
+        self.body.release()
+        if self.game.snake_heads.get(self.body.head) is self:
+            del self.game.snake_heads[self.body.head]
+
+
     def change_direction(self, new_direction):
         """Requests a change in direction for the next grid step."""
         # Prevent immediate 180 degree turns for both player and AI
@@ -77,16 +104,66 @@ class Snake:
 
 
     def update_ai(self):
-        """AI logic to determine the competitor's next move."""
-        if self.is_player or not self.alive: 
-            return # Only run for living AI
+        """AI logic to determine the next move (the competitor's, or an AI-driven player's)."""
+        if not self.alive:
+            return # Only run for living snakes
+        if s.AI_MODE == "pathfinding":
+            self._update_ai_pathfinding()
+        else:
+            self._update_ai_greedy()
+
+
+    def _update_ai_pathfinding(self):
+        """Steers along a BFS shortest path to the nearest food, avoiding pockets smaller than the body.
+
+        Snakes and bombs are obstacles. Falls back to the move with the most reachable
+        space. Total work is capped by AI_NODE_BUDGET expanded nodes per decision.
+        """
+        occupancy = self.game.grid
+        is_blocked = occupancy.blocks_movement
+        budget = NodeBudget(s.AI_NODE_BUDGET)
+        head = self.body.head
+        moves = [d for d in DIRECTIONS if not (d[0] == -self.direction[0] and d[1] == -self.direction[1])]
+        space_needed = self.length + 1 # Room for the whole body plus the next step
+        target = self.game.food.nearest(head) if self.game.food else None
+        target_pos = target.grid_pos if target else None
+
+        # --- Shortest path to food, if it doesn't lead into a dead end ---
+        if target_pos:
+            step, _ = bfs_first_step(head, target_pos, is_blocked, budget, moves)
+            if step is not None:
+                next_pos = (head[0] + step[0], head[1] + step[1])
+                if reachable_area(next_pos, is_blocked, space_needed, budget) >= space_needed:
+                    self.change_direction(step)
+                    self.ai_nodes_used = budget.used
+                    return
+
+        # --- Fallback: most open space, then closest to food, then keep heading ---
+        best_key, best_move = None, None
+        for d in moves:
+            next_pos = (head[0] + d[0], head[1] + d[1])
+            if is_blocked(next_pos): continue
+            area = reachable_area(next_pos, is_blocked, space_needed, budget)
+            dist = abs(next_pos[0] - target_pos[0]) + abs(next_pos[1] - target_pos[1]) if target_pos else 0
+            key = (area, -dist, d == self.direction)
+            if best_key is None or key > best_key:
+                best_key, best_move = key, d
+        if best_move: self.change_direction(best_move)
+        # Otherwise trapped: keep current direction
+        self.ai_nodes_used = budget.used
+
+
+    def _update_ai_greedy(self):
+        """Picks the safe neighbour closest to the nearest food by Manhattan distance."""
         target_pos = None
-        # Prioritize food
+        # Prioritize the nearest food
         if self.game.food:
-            target_pos = self.game.food.grid_pos
+            target = self.game.food.nearest(self.body.head)
+            if target: target_pos = target.grid_pos
         # Could add logic to target powerups or flee player later
 
         head_x, head_y = self.grid_pos[0]
+        occupancy = self.game.grid
         possible_moves = []
 
         # --- Evaluate Potential Moves ---
@@ -100,22 +177,16 @@ class Snake:
 
             # --- Check Obstacles ---
             # Walls
-            if not (0 <= next_pos[0] < s.GRID_WIDTH and 0 <= next_pos[1] < s.GRID_HEIGHT):
+            if not occupancy.in_bounds(next_pos):
                 continue
-            # Self
-            if next_pos in self.grid_pos[1:]:
+            # Self (next_pos is never the current head, so any hit is body)
+            if next_pos in self.body:
                 continue
-             # Player Snake Body/Head
-            if self.game.player_snake and self.game.player_snake.alive and next_pos in self.game.player_snake.grid_pos:
+             # Other Snakes' Bodies/Heads (dead snakes are not in the grid)
+            if occupancy.has(grid.PLAYER, next_pos) or occupancy.has(grid.COMPETITOR, next_pos):
                 continue
-            # Hazards (Bombs)
-            is_on_hazard = False
-            for hazard in self.game.hazards:
-                 # Only need to check collision for bomb type now
-                if hazard.h_type == 'bomb' and hazard.collides_with(next_pos):
-                     is_on_hazard = True
-                     break
-            if is_on_hazard:
+            # Hazards (only bombs are spawned)
+            if occupancy.has(grid.HAZARD, next_pos):
                 continue
 
             # Calculate distance to target (if exists)
@@ -154,10 +225,6 @@ class Snake:
         """Updates the snake's state (movement, collisions, etc.)."""
         if not self.alive: return
 
-        # AI determines its next move before the timer check
-        if not self.is_player:
-            self.update_ai()
-
         # Adjust timer based on game speed multiplier (only affects player for now)
         effective_dt = dt * self.game.effective_speed_multiplier if self.is_player else dt
         self.timer += effective_dt
@@ -175,8 +242,15 @@ class Snake:
         self.pulse_intensity = (math.sin(self.pulse_timer) + 1) / 2
 
         # --- Logical Movement (Grid Update) ---
-        if self.timer >= 1.0 / self.speed:
-            self.timer = 0 # Reset timer
+        step_interval = 1.0 / self.speed
+        while self.timer >= step_interval: # Several steps per tick if the step rate outruns SIMULATION_HZ
+            self.timer -= step_interval # Keep the remainder so the step rate doesn't depend on the tick rate
+
+            # AI only needs to decide when a step is actually taken
+            if not self.is_player:
+                self.update_ai()
+            elif self.policy:
+                self.policy(self) # Scripted or AI-driven player
 
             # Apply burst if active (Player only)
             burst_steps = 1
@@ -188,61 +262,56 @@ class Snake:
                 if not self.alive: break # Stop if died mid-burst
 
                 self.direction = self.next_direction
-                current_head_pos = self.grid_pos[0]
+                current_head_pos = self.body.head
                 new_head_pos = (current_head_pos[0] + self.direction[0],
                                 current_head_pos[1] + self.direction[1])
 
                 # --- Collision Detection ---
                 # Wall Collision
-                if not (0 <= new_head_pos[0] < s.GRID_WIDTH and 0 <= new_head_pos[1] < s.GRID_HEIGHT):
-                    self.alive = False
-                    if not self.is_player: print(f"DEBUG: AI snake hit wall. Coords={new_head_pos}. Returning NOW.")
+                occupancy = self.game.grid
+                if not occupancy.in_bounds(new_head_pos):
+                    self.die()
                     if self.is_player: self.game.trigger_game_over("wall")
                     return # Stop processing movement
 
                 # Self Collision (Check phase powerup for player)
                 can_phase = self.is_player and self.phase_active
-                if not can_phase and new_head_pos in self.grid_pos[1:]:
-                    self.alive = False
+                if not can_phase and new_head_pos in self.body: # O(1) multiset lookup
+                    self.die()
                     if self.is_player: self.game.trigger_game_over("self")
                     return
 
-                # Hazard Collision (Bombs only)
-                for hazard in self.game.hazards:
-                    # Only need to check collision for bomb type now
-                    if hazard.h_type == 'bomb' and hazard.collides_with(new_head_pos):
-                         self.alive = False
-                         if self.is_player: self.game.trigger_game_over("hazard: bomb")
-                         return
+                # Hazard Collision (only bombs are spawned)
+                if occupancy.has(grid.HAZARD, new_head_pos):
+                     self.die()
+                     if self.is_player: self.game.trigger_game_over("hazard: bomb")
+                     return
 
                 # --- Snake vs Snake Collision ---
-                # Determine the other snake
-                other_snake = None
-                if self.is_player:
-                    other_snake = self.game.competitor_snake
-                else: # If this is the competitor
-                    other_snake = self.game.player_snake
-
-                if other_snake and other_snake.alive:
+                # Heads are indexed by cell and bodies live in the occupancy grid, so these
+                # checks cost the same however many snakes are on the board
+                other_snake = self.game.snake_heads.get(new_head_pos)
+                if other_snake is not None:
                      # Head-on collision
-                     if new_head_pos == other_snake.grid_pos[0]:
-                          self.alive = False
-                          other_snake.alive = False # Both die
-                          # Trigger game over based on who initiated check (player always gets priority message)
-                          if self.is_player: self.game.trigger_game_over("head-on collision")
-                          # If AI check caused it, player still lost
-                          else: self.game.trigger_game_over("head-on collision")
-                          return
-                     # Collision with other snake's body
-                     elif new_head_pos in other_snake.grid_pos[1:]: # Check body only, head checked above
-                          self.alive = False
-                          if self.is_player: self.game.trigger_game_over("collision with competitor")
-                          # No game over if AI hits player's body, AI just dies
-                          return
+                     self.die()
+                     other_snake.die() # Both die
+                     # The player losing their snake ends the game, whoever moved into whom
+                     if self.is_player or other_snake.is_player: self.game.trigger_game_over("head-on collision")
+                     return
+                # Collision with another snake's body (the cell's snake occupants minus this snake's own)
+                snake_cells = occupancy.count(grid.PLAYER, new_head_pos) + occupancy.count(grid.COMPETITOR, new_head_pos)
+                if snake_cells > self.body.count(new_head_pos):
+                     self.die()
+                     if self.is_player: self.game.trigger_game_over("collision with competitor")
+                     # No game over if an AI hits another snake's body, it just dies
+                     return
 
 
                 # --- Update Snake Position ---
-                self.grid_pos.insert(0, new_head_pos) # Add new head position
+                heads = self.game.snake_heads
+                if heads.get(current_head_pos) is self: del heads[current_head_pos]
+                heads[new_head_pos] = self
+                self.body.push_head(new_head_pos) # Add new head position (O(1), updates the grid)
 
                 # --- Grow or Move Tail ---
                 if self.grow_pending > 0:
@@ -251,11 +320,13 @@ class Snake:
                     self.visual_pos.append(self.visual_pos[-1])
                 else:
                     # Remove tail grid position only if not growing
-                    if len(self.grid_pos) > self.length: # Safety check
-                         self.grid_pos.pop()
+                    if len(self.body) > self.length: # Safety check
+                         self.body.pop_tail()
                     # Visual tail removal handled by interpolation list adjustment
 
         # --- Visual Movement (Interpolation) ---
+        if not self.game.tracks_visuals: return # Headless simulation has nothing to draw
+
         target_visual_pos = [utils.grid_to_screen(p) for p in self.grid_pos]
 
         # Ensure visual_pos list has the correct length
@@ -265,7 +336,7 @@ class Snake:
              self.visual_pos.pop() # Remove if shrunk (shouldn't happen normally)
 
         # Interpolate each segment's visual position
-        interp_factor = min(1.0, s.INTERPOLATION_SPEED * dt * s.FPS) # Clamp interpolation
+        interp_factor = min(1.0, s.INTERPOLATION_SPEED * dt * s.SIMULATION_HZ) # Clamp interpolation
         for i in range(len(self.visual_pos)):
              current_x, current_y = self.visual_pos[i]
              target_x, target_y = target_visual_pos[i]
@@ -302,48 +373,71 @@ class Snake:
             if p_type == 'burst': self.burst_active = False
 
 
-    def draw(self, surface):
-        """Draws the snake on the given surface."""
-        if not self.alive or not self.visual_pos: return # Don't draw dead or empty snakes
+    def snapshot_visuals(self):
+        """Remembers this tick's visual positions so frames between ticks can interpolate from them."""
+        self.prev_visual_pos = list(self.visual_pos)
 
-        num_segments = len(self.visual_pos)
+    def screen_points(self):
+        """Segment screen positions (head first) handed to the projection stage; none once dead."""
+        return self.visual_pos if self.alive else ()
 
-        # --- Draw Body Segments ---
-        for i in range(num_segments - 1, 0, -1): # Draw tail first for overlap
-            pos = self.visual_pos[i]
-            scale = utils.get_perspective_scale(pos[1])
-            segment_size = int(s.GRID_SIZE * 0.8 * scale)
-            if segment_size < 1: continue
-
-            t = i / max(1, num_segments - 1) # Normalized position in body
-            # Interpolate color
-            color_r = utils.lerp(self.body_color_start[0], self.body_color_end[0], t)
-            color_g = utils.lerp(self.body_color_start[1], self.body_color_end[1], t)
-            color_b = utils.lerp(self.body_color_start[2], self.body_color_end[2], t)
-            segment_color = (int(color_r), int(color_g), int(color_b))
-
-            # Calculate radii using perspective scale
-            pulse_rad_add = int(self.pulse_intensity * s.GRID_SIZE * 0.1 * scale)
-            glow_radius = max(1, (segment_size // 2) + pulse_rad_add + int(3*scale)) # Body glow radius
-            base_radius = max(1, segment_size // 2 + int(self.pulse_intensity * s.GRID_SIZE * 0.05 * scale))
-
-            glow_color = (*segment_color, 60) # Faint body glow
+    def previous_screen_points(self):
+        """Segment screen positions as of the previous tick."""
+        return self.prev_visual_pos if self.alive else ()
 
+    def _body_gradient(self, num_segments):
+        """Per-segment body colors (index 0 = head), recomputed only when the length changes."""
+        if num_segments != self._gradient_len:
+            t = np.arange(num_segments) / max(1, num_segments - 1) # Normalized position in body
+            colors = utils.lerp(np.array(self.body_color_start, dtype=float),
+                                np.array(self.body_color_end, dtype=float), t[:, None])
+            self._gradient = [tuple(color) for color in colors.astype(int).tolist()]
+            self._gradient_len = num_segments
+        return self._gradient
+
+    def draw(self, surface, points, scales):
+        """Draws the snake from its projected segment points (head first). Returns the screen rects it touched."""
+        num_segments = len(points)
+        rects = []
+
+        # --- Draw Body Segments ---
+        # Radii are computed for the whole body at once; each segment is one cached
+        # glow+circle sprite, and the body goes out tail first (for overlap) in one blits call
+        if num_segments > 1:
+            body = slice(num_segments - 1, 0, -1)
+            body_scales = scales[body]
+            segment_size = (s.GRID_SIZE * 0.8 * body_scales).astype(int)
+            pulse_rad_add = (self.pulse_intensity * s.GRID_SIZE * 0.1 * body_scales).astype(int)
+            glow_radius = np.maximum(1, segment_size // 2 + pulse_rad_add + (3 * body_scales).astype(int)) # Body glow radius
+            base_radius = np.maximum(1, segment_size // 2 + (self.pulse_intensity * s.GRID_SIZE * 0.05 * body_scales).astype(int))
+            dest = points[body] - glow_radius[:, None]
+            # Segments off the screen (in a world larger than it) are culled before the blit loop
+            width, height = surface.get_size()
+            extent = 2 * glow_radius
+            shown = (segment_size >= 1) & (dest[:, 0] < width) & (dest[:, 1] < height) \
+                  & (dest[:, 0] + extent > 0) & (dest[:, 1] + extent > 0)
+            indices = np.arange(num_segments - 1, 0, -1)[shown]
+
+            colors = self._body_gradient(num_segments)
+            sprites = {} # This frame's lookups; neighbouring segments mostly share a look
+            blit_sequence = []
+            for i, glow_r, base_r, pos in zip(indices.tolist(), glow_radius[shown].tolist(),
+                                              base_radius[shown].tolist(), dest[shown].tolist()):
+                key = (glow_r, base_r, colors[i])
+                sprite = sprites.get(key)
+                if sprite is None:
+                    sprite = sprites[key] = segment_cache.get_segment(glow_r, base_r, colors[i], 60) # Faint body glow
+                blit_sequence.append((sprite, pos))
             try:
-                # Draw glow (outer transparent circle)
-                temp_surf_glow = pygame.Surface((glow_radius*2, glow_radius*2), pygame.SRCALPHA)
-                pygame.draw.circle(temp_surf_glow, glow_color, (glow_radius, glow_radius), glow_radius)
-                surface.blit(temp_surf_glow, (pos[0] - glow_radius, pos[1] - glow_radius))
-                # Draw main segment
-                pygame.draw.circle(surface, segment_color, (int(pos[0]), int(pos[1])), base_radius)
+                rects += surface.blits(blit_sequence)
             except pygame.error: pass
 
 
         # --- Draw Head ---
-        head_pos = self.visual_pos[0]
-        head_scale = utils.get_perspective_scale(head_pos[1])
+        head_pos = points[0].tolist()
+        head_scale = scales.item(0)
         head_size = int(s.GRID_SIZE * 0.9 * head_scale)
-        if head_size < 1: return # Skip drawing if too small
+        if head_size < 1: return rects # Skip drawing if too small
 
         pulse_rad_add_head = int(self.pulse_intensity * s.GRID_SIZE * 0.15 * head_scale)
         # --- Adjusted head glow radius calculation ---
@@ -360,12 +454,10 @@ class Snake:
 
         try:
             # Draw Head Glow (Halo)
-            temp_surf_head_glow = pygame.Surface((head_glow_radius*2, head_glow_radius*2), pygame.SRCALPHA)
-            pygame.draw.circle(temp_surf_head_glow, head_glow_color, (head_glow_radius, head_glow_radius), head_glow_radius)
-            surface.blit(temp_surf_head_glow, (head_pos[0] - head_glow_radius, head_pos[1] - head_glow_radius))
+            rects.append(surface.blit(get_glow(head_glow_radius, head_glow_color), (head_pos[0] - head_glow_radius, head_pos[1] - head_glow_radius)))
 
             # Draw Head Base
-            pygame.draw.circle(surface, self.head_color, (int(head_pos[0]), int(head_pos[1])), head_base_radius)
+            rects.append(pygame.draw.circle(surface, self.head_color, (int(head_pos[0]), int(head_pos[1])), head_base_radius))
 
             # Draw Head Light Effect (Optional - currently commented out)
             # if self.is_player:
@@ -379,4 +471,5 @@ class Snake:
             #        surface.blit(gradient_surf, (head_pos[0] - center, head_pos[1] - center), special_flags=pygame.BLEND_RGBA_ADD)
 
         except pygame.error:
-            pass # Ignore drawing errors if size is invalid
\ No newline at end of file
+            pass # Ignore drawing errors if size is invalid
+        return rects
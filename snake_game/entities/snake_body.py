@@ -0,0 +1,70 @@
+from collections import deque, Counter
+from collections.abc import Sequence
+from itertools import islice
+
+class SnakeBody(Sequence):
+    """A snake's grid cells, head first, as a deque paired with a cell-count multiset.
+
+    Head push, tail pop and "is this cell in my body" are all O(1), however long the
+    snake is. The class is a read-only Sequence for callers (AI, renderer, spawns);
+    only the owning Snake mutates it, and every mutation is mirrored into the shared
+    occupancy grid under the snake's kind.
+    """
+    def __init__(self, grid, kind):
+        self.grid = grid
+        self.kind = kind
+        self._cells = deque()
+        self._counts = Counter() # Multiset: a phasing snake can occupy a cell twice
+
+    def reset(self, start_pos):
+        """Replaces the body with a single cell. Expects the grid to be cleared first."""
+        self._cells.clear()
+        self._counts.clear()
+        self.push_head(start_pos)
+
+    def push_head(self, pos):
+        self._cells.appendleft(pos)
+        self._counts[pos] += 1
+        self.grid.add(self.kind, pos)
+
+    def pop_tail(self):
+        pos = self._cells.pop()
+        remaining = self._counts[pos] - 1
+        if remaining: self._counts[pos] = remaining
+        else: del self._counts[pos]
+        self.grid.remove(self.kind, pos)
+        return pos
+
+    def release(self):
+        """Removes every cell from the occupancy grid (on death). The cells stay readable."""
+        for pos in self._cells:
+            self.grid.remove(self.kind, pos)
+
+    @property
+    def head(self):
+        return self._cells[0]
+
+    def count(self, pos):
+        return self._counts.get(pos, 0)
+
+    def __contains__(self, pos):
+        return pos in self._counts
+
+    def __len__(self):
+        return len(self._cells)
+
+    def __iter__(self):
+        return iter(self._cells)
+
+    def __reversed__(self):
+        return reversed(self._cells)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self._cells))
+            if step < 0: return list(self._cells)[index]
+            return list(islice(self._cells, start, stop, step))
+        return self._cells[index]
+
+    def __repr__(self):
+        return f"SnakeBody({list(self._cells)!r})"
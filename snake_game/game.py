@@ -1,100 +1,115 @@
 import pygame
-import random
-import math
 import json
+import numpy as np
 from os import path, makedirs # Import makedirs to create data directory
 
 # Import settings and utilities
 from . import settings as s
 from . import utils
+from . import grid
 
-# Import entity classes using relative paths
-from .entities.snake import Snake
-from .entities.food import Food
-from .entities.powerup import PowerUp
-from .entities.hazard import Hazard
-from .entities.particle import Particle
+# Import the headless rules engine and entity classes using relative paths
+from .simulation import SimulationCore
+from .replay import ReplayRecorder
+from .profiler import FrameProfiler
+from .startup import StartupReport, AssetLoader
+from .entities.particle import ParticleSystem
 
 # Import graphics components
 from .graphics.background import Background
-from .graphics.ui import draw_player_hud, draw_menu_screen, draw_game_over_screen # Import specific UI functions
-
-class Game:
-    def __init__(self):
-        """Initializes Pygame, game state, and loads resources."""
+from .graphics.ui import draw_player_hud, draw_menu_screen, draw_game_over_screen, install_fonts # Import specific UI functions
+from .graphics.sprite_cache import glow_cache
+from .graphics.dirty_rects import DirtyRectTracker
+from .graphics.compositor import Compositor
+from .graphics.camera import Camera
+from .graphics.projection import project_drawables
+
+class Game(SimulationCore):
+    """Renderer and input shell over the headless SimulationCore."""
+    tracks_visuals = True # Keep interpolated visual positions up to date for drawing
+
+    def __init__(self, seed=None, started=None):
+        """Initializes Pygame and game state, and starts loading assets in the background.
+
+        `seed` makes the run reproducible. `started` is the perf_counter() reading taken
+        when the process began importing, so the startup report can include import time.
+        """
+        self.startup = StartupReport(started)
+        if started is not None: self.startup.add("imports", self.startup.elapsed())
+        with self.startup.stage("rules"):
+            super().__init__(seed)
+        # Only the modules the first frame needs; the mixer opens on the loader thread
+        with self.startup.stage("display init"):
+            pygame.display.init()
+            self.screen = pygame.display.set_mode((s.WIDTH, s.HEIGHT))
+            pygame.display.set_caption("Bio-luminescent Snake Battle")
+        with self.startup.stage("font init"):
+            pygame.font.init()
         pygame.mixer.pre_init(44100, -16, 2, 512) # Optimize buffer for less sound delay
-        pygame.init()
-        pygame.mixer.init()
-        self.screen = pygame.display.set_mode((s.WIDTH, s.HEIGHT))
-        pygame.display.set_caption("Bio-luminescent Snake Battle")
+        self.sound = None # SoundManager, handed over once the asset loader is ready
+        self.assets = AssetLoader(self.startup).start()
+        self.assets_applied = False
         self.clock = pygame.time.Clock()
         self.running = True
-        self.game_state = "MENU" # MENU, PLAYING, GAME_OVER
-
-        # Game elements
-        self.player_snake = None
-        self.competitor_snake = None
-        self.food = None
-        self.particles = []
-        self.powerups = []
-        self.hazards = []
-
-        # Scoring and state
-        self.score = 0
-        self.high_score = self.load_highscore()
-        self.combo_count = 0
-        self.last_eat_time = 0
-        self.combo_timer = 0
-        self.frenzy_active = False
-        self.frenzy_timer = 0
-        self.effective_speed_multiplier = 1.0 # For player speed mods
+        self.profiler = FrameProfiler() # Per-phase timings, F3 overlay, optional CSV dump
+
+        # Fixed-timestep clock: rules run in ticks of tick_dt, frames draw between the last two
+        self.tick_dt = 1.0 / s.SIMULATION_HZ
+        self.sim_accumulator = 0.0 # Frame time not yet simulated
+        self.render_alpha = 1.0 # How far past the last tick this frame is drawn (0..1)
+        self.dropped_ticks = 0 # Ticks discarded by the catch-up cap
+
+        # Visual-only game elements
+        with self.startup.stage("effects, scores"):
+            self.particles = ParticleSystem() # Batched NumPy particle pool (reseeded per game)
+            self.high_score = self.load_highscore()
+            if s.RECORD_REPLAYS:
+                self.recorder = ReplayRecorder()
 
         # Effects
         self.screen_shake_timer = 0
         self.screen_shake_intensity = 4
 
         # Graphics components
-        self.background = Background()
-        self._prepare_border_surface() # Create border overlay
-
-        # Load sounds (placeholders - replace paths in settings.py)
-        self.sounds = self._load_sounds()
-        if self.sounds.get("ambient"):
-            self.sounds["ambient"].play(loops=-1)
-            self.sounds["ambient"].set_volume(0.3)
+        with self.startup.stage("graphics"):
+            self.background = Background(rng=np.random.default_rng(seed))
+            self._prepare_border_surface() # Create border overlay
+            self.compositor = Compositor(self.screen) # Persistent scene layer for shake offsets
+            self.camera = Camera(world_cells=(self.grid.width, self.grid.height)) # Follows the player in large worlds
+            self.dirty_rects = DirtyRectTracker() if s.DIRTY_RECTS else None # Optional partial redraw mode
+
+
+    def poll_assets(self):
+        """Takes over the background-loaded sounds, fonts and sprites once they are ready (cheap to call every frame)."""
+        if self.assets_applied or not self.assets.ready.is_set(): return
+        self.assets_applied = True
+        # The loader built these privately; merging here keeps the shared caches main-thread only
+        if self.assets.fonts: install_fonts(self.assets.fonts)
+        if self.assets.food_sprites is not None: glow_cache.merge(self.assets.food_sprites)
+        # Sounds are placeholders - set their paths in settings.py
+        self.sound = self.assets.sound_manager
+        if self.sound: self.sound.start_music()
 
 
     def _prepare_border_surface(self):
-        """Creates the reusable transparent border surface."""
+        """Creates the reusable border fill and the world-edge strips it is drawn into."""
         self.border_surface = pygame.Surface((s.WIDTH, s.HEIGHT), pygame.SRCALPHA)
-        self.border_surface.fill((0,0,0,0)) # Fully transparent
-        pygame.draw.rect(self.border_surface, s.BORDER_COLOR, (0, 0, s.WIDTH, s.HEIGHT), s.BORDER_THICKNESS)
-
-    def _load_sounds(self):
-        """Loads sound files specified in settings. Returns a dictionary."""
-        sounds = {}
-        sound_paths = { # Define sounds to load here
-            "eat": getattr(s, 'SOUND_EAT_PATH', None),
-            "powerup": getattr(s, 'SOUND_POWERUP_PATH', None),
-            "gameover": getattr(s, 'SOUND_GAMEOVER_PATH', None),
-            "ambient": getattr(s, 'SOUND_AMBIENT_PATH', None),
-            # Add combo sounds if defined in settings
-            **{f"combo_{i}": getattr(s, f'SOUND_COMBO_{i}_PATH', None) for i in range(1, 6)}
-        }
-        for name, file_path in sound_paths.items():
-            if file_path and path.exists(file_path):
-                try:
-                    sounds[name] = pygame.mixer.Sound(file_path)
-                except pygame.error as e:
-                    print(f"Warning: Could not load sound '{file_path}': {e}")
-            # elif file_path: # Only print warning if path was set but not found
-                 # print(f"Warning: Sound file not found: '{file_path}'")
-        return sounds
+        self.border_surface.fill(s.BORDER_COLOR) # Strips blit the part of this they need
+        # World-edge strips (world pixels) covering the border; only these are blitted (and cleared in dirty-rect mode)
+        t = s.BORDER_THICKNESS
+        width, height = self.grid.width * s.GRID_SIZE, self.grid.height * s.GRID_SIZE
+        self.border_strips = [pygame.Rect(0, 0, width, t), pygame.Rect(0, height - t, width, t),
+                              pygame.Rect(0, t, t, height - 2 * t), pygame.Rect(width - t, t, t, height - 2 * t)]
+
+    def _border_rects(self):
+        """The border strips' on-screen parts this frame."""
+        screen_rect = self.screen.get_rect()
+        clipped = (self.camera.to_screen(strip).clip(screen_rect) for strip in self.border_strips)
+        return [rect for rect in clipped if rect]
 
     def _play_sound(self, name):
-        """Plays a sound from the loaded sounds dictionary if it exists."""
-        if name in self.sounds:
-            self.sounds[name].play()
+        """Plays a loaded sound through the SoundManager's channel pool (skipped until it is ready)."""
+        if self.sound: self.sound.play(name)
 
     def load_highscore(self):
         """Loads the high score from the JSON file."""
@@ -133,82 +148,83 @@ class Game:
         except IOError:
             print(f"Warning: Could not save highscore to file: {s.HIGHSCORE_FILE}")
 
-    def start_new_game(self):
+    def start_new_game(self, seed=None):
         """Resets the game state for a new round."""
-        self.score = 0
-        # Create or reset snakes
-        if self.player_snake is None:
-             self.player_snake = Snake(self, is_player=True)
-        else:
-             self.player_snake.reset()
-
-        if self.competitor_snake is None:
-             self.competitor_snake = Snake(self, is_player=False)
-        else:
-             self.competitor_snake.reset()
-
-        # Clear lists and reset state variables
+        super().start_new_game(seed)
         self.particles.clear()
-        self.powerups.clear()
-        self.hazards.clear()
-        self.combo_count = 0
-        self.last_eat_time = 0
-        self.frenzy_active = False
-        self.frenzy_timer = 0
-        self.effective_speed_multiplier = 1.0
+        self.particles.rng = np.random.default_rng(self.fx_rng.getrandbits(64)) # Cosmetic stream
         self.screen_shake_timer = 0
-
-        # Create initial food item *after* resetting snakes
-        self.food = Food(self)
-
-        self.game_state = "PLAYING"
+        self.sim_accumulator = 0.0
 
 
     def trigger_game_over(self, reason="unknown"):
         """Transitions the game to the Game Over state."""
-        if self.game_state == "PLAYING": # Prevent multiple triggers
-            self.game_state = "GAME_OVER"
+        if super().trigger_game_over(reason): # Prevent multiple triggers
             self._play_sound("gameover")
-            is_new_highscore = False
-            if self.score > self.high_score:
-                self.high_score = self.score
+            if self.is_new_highscore:
                 self.save_highscore()
-                is_new_highscore = True # Flag for UI drawing
             self.screen_shake_timer = 0.5 # Trigger screen shake
             self.screen_shake_intensity = 8
             print(f"Game Over! Reason: {reason}, Score: {self.score}")
-            # Store reason or new highscore flag if needed for drawing
-            self.game_over_reason = reason
-            self.is_new_highscore = is_new_highscore
+            if self.recorder:
+                try:
+                    self.recorder.save(s.REPLAY_FILE, self)
+                except IOError:
+                    print(f"Warning: Could not save replay to file: {s.REPLAY_FILE}")
 
 
     def spawn_particles(self, pos, count, color):
         """Spawns a number of particles at a given position."""
-        for _ in range(count):
-            self.particles.append(Particle(pos, color, life=random.uniform(0.5, 1.2)))
+        self.particles.emit(pos, count * s.PARTICLE_COUNT_MULTIPLIER, color, life_range=(0.5, 1.2))
 
 
     def run(self):
         """The main game loop."""
         while self.running:
-            # Calculate delta time for frame-independent physics/updates
-            dt = self.clock.tick(s.FPS) / 1000.0
+            # Real time since the last frame; the rules consume it in fixed ticks
+            frame_dt = self.clock.tick(s.FPS) / 1000.0
 
             # Process events, update game state, draw frame
-            self.handle_events()
-            self.update(dt)
-            self.draw()
+            with self.profiler.scope("frame"):
+                with self.profiler.scope("events"):
+                    self.handle_events()
+                    self.poll_assets() # Sounds arrive from the loader thread a few frames in
+                self.step_frame(frame_dt)
+                self.draw()
+            if self.startup.first_frame_at is None: self.startup.first_frame_at = self.startup.elapsed()
+            elif s.STARTUP_REPORT and self.assets_applied and not self.startup.printed: self.startup.print()
+            self.profiler.end_frame(self.frame_counts())
 
         # Clean up Pygame when loop exits
+        self.profiler.stop_csv()
+        self.assets.wait() # Don't shut pygame down under the loader thread
         pygame.quit()
 
 
+    def frame_counts(self):
+        """Entity counts reported alongside each frame's profile."""
+        snakes = [sn for sn in self.snakes if sn.alive]
+        return {
+            "snake_segments": sum(len(sn.body) for sn in snakes),
+            "particles": len(self.particles),
+            "hazards": len(self.hazards),
+            "powerups": len(self.powerups),
+            "food": len(self.food) if self.food else 0,
+            "sprite_cache": glow_cache.size,
+        }
+
+
     def handle_events(self):
         """Processes user input and game events."""
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
+            if event.type == pygame.VIDEOEXPOSE and self.dirty_rects:
+                self.dirty_rects.invalidate() # Window contents were lost, push a full frame
             if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_F3:
+                    self.profiler.toggle_overlay() # Works in every state
+
                 # Handle PLAYING state input
                 if self.game_state == "PLAYING" and self.player_snake and self.player_snake.alive:
                     if event.key in [pygame.K_UP, pygame.K_w]:
@@ -234,257 +250,153 @@ class Game:
                      self.running = False
 
 
-    def update(self, dt):
-        """Updates all game logic and objects."""
-        self.background.update(dt) # Update background animations
+    def step_frame(self, frame_dt):
+        """Advances everything by one rendered frame of `frame_dt` seconds. Returns the ticks run.
 
-        if self.game_state != "PLAYING":
-            return # Don't update game elements if not playing
+        The rules run in fixed ticks of 1/SIMULATION_HZ taken from an accumulator, so snake
+        speed and spawn rolls don't depend on the frame rate. At most MAX_CATCHUP_TICKS run
+        per frame; after a longer stall the backlog is dropped and the game briefly slows
+        down instead of falling further behind. Cosmetic effects advance by the real frame
+        time, and render_alpha records where between the last two ticks to draw.
+        """
+        with self.profiler.scope("background_update"):
+            self.background.update(frame_dt) # Update background animations
 
-        # --- Spawn Hazards & Powerups ---
-        if random.random() < s.HAZARD_SPAWN_CHANCE * (1 + int(self.frenzy_active)):
-             if len(self.hazards) < s.HAZARD_MAX_COUNT:
-                 new_hazard = Hazard(self) # Pass self (game state)
-                 if new_hazard.lifetime > 0: # Check if spawn was successful
-                      self.hazards.append(new_hazard)
-
-        if random.random() < s.POWERUP_SPAWN_CHANCE:
-             if len(self.powerups) < s.POWERUP_MAX_COUNT:
-                 # Pass self (game state) for spawn checks
-                 self.powerups.append(PowerUp(self))
-
-
-        # --- Update Hazard Speed Modifiers & Lifetime ---
-        hazard_speed_modifier = 1.0
-        if self.player_snake and self.player_snake.alive:
-            current_snake_grid_pos = self.player_snake.grid_pos[0]
-            # Note: Mist/Current speed logic remains but these types aren't spawned
-            for hazard in self.hazards:
-                if hazard.collides_with(current_snake_grid_pos):
-                     if hazard.h_type == 'mist': hazard_speed_modifier *= 0.6
-                     elif hazard.h_type == 'current': hazard_speed_modifier *= 1.5
-
-        # Apply speed modifiers (including frenzy) to player snake
-        self.effective_speed_multiplier = hazard_speed_modifier
-        if self.frenzy_active:
-             self.effective_speed_multiplier *= 1.3 # Base frenzy speedup
-
-        # Update hazards and remove expired ones
-        self.hazards = [h for h in self.hazards if h.update(dt)]
-
-
-        # --- Update Frenzy Mode ---
-        if self.frenzy_active:
-            self.frenzy_timer -= dt
-            if self.frenzy_timer <= 0:
-                self.frenzy_active = False
-                # Maybe play a "frenzy end" sound
-            # Spawn extra food during frenzy
-            if random.random() < 0.05: # Chance per frame
-                if self.food: self.food.spawn() # Respawn existing food
-
-
-        # --- Update Snakes ---
-        if self.player_snake: self.player_snake.update(dt)
-        if self.competitor_snake: self.competitor_snake.update(dt)
-
-
-        # --- Check Food Collision ---
-        eater = None
-        if self.food: # Ensure food exists
-            player_head = self.player_snake.grid_pos[0] if self.player_snake and self.player_snake.alive else None
-            competitor_head = self.competitor_snake.grid_pos[0] if self.competitor_snake and self.competitor_snake.alive else None
-            food_pos = self.food.grid_pos
-
-            if player_head == food_pos:
-                 eater = self.player_snake
-            elif competitor_head == food_pos:
-                 eater = self.competitor_snake
-
-            if eater:
-                eater.grow()
-                self.spawn_particles(self.food.visual_pos, 20, s.FOOD_COLOR) # Use settings color
-                self._play_sound("eat") # Play basic eat sound
-
-                # Handle player-specific scoring and combo logic
-                if eater.is_player:
-                    base_score = 10
-                    combo_bonus = self.combo_count * 5
-                    multiplier = 2 if self.player_snake.multiplier_active else 1
-                    self.score += (base_score + combo_bonus) * multiplier
-
-                    # Combo Logic
-                    current_time = pygame.time.get_ticks() / 1000.0
-                    if current_time - self.last_eat_time <= s.COMBO_TIME_LIMIT:
-                        self.combo_count += 1
-                        # Play combo sound based on count (capped)
-                        combo_sound_level = min(self.combo_count, 5) # Max level 5 for sound example
-                        self._play_sound(f"combo_{combo_sound_level}") # Assumes sounds combo_1, combo_2... exist
-                    else:
-                        self.combo_count = 1 # Reset combo but count this eat
-
-                    self.last_eat_time = current_time
-                    self.combo_timer = s.COMBO_TIME_LIMIT # Reset visual timer
-
-                    # Check for Frenzy Trigger
-                    if not self.frenzy_active and self.combo_count >= s.FRENZY_THRESHOLD:
-                        self.frenzy_active = True
-                        self.frenzy_timer = s.FRENZY_DURATION
-                        # Maybe play frenzy start sound
-
-                # Respawn food after eaten
-                self.food.spawn()
-
-
-        # --- Update Combo Timer Decay ---
-        if self.combo_timer > 0:
-             self.combo_timer -= dt
-             if self.combo_timer <= 0:
-                 self.combo_count = 0 # Combo expired
-
-
-        # --- Update Powerups & Check Player Collision/Magnet ---
-        active_powerups = []
-        collected_powerup = False
-        if self.player_snake and self.player_snake.alive:
-            player_head_grid = self.player_snake.grid_pos[0]
-            for powerup in self.powerups:
-                powerup.update(dt) # Update animation state if any
-                if player_head_grid == powerup.grid_pos:
-                    self.player_snake.activate_powerup(powerup.p_type)
-                    self.spawn_particles(powerup.visual_pos, 15, powerup.color)
-                    self._play_sound("powerup")
-                    collected_powerup = True # Flag that one was collected
-                    # Don't add collected powerup back to the list
-                else:
-                    active_powerups.append(powerup) # Keep uncollected ones
-            if collected_powerup:
-                self.powerups = active_powerups # Update list only if something changed
-
-            # --- Update Orb Magnet Effect ---
-            if self.player_snake.magnet_active and self.food:
-                magnet_range_pixels = s.GRID_SIZE * s.MAGNET_RANGE_GRID
-                magnet_radius_sq = magnet_range_pixels**2
-                head_pos = self.player_snake.visual_pos[0]
-                food_pos = list(self.food.visual_pos)
-                dx, dy = head_pos[0] - food_pos[0], head_pos[1] - food_pos[1]
-                dist_sq = dx*dx + dy*dy
-
-                if 0 < dist_sq < magnet_radius_sq: # Check if within range
-                    dist = math.sqrt(dist_sq)
-                    normalized_dist = min(1.0, dist / magnet_range_pixels) # Clamp normalized distance
-                    # Interpolate speed based on distance
-                    move_speed = utils.lerp(s.MAGNET_PULL_SPEED_CLOSE, s.MAGNET_PULL_SPEED_FAR, normalized_dist)
-
-                    # Calculate movement vector and apply
-                    move_x = (dx / dist) * move_speed * dt
-                    move_y = (dy / dist) * move_speed * dt
-                    food_pos[0] += move_x
-                    food_pos[1] += move_y
-                    self.food.visual_pos = tuple(food_pos)
-                    # Could add logic to snap food's grid_pos if visual pos gets very close
+        # --- Update Screen Shake ---
+        # Decays in every state; the shake plays out on the game over screen
+        if self.screen_shake_timer > 0:
+            self.screen_shake_timer = max(0, self.screen_shake_timer - frame_dt)
+
+        # --- Fixed-Timestep Simulation ---
+        tick_dt = self.tick_dt
+        self.sim_accumulator += frame_dt
+        ticks = 0
+        while self.sim_accumulator >= tick_dt - 1e-9 and ticks < s.MAX_CATCHUP_TICKS: # Tolerates float drift
+            self.update(tick_dt)
+            self.sim_accumulator -= tick_dt
+            ticks += 1
+        if self.sim_accumulator >= tick_dt: # Hit the catch-up cap
+            self.dropped_ticks += int(self.sim_accumulator / tick_dt)
+            self.sim_accumulator %= tick_dt
+        self.render_alpha = min(1.0, max(0.0, self.sim_accumulator / tick_dt))
 
+        if self.game_state != "PLAYING":
+            self.render_alpha = 1.0 # No more ticks: hold the final state instead of blending toward it
+            return ticks # Particles freeze outside of play
 
         # --- Update Particles ---
-        # Filter out dead particles efficiently
-        self.particles = [p for p in self.particles if p.life > 0]
-        # Update remaining particles
-        for p in self.particles:
-            p.update(dt)
+        # Compacts dead particles and updates the rest in one batched pass
+        with self.profiler.scope("particles_update"):
+            self.particles.update(frame_dt)
+        return ticks
 
 
-        # --- Update Screen Shake ---
-        if self.screen_shake_timer > 0:
-            self.screen_shake_timer -= dt
-
+    def update(self, dt):
+        """Runs one fixed simulation tick of the game rules, keeping the previous visual state for interpolation."""
+        if self.game_state != "PLAYING":
+            return # Don't update game elements if not playing
 
-        # --- Check Player Death State ---
-        # This check is redundant if trigger_game_over sets the state correctly,
-        # but can be a failsafe. The primary transition happens in Snake.update.
-        # if self.player_snake and not self.player_snake.alive:
-        #      self.trigger_game_over("Eliminated")
+        for snake in self.snakes: snake.snapshot_visuals()
+        if self.food: self.food.snapshot_visuals()
+        super().update(dt) # Run the game rules (profiled per phase inside)
 
 
     def draw(self):
-        """Draws the entire game screen."""
+        """Draws the game screen (only the changed regions in dirty-rect mode)."""
         # --- Screen Shake Offset Calculation ---
         screen_offset_x, screen_offset_y = 0, 0
         # Apply shake only during game over transition for dramatic effect
         if self.screen_shake_timer > 0 and self.game_state == "GAME_OVER":
             intensity = self.screen_shake_intensity * (self.screen_shake_timer / 0.5) # Fade out shake
-            screen_offset_x = random.randint(-int(intensity), int(intensity))
-            screen_offset_y = random.randint(-int(intensity), int(intensity))
-
-        # Use a temporary surface for shaking effect if needed
-        # Note: This copy can impact performance. Only use if shaking.
-        draw_surface = self.screen
-        temp_surface = None
-        if screen_offset_x != 0 or screen_offset_y != 0:
-             # Create temp surface only when actually shaking
-             temp_surface = self.screen.copy()
-             draw_surface = temp_surface
+            screen_offset_x = self.fx_rng.randint(-int(intensity), int(intensity))
+            screen_offset_y = self.fx_rng.randint(-int(intensity), int(intensity))
+
+        # Layers go straight to the screen, or into the compositor's scene layer while shaking
+        shaking = screen_offset_x != 0 or screen_offset_y != 0
+        draw_surface = self.compositor.begin((screen_offset_x, screen_offset_y))
+
+        # Camera follows the player's interpolated head (a no-op while the world fits the screen)
+        camera = self.camera
+        camera.moved = False
+        player = self.player_snake
+        if self.game_state == "PLAYING" and player and player.alive:
+            current, previous = player.visual_pos[0], player.prev_visual_pos[0]
+            camera.follow(utils.lerp(np.array(previous), np.array(current), self.render_alpha))
+        border_rects = self._border_rects()
+
+        # In dirty-rect mode, only what was drawn last frame (plus the border strips) gets cleared;
+        # everything drawn this frame reports its rects so the next frame can do the same
+        dirty = self.dirty_rects
+        full_redraw = dirty is None or shaking or camera.moved or dirty.wants_full_redraw()
+        touched = [] # Screen rects drawn this frame
 
         # --- Render Layers ---
+        profiler = self.profiler
         # 1. Background
-        self.background.draw(draw_surface)
+        with profiler.scope("background_draw"):
+            clear_rects = None if full_redraw else dirty.clear_rects() + border_rects
+            touched += self.background.draw(draw_surface, clear_rects)
 
         # 2. Gameplay Elements (only if playing or game over)
         if self.game_state in ["PLAYING", "GAME_OVER"]:
-            # Sort drawable entities roughly by Y for pseudo-depth
-            drawable_entities = []
-            drawable_entities.extend(self.hazards)
-            if self.food: drawable_entities.append(self.food)
-            drawable_entities.extend(self.powerups)
-            if self.player_snake: drawable_entities.append(self.player_snake)
-            if self.competitor_snake: drawable_entities.append(self.competitor_snake)
-
-            # Define a function to get the primary Y coordinate for sorting
-            def get_sort_y(entity):
-                if isinstance(entity, Snake) and entity.visual_pos: return entity.visual_pos[0][1] # Sort by head Y
-                elif hasattr(entity, 'visual_pos'): return entity.visual_pos[1] # Food, Powerup
-                elif isinstance(entity, Hazard) and entity.grid_positions:
-                    # Average Y of hazard grid positions
-                    avg_y = sum(utils.grid_to_screen(gp)[1] for gp in entity.grid_positions) / len(entity.grid_positions)
-                    return avg_y
-                return s.HEIGHT # Default to bottom if no position found
-
-            drawable_entities.sort(key=get_sort_y)
+            # Only food, powerups and hazards in chunks on screen are considered; snakes cull per segment
+            with profiler.scope("projection"):
+                view = camera.visible_cells()
+                drawable_entities = self.chunks.query(grid.HAZARD, view)
+                drawable_entities += self.chunks.query(grid.FOOD, view)
+                drawable_entities += self.chunks.query(grid.POWERUP, view)
+                drawable_entities += self.snakes
+
+                # Project every drawable's points in one batched pass, sorted roughly by Y for pseudo-depth
+                projected = project_drawables(drawable_entities, self.render_alpha, camera.offset)
 
             # Draw sorted entities
-            for entity in drawable_entities:
-                 entity.draw(draw_surface) # Each entity handles its own drawing
+            with profiler.scope("entities_draw"):
+                for entity, points, scales in projected:
+                     touched += entity.draw(draw_surface, points, scales) # Each entity handles its own drawing
 
-            # Draw particles on top
-            for p in self.particles:
-                p.draw(draw_surface)
+            # Draw particles on top (single blits call)
+            with profiler.scope("particles_draw"):
+                touched += self.particles.draw(draw_surface, camera.offset)
 
             # Draw Player HUD on top of gameplay elements
-            draw_player_hud(draw_surface, self.score, self.high_score,
-                            self.combo_count, self.combo_timer,
-                            self.frenzy_active, self.frenzy_timer,
-                            self.player_snake)
+            with profiler.scope("hud"):
+                touched += draw_player_hud(draw_surface, self.score, self.high_score,
+                                           self.combo_count, self.combo_timer,
+                                           self.frenzy_active, self.frenzy_timer,
+                                           self.player_snake, self.fx_rng) # Flicker draws from the cosmetic stream
 
 
         # 3. Menu Screen
         elif self.game_state == "MENU":
-            draw_menu_screen(draw_surface, self.high_score)
+            with profiler.scope("hud"):
+                touched += draw_menu_screen(draw_surface, self.high_score)
 
 
         # 4. Game Over Screen (draws overlay on top)
         if self.game_state == "GAME_OVER":
             # Pass score and whether it was a new highscore
-            draw_game_over_screen(draw_surface, self.score, self.is_new_highscore)
+            with profiler.scope("hud"):
+                touched += draw_game_over_screen(draw_surface, self.score, self.is_new_highscore)
+
 
+        # 5. Border (on top, along the world's edges)
+        for rect in border_rects:
+            draw_surface.blit(self.border_surface, rect, (0, 0, rect.width, rect.height))
 
-        # 5. Border (draws on top of everything except maybe final shake blit)
-        draw_surface.blit(self.border_surface, (0, 0))
 
+        # --- Compose onto the Actual Screen ---
+        # Blits the scene layer at the shake offset (no-op when not shaking)
+        self.compositor.compose()
 
-        # --- Final Blit to Actual Screen ---
-        # If we used a temporary surface for shaking, blit it to the screen now
-        if temp_surface:
-            self.screen.blit(temp_surface, (screen_offset_x, screen_offset_y))
-        # Otherwise, draw_surface was self.screen, no extra blit needed unless logic changes
+        # Profiler overlay goes on last so it never shakes
+        touched.append(self.profiler.draw_overlay(self.screen))
 
         # Update the display
-        pygame.display.flip()
\ No newline at end of file
+        with profiler.scope("flip"):
+            if dirty is None:
+                pygame.display.flip()
+            else:
+                dirty.mark(touched)
+                dirty.present(full=full_redraw) # Falls back to a flip when most of the screen changed
+                if shaking: dirty.invalidate() # The offset scene moved pixels everywhere
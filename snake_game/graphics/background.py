@@ -1,24 +1,32 @@
 import pygame
-import random
 import math
+import numpy as np
 from .. import settings as s
 from .. import utils
 
 class Background:
-    def __init__(self):
+    """Parallax backdrop plus a procedural firefly layer.
+
+    Firefly state lives in NumPy arrays so motion, wrap-around and pulse math run as
+    batched passes. Glow sprites are pre-baked once for every (size, brightness level)
+    pair, and the whole layer renders with a single Surface.blits call.
+    """
+    def __init__(self, firefly_count=s.FIREFLY_COUNT, rng=None):
+        self.rng = rng if rng is not None else np.random.default_rng()
         self.scroll_speed_1 = 0.1 # Example parallax speeds
         self.scroll_speed_2 = 0.3
         self.offset_1 = 0
         self.offset_2 = 0
-        self.fireflies = []
-        for _ in range(100): # Number of fireflies
-            self.fireflies.append({
-                'pos': [random.uniform(0, s.WIDTH), random.uniform(0, s.HEIGHT)],
-                'vel': [random.uniform(-0.5, 0.5), random.uniform(-0.5, 0.5)],
-                'brightness': random.uniform(50, 150),
-                'pulse_speed': random.uniform(1, 3),
-                'pulse_offset': random.uniform(0, 2 * math.pi)
-            })
+        self.time = 0.0 # Drives the firefly pulse
+
+        n = firefly_count
+        rng = self.rng
+        self.firefly_pos = np.column_stack((rng.uniform(0, s.WIDTH, n), rng.uniform(0, s.HEIGHT, n)))
+        self.firefly_vel = rng.uniform(-0.5, 0.5, (n, 2))
+        self.firefly_brightness = rng.uniform(50, 150, n)
+        self.firefly_pulse_speed = rng.uniform(1, 3, n)
+        self.firefly_pulse_offset = rng.uniform(0, 2 * math.pi, n)
+        self._bake_sprites()
         # Load background images here if using them
         # self.bg_image_1 = pygame.image.load(s.BACKGROUND_IMG_PATH_1).convert()
         # self.bg_image_1 = pygame.transform.scale(self.bg_image_1, (s.WIDTH, s.HEIGHT))
@@ -26,22 +34,45 @@ class Background:
         # self.bg_image_2 = pygame.transform.scale(self.bg_image_2, (s.WIDTH, s.HEIGHT))
 
 
+    def _bake_sprites(self):
+        """Pre-renders a glow sprite for every firefly size and brightness level."""
+        self.max_firefly_size = int(4 * s.MAX_SCALE) # Largest size: full pulse at the bottom of the screen
+        levels = s.FIREFLY_BRIGHTNESS_LEVELS
+        self.firefly_sprites = [[None] * levels for _ in range(self.max_firefly_size + 1)]
+        for size in range(1, self.max_firefly_size + 1):
+            for level in range(levels):
+                brightness = int(150 * level / (levels - 1)) # Max brightness (150) at full pulse
+                color = (min(255, brightness + 50), min(255, brightness + 100), min(255, brightness), 150) # Yellowish glow
+                sprite = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
+                pygame.draw.circle(sprite, color, (size, size), size)
+                self.firefly_sprites[size][level] = sprite
+
+
     def update(self, dt):
+        self.time += dt
         # Update parallax offsets
         self.offset_1 = (self.offset_1 + self.scroll_speed_1 * dt * s.FPS) % s.WIDTH
         self.offset_2 = (self.offset_2 + self.scroll_speed_2 * dt * s.FPS) % s.WIDTH
 
-        # Update fireflies
-        for ff in self.fireflies:
-            ff['pos'][0] = (ff['pos'][0] + ff['vel'][0] * dt * s.FPS) % s.WIDTH
-            ff['pos'][1] = (ff['pos'][1] + ff['vel'][1] * dt * s.FPS) % s.HEIGHT
-            # Randomly change direction slightly
-            if random.random() < 0.01:
-                 ff['vel'] = [random.uniform(-0.5, 0.5), random.uniform(-0.5, 0.5)]
+        # Update fireflies (move and wrap around the screen)
+        pos = self.firefly_pos
+        pos += self.firefly_vel * (dt * s.FPS)
+        np.mod(pos[:, 0], s.WIDTH, out=pos[:, 0])
+        np.mod(pos[:, 1], s.HEIGHT, out=pos[:, 1])
+        # Randomly change direction slightly
+        turning = self.rng.random(len(pos)) < 0.01
+        turn_count = int(np.count_nonzero(turning))
+        if turn_count:
+            self.firefly_vel[turning] = self.rng.uniform(-0.5, 0.5, (turn_count, 2))
 
 
-    def draw(self, surface):
-        surface.fill(s.DARK_BG)
+    def draw(self, surface, clear_rects=None):
+        """Clears the screen (or only `clear_rects`) and draws the fireflies. Returns the rects they touched."""
+        if clear_rects is None:
+            surface.fill(s.DARK_BG)
+        else:
+            for rect in clear_rects:
+                surface.fill(s.DARK_BG, rect)
 
         # Draw Parallax Layers (if images loaded)
         # surface.blit(self.bg_image_1, (self.offset_1, 0))
@@ -50,20 +81,20 @@ class Background:
         # surface.blit(self.bg_image_2, (self.offset_2 - s.WIDTH, 0))
 
         # Draw Procedural Fireflies
-        current_time = pygame.time.get_ticks() / 1000.0
-        for ff in self.fireflies:
-            pulse = (math.sin(current_time * ff['pulse_speed'] + ff['pulse_offset']) + 1) / 2
-            brightness = int(ff['brightness'] * pulse)
-            scale = utils.get_perspective_scale(ff['pos'][1]) # Scale fireflies too
-            size = int((2 + pulse * 2) * scale)
-            if size < 1: continue
-
-            color = (min(255, brightness + 50), min(255, brightness + 100), min(255, brightness), 150) # Yellowish glow
+        if not len(self.firefly_pos): return []
+        pos = self.firefly_pos
+        pulse = (np.sin(self.time * self.firefly_pulse_speed + self.firefly_pulse_offset) + 1) / 2
+        brightness = self.firefly_brightness * pulse
+        scale = utils.perspective_scales(pos[:, 1]) # Scale fireflies too
+        size = ((2 + pulse * 2) * scale).astype(int)
+        level = np.rint(brightness * ((s.FIREFLY_BRIGHTNESS_LEVELS - 1) / 150)).astype(int)
+        dest_x = (pos[:, 0] - size).astype(int)
+        dest_y = (pos[:, 1] - size).astype(int)
 
-            try:
-                temp_surf = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
-                pygame.draw.circle(temp_surf, color, (size, size), size)
-                # Use additive blending for brightness
-                surface.blit(temp_surf, (int(ff['pos'][0] - size), int(ff['pos'][1] - size)), special_flags=pygame.BLEND_RGBA_ADD)
-            except pygame.error:
-                 pass # Ignore drawing error if size is invalid
\ No newline at end of file
+        sprites = self.firefly_sprites
+        blend = pygame.BLEND_RGBA_ADD # Additive blending for brightness
+        return surface.blits([
+            (sprites[sz][lv], (x, y), None, blend)
+            for sz, lv, x, y in zip(size.tolist(), level.tolist(), dest_x.tolist(), dest_y.tolist())
+            if sz >= 1
+        ])
@@ -0,0 +1,35 @@
+import pygame
+from .. import settings as s
+
+class Camera:
+    """Viewport onto the world: centred on a target and clamped to the world's edges.
+
+    `offset` is the world pixel drawn at the screen's top-left, so screen = world - offset.
+    While the world is no bigger than the screen, the offset stays at (0, 0).
+    """
+    def __init__(self, view_size=None, world_cells=None):
+        # Defaults are read per camera, so runtime screen and world overrides apply
+        if view_size is None: view_size = (s.WIDTH, s.HEIGHT)
+        if world_cells is None: world_cells = (s.WORLD_GRID_WIDTH, s.WORLD_GRID_HEIGHT)
+        self.view_width, self.view_height = view_size
+        self.max_x = max(0, world_cells[0] * s.GRID_SIZE - self.view_width)
+        self.max_y = max(0, world_cells[1] * s.GRID_SIZE - self.view_height)
+        self.offset = (0, 0)
+        self.moved = False # Whether the last follow() scrolled the view
+
+    def follow(self, pos):
+        """Centres the view on the world pixel `pos` (whole pixels, so the scene doesn't shimmer)."""
+        x = min(self.max_x, max(0, int(pos[0] - self.view_width / 2)))
+        y = min(self.max_y, max(0, int(pos[1] - self.view_height / 2)))
+        self.moved = (x, y) != self.offset
+        self.offset = (x, y)
+
+    def visible_cells(self, margin=1):
+        """Inclusive (x0, y0, x1, y1) cell range on screen, padded by `margin` cells for glows."""
+        x, y = self.offset
+        return ((x // s.GRID_SIZE) - margin, (y // s.GRID_SIZE) - margin,
+                (x + self.view_width) // s.GRID_SIZE + margin, (y + self.view_height) // s.GRID_SIZE + margin)
+
+    def to_screen(self, rect):
+        """A world-pixel Rect moved into screen space."""
+        return pygame.Rect(rect).move(-self.offset[0], -self.offset[1])
@@ -0,0 +1,63 @@
+import pygame
+from .. import settings as s
+
+class CachedLayer:
+    """Offscreen layer composed from (surface, pos) pieces, re-rendered only when its key changes.
+
+    The layer covers just the pieces' bounding box, so drawing it is a single blit
+    instead of one blit (or text render) per piece every frame.
+    """
+    def __init__(self):
+        self.key = None
+        self.surface = None
+        self.pos = (0, 0)
+        self.rebuilds = 0
+
+    def invalidate(self):
+        self.key = None
+        self.surface = None
+
+    def update(self, key, build):
+        """Re-renders from build() -> [(surface, (x, y)), ...] if `key` changed since the last render."""
+        if self.surface is not None and key == self.key: return
+        pieces = build()
+        bounds = pygame.Rect(pieces[0][1], pieces[0][0].get_size())
+        bounds.unionall_ip([pygame.Rect(pos, piece.get_size()) for piece, pos in pieces])
+        self.surface = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        self.surface.blits([(piece, (x - bounds.x, y - bounds.y)) for piece, (x, y) in pieces], doreturn=False)
+        self.pos = bounds.topleft
+        self.key = key
+        self.rebuilds += 1
+
+    def draw(self, surface):
+        """Blits the layer at its screen position. Returns the rect it touched."""
+        return surface.blit(self.surface, self.pos)
+
+
+class Compositor:
+    """Composes each frame's layers onto the screen at a shared offset (used for screen shake).
+
+    Without an offset, layers draw straight onto the screen. With one, they draw into a
+    persistent offscreen scene layer that compose() blits at the offset, so shaking never
+    allocates or copies a full-screen surface.
+    """
+    def __init__(self, screen):
+        self.screen = screen
+        self.scene = pygame.Surface(screen.get_size()).convert(screen) # Reused every shake frame
+        self.offset = (0, 0)
+
+    def begin(self, offset=(0, 0)):
+        """Starts a frame. Returns the surface this frame's layers should be drawn into."""
+        self.offset = offset
+        return self.scene if offset != (0, 0) else self.screen
+
+    def compose(self):
+        """Blits the scene layer onto the screen at the offset, clearing the edge it uncovers."""
+        if self.offset == (0, 0): return
+        dx, dy = self.offset
+        width, height = self.screen.get_size()
+        self.screen.blit(self.scene, self.offset)
+        if dx > 0: self.screen.fill(s.DARK_BG, (0, 0, dx, height))
+        elif dx < 0: self.screen.fill(s.DARK_BG, (width + dx, 0, -dx, height))
+        if dy > 0: self.screen.fill(s.DARK_BG, (0, 0, width, dy))
+        elif dy < 0: self.screen.fill(s.DARK_BG, (0, height + dy, width, -dy))
@@ -0,0 +1,93 @@
+import numpy as np
+import pygame
+from .. import settings as s
+
+class DirtyRectTracker:
+    """Tracks which screen tiles changed so only those are cleared and pushed to the display.
+
+    Each frame the renderer clears the tiles drawn last frame (clear_rects), redraws all
+    dynamic content while collecting the rects it touched (mark), then pushes last
+    frame's and this frame's tiles to the display (present). Everywhere else the screen
+    still holds plain background, so nothing there needs redrawing.
+    """
+    def __init__(self, width=s.WIDTH, height=s.HEIGHT, tile=s.DIRTY_TILE_SIZE, max_coverage=s.DIRTY_MAX_COVERAGE):
+        self.tile = tile
+        self.cols = -(-width // tile)
+        self.rows = -(-height // tile)
+        self.bounds = pygame.Rect(0, 0, width, height)
+        self.max_coverage = max_coverage
+        self.previous = np.ones((self.rows, self.cols), dtype=bool) # Screen contents unknown: all dirty
+        self.current = np.zeros((self.rows, self.cols), dtype=bool)
+        self.coverage = 1.0 # Fraction of the screen pushed last frame
+        self.full_frames = 0
+        self.partial_frames = 0
+
+    def invalidate(self):
+        """Forces the next frame to be a full redraw (e.g. after the window was exposed)."""
+        self.previous[:] = True
+
+    def wants_full_redraw(self):
+        """True when last frame's drawing covered so much that clearing piecewise isn't worth it."""
+        return self.previous.mean() > self.max_coverage
+
+    def clear_rects(self):
+        """Merged rects covering everything drawn last frame."""
+        return self._merge(self.previous)
+
+    def mark(self, rects):
+        """Flags the tiles under the given Rects as drawn this frame."""
+        rects = [r for r in rects if r] # Drops None and zero-size (fully clipped) rects
+        if not rects: return
+        t = self.tile
+        box = np.array([tuple(r) for r in rects], dtype=np.int64)
+        x0 = np.clip(box[:, 0] // t, 0, self.cols - 1)
+        y0 = np.clip(box[:, 1] // t, 0, self.rows - 1)
+        x1 = np.clip((box[:, 0] + box[:, 2] - 1) // t, 0, self.cols - 1)
+        y1 = np.clip((box[:, 1] + box[:, 3] - 1) // t, 0, self.rows - 1)
+
+        # Rects spanning at most 2x2 tiles (nearly all of them) are covered by their corners
+        small = (x1 - x0 <= 1) & (y1 - y0 <= 1)
+        current = self.current
+        for ys, xs in ((y0, x0), (y0, x1), (y1, x0), (y1, x1)):
+            current[ys[small], xs[small]] = True
+        for bx0, by0, bx1, by1 in zip(x0[~small].tolist(), y0[~small].tolist(), x1[~small].tolist(), y1[~small].tolist()):
+            current[by0:by1 + 1, bx0:bx1 + 1] = True
+
+    def present(self, full=False):
+        """Pushes the frame to the display and rolls this frame's tiles over to the next.
+
+        Falls back to a full flip when `full` is set or the dirty area exceeds max_coverage.
+        """
+        dirty = self.previous | self.current
+        self.coverage = float(dirty.mean())
+        if full or self.coverage > self.max_coverage:
+            pygame.display.flip()
+            self.full_frames += 1
+        else:
+            pygame.display.update(self._merge(dirty))
+            self.partial_frames += 1
+        self.previous, self.current = self.current, self.previous
+        self.current[:] = False
+
+    def _merge(self, mask):
+        """Turns a tile mask into a few Rects: row runs, extended down while identical."""
+        t = self.tile
+        edges = np.diff(mask.view(np.int8), axis=1, prepend=0, append=0)
+        run_rows, starts = np.nonzero(edges == 1) # Row-major, so runs line up with their ends
+        ends = np.nonzero(edges == -1)[1]
+        rects = []
+        open_runs = {} # (start col, end col) -> Rect still growing downward, as of row `last_row`
+        last_row = -1
+        next_open = {}
+        for row, start, end in zip(run_rows.tolist(), starts.tolist(), ends.tolist()):
+            if row != last_row:
+                open_runs = next_open if row == last_row + 1 else {}
+                next_open = {}
+                last_row = row
+            rect = open_runs.get((start, end))
+            if rect is None:
+                rect = pygame.Rect(start * t, row * t, (end - start) * t, 0)
+                rects.append(rect)
+            rect.height += t
+            next_open[(start, end)] = rect
+        return [rect.clip(self.bounds) for rect in rects]
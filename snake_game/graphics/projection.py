@@ -0,0 +1,45 @@
+import numpy as np
+from .. import utils
+
+def project_drawables(entities, alpha=1.0, offset=(0, 0)):
+    """Projection stage: screen points, perspective scales and depth order for all drawables at once.
+
+    Every entity's screen_points() (world pixels) are gathered into one (N, 2) array, moved
+    into screen space by the camera `offset`, and their perspective scales computed in a
+    single vectorized pass. With `alpha` < 1 the points are blended
+    from previous_screen_points() (the state one simulation tick earlier) toward the
+    current ones, so frames drawn between fixed ticks still move smoothly.
+    Returns (entity, points, scales) triples sorted back to front by each entity's first
+    point (a snake's head), where points and scales are that entity's slices of the
+    shared arrays. Entities with nothing to draw are left out.
+    """
+    interpolate = alpha < 1.0
+    counts = []
+    flat = []
+    flat_previous = []
+    for entity in entities:
+        entity_points = entity.screen_points()
+        counts.append(len(entity_points))
+        flat.extend(entity_points)
+        if interpolate:
+            previous = entity.previous_screen_points()
+            if len(previous) != len(entity_points): # Grew (or appeared) this tick: new points start where they are
+                previous = list(previous[:len(entity_points)]) + list(entity_points[len(previous):])
+            flat_previous.extend(previous)
+    if not flat: return []
+
+    points = np.array(flat, dtype=float)
+    if interpolate:
+        previous = np.array(flat_previous, dtype=float)
+        points = previous + (points - previous) * alpha
+    if offset != (0, 0): points -= offset
+    scales = utils.perspective_scales(points[:, 1])
+    counts = np.array(counts)
+    ends = np.cumsum(counts)
+    starts = ends - counts
+
+    # Y-sort for pseudo-depth; a stable sort keeps insertion order between equal keys
+    drawn = np.flatnonzero(counts)
+    order = drawn[np.argsort(points[starts[drawn], 1], kind="stable")]
+    return [(entities[i], points[start:end], scales[start:end])
+            for i, start, end in zip(order.tolist(), starts[order].tolist(), ends[order].tolist())]
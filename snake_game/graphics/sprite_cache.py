@@ -0,0 +1,88 @@
+import pygame
+from collections import OrderedDict
+from .. import settings as s
+
+class SpriteCache:
+    """Bounded LRU cache of pre-rendered circle (glow) sprites.
+
+    Sprites are keyed by their look (e.g. radius, RGBA) so every draw call with the same
+    look reuses one SRCALPHA surface instead of allocating a fresh one per frame. Blend
+    modes are applied at blit time, so they don't split entries.
+    """
+    def __init__(self, max_size=s.SPRITE_CACHE_SIZE):
+        self.max_size = max_size
+        self._sprites = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_circle(self, radius, color):
+        """Returns a (2r x 2r) SRCALPHA surface with a filled circle of `color`."""
+        if len(color) == 3: color = (*color, 255) # Normalize so RGB and opaque RGBA share an entry
+        key = (radius, color)
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self.hits += 1
+            self._sprites.move_to_end(key) # Mark as most recently used
+            return sprite
+
+        sprite = pygame.Surface((radius*2, radius*2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, color, (radius, radius), radius)
+        return self._store(key, sprite)
+
+    def get_segment(self, glow_radius, base_radius, color, glow_alpha):
+        """Returns a snake segment sprite: an opaque `color` circle over a faint glow of the same color.
+
+        The sprite is (2 * glow_radius) square, centered, so one blit replaces glow blit + circle draw.
+        """
+        key = ("segment", glow_radius, base_radius, color, glow_alpha)
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self.hits += 1
+            self._sprites.move_to_end(key) # Mark as most recently used
+            return sprite
+
+        sprite = pygame.Surface((glow_radius*2, glow_radius*2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (*color, glow_alpha), (glow_radius, glow_radius), glow_radius)
+        pygame.draw.circle(sprite, color, (glow_radius, glow_radius), base_radius)
+        return self._store(key, sprite)
+
+    def _store(self, key, sprite):
+        self.misses += 1
+        self._sprites[key] = sprite
+        if len(self._sprites) > self.max_size:
+            self._sprites.popitem(last=False) # Evict least recently used
+            self.evictions += 1
+        return sprite
+
+    def merge(self, other):
+        """Adds `other`'s sprites that this cache lacks, as most recently used (e.g. sprites warmed on another thread)."""
+        for key, sprite in other._sprites.items():
+            if key in self._sprites: continue
+            self._sprites[key] = sprite
+            if len(self._sprites) > self.max_size:
+                self._sprites.popitem(last=False) # Evict least recently used
+                self.evictions += 1
+
+    @property
+    def size(self):
+        return len(self._sprites)
+
+    def stats(self):
+        """Returns the hit/miss/size counters as a dict."""
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "size": self.size, "max_size": self.max_size}
+
+    def clear(self):
+        self._sprites.clear()
+
+
+# Shared cache used by all entity draw methods
+glow_cache = SpriteCache()
+
+def get_glow(radius, color):
+    """Gets a cached glow/circle sprite from the shared cache."""
+    return glow_cache.get_circle(radius, color)
+
+# Separate cache for composed snake segment sprites, so long bodies don't evict glows
+segment_cache = SpriteCache(s.SEGMENT_SPRITE_CACHE_SIZE)
@@ -1,112 +1,184 @@
 import pygame
+from collections import OrderedDict
 from .. import settings as s
-import random
+from .compositor import CachedLayer
+from .sprite_cache import get_glow
 
 # Cache fonts for performance
 _font_cache = {}
+FONT_SIZES = (18, 22, 24, 26, 28, 30, 32, 36, 40, 48, 64, 72) # Every size the UI draws text at
+# Rendered text surfaces keyed by (text, size, color, shadow color, font), LRU-bounded
+_text_cache = OrderedDict()
+
+def _open_font(size, font_name):
+    try:
+        return pygame.font.Font(font_name, size)
+    except IOError: # Fallback to default font if specified one not found
+         print(f"Warning: Font '{font_name}' not found. Using default.")
+         return pygame.font.Font(None, size) # Use default pygame font
 
 def get_font(size, font_name=s.FONT_NAME):
     """Gets (or creates and caches) a pygame font object."""
     key = (font_name, size)
     if key not in _font_cache:
-        try:
-            _font_cache[key] = pygame.font.Font(font_name, size)
-        except IOError: # Fallback to default font if specified one not found
-             print(f"Warning: Font '{font_name}' not found. Using default.")
-             _font_cache[key] = pygame.font.Font(None, size) # Use default pygame font
+        _font_cache[key] = _open_font(size, font_name)
     return _font_cache[key]
 
-def draw_text(surface, text, size, x, y, color=s.UI_TEXT_COLOR, shadow_color=s.UI_SHADOW_COLOR, font_name=s.FONT_NAME, center=False):
-    """Draws text with an optional shadow."""
+def warm_fonts():
+    """Opens every UI font size into a new dict, without touching the shared cache.
+
+    Startup runs this on the asset loader thread; the main thread hands the result to install_fonts().
+    """
+    return {(s.FONT_NAME, size): _open_font(size, s.FONT_NAME) for size in FONT_SIZES}
+
+def install_fonts(fonts):
+    """Adds fonts from warm_fonts() to the cache, keeping any the UI already opened."""
+    for key, font in fonts.items():
+        _font_cache.setdefault(key, font)
+
+def render_text(text, size, color=s.UI_TEXT_COLOR, shadow_color=s.UI_SHADOW_COLOR, font_name=s.FONT_NAME):
+    """Returns (text_surface, shadow_surface or None), rendered once and cached (LRU-bounded)."""
+    key = (text, size, color, shadow_color, font_name)
+    surfaces = _text_cache.get(key)
+    if surfaces is not None:
+        _text_cache.move_to_end(key) # Mark as most recently used
+        return surfaces
     font = get_font(size, font_name)
-    text_surface = font.render(text, True, color)
+    surfaces = (font.render(text, True, color), font.render(text, True, shadow_color) if shadow_color else None)
+    _text_cache[key] = surfaces
+    if len(_text_cache) > s.TEXT_CACHE_SIZE:
+        _text_cache.popitem(last=False) # Evict the least recently used string
+    return surfaces
+
+def draw_text(surface, text, size, x, y, color=s.UI_TEXT_COLOR, shadow_color=s.UI_SHADOW_COLOR, font_name=s.FONT_NAME, center=False, cache=True):
+    """Draws text with an optional shadow. Returns the screen rect it touched.
+
+    Pass cache=False for strings that change every frame (e.g. live numbers) so they
+    don't churn the text cache.
+    """
+    if cache:
+        text_surface, shadow_surface = render_text(text, size, color, shadow_color, font_name)
+    else:
+        font = get_font(size, font_name)
+        text_surface = font.render(text, True, color)
+        shadow_surface = font.render(text, True, shadow_color) if shadow_color else None
     text_rect = text_surface.get_rect()
+    if center:
+        text_rect.center = (x, y)
+    else:
+        text_rect.topleft = (x, y)
 
     # Draw shadow/outline slightly offset
-    if shadow_color:
-        shadow_surface = font.render(text, True, shadow_color)
-        shadow_rect = shadow_surface.get_rect()
-        shadow_offset_x = x + 1
-        shadow_offset_y = y + 1
-        if center:
-            shadow_rect.center = (shadow_offset_x, shadow_offset_y)
-        else:
-            shadow_rect.topleft = (shadow_offset_x, shadow_offset_y)
-        surface.blit(shadow_surface, shadow_rect)
+    shadow_rect = surface.blit(shadow_surface, text_rect.move(1, 1)) if shadow_surface else None
 
     # Draw main text
+    touched = surface.blit(text_surface, text_rect)
+    if shadow_rect:
+        touched.union_ip(shadow_rect)
+    return touched
+
+# --- You could add more UI drawing functions here ---
+# e.g., function to draw the entire HUD, progress bars, etc.
+
+def text_pieces(text, size, x, y, color=s.UI_TEXT_COLOR, shadow_color=s.UI_SHADOW_COLOR, center=False):
+    """(surface, pos) pieces for a shadowed string, positioned as draw_text would, for CachedLayer."""
+    text_surface, shadow_surface = render_text(text, size, color, shadow_color)
+    text_rect = text_surface.get_rect()
     if center:
         text_rect.center = (x, y)
     else:
         text_rect.topleft = (x, y)
-    surface.blit(text_surface, text_rect)
+    pieces = [(shadow_surface, (text_rect.x + 1, text_rect.y + 1))] if shadow_surface else []
+    pieces.append((text_surface, text_rect.topleft))
+    return pieces
 
-# --- You could add more UI drawing functions here ---
-# e.g., function to draw the entire HUD, progress bars, etc.
+def _hud_pieces(score, combo_count, powerups):
+    """The HUD's text column: score, combo and active powerups with their icons."""
+    pieces = text_pieces(f"Score: {score}", 28, 10, 10)
+    if combo_count:
+        pieces += text_pieces(f"Combo: x{combo_count}", 24, 10, 45, color=(255, 200, 100))
+    # Active Powerups (below combo/frenzy bars)
+    y_offset = 95 # Start y-position for powerup text
+    powerup_icon_size = 8
+    for p_type, timer_text in powerups:
+        icon_color = s.POWERUP_COLORS.get(p_type, (255,255,255)) # Default white if not found
+        icon_center_y = y_offset + (get_font(18).get_height()//2)
+        pieces.append((get_glow(powerup_icon_size, icon_color), (25 - powerup_icon_size, icon_center_y - powerup_icon_size))) # Simple circle icon
+        pieces += text_pieces(f"{p_type.upper()}: {timer_text}s", 18, 45, y_offset, color=icon_color)
+        y_offset += 25 # Move down for next powerup
+    return pieces
+
+# Cached UI layers, each rebuilt only when what it shows changes
+_hud_layer = CachedLayer()
+_menu_layer = CachedLayer()
+_game_over_layer = CachedLayer()
+
+def draw_player_hud(surface, score, high_score, combo_count, combo_timer, frenzy_active, frenzy_timer, player_snake, rng):
+    """Draws the main gameplay HUD elements. Returns the screen rects it touched.
+
+    The text column is a cached composed surface keyed by what it shows (score, combo,
+    powerup timer tenths); only the bars and the flickering frenzy banner are drawn live.
+    `rng` (the game's cosmetic fx_rng) drives the frenzy flicker.
+    """
+    rects = []
+    show_combo = combo_count > 0 and combo_timer > 0
+    powerups = ()
+    if player_snake:
+        powerups = tuple((p_type, f"{timer:.1f}") for p_type, timer in player_snake.powerup_timers.items() if timer > 0)
+    combo_shown = combo_count if show_combo else 0
+    _hud_layer.update((score, combo_shown, powerups), lambda: _hud_pieces(score, combo_shown, powerups))
+    rects.append(_hud_layer.draw(surface))
 
-def draw_player_hud(surface, score, high_score, combo_count, combo_timer, frenzy_active, frenzy_timer, player_snake):
-    """Draws the main gameplay HUD elements."""
-    # Score and High Score
-    score_text = f"Score: {score}"
-    highscore_text = f"High Score: {high_score}"
-    draw_text(surface, score_text, 28, 10, 10)
     # Correctly right-align high score
-    font = get_font(28, s.FONT_NAME)
-    highscore_width = font.size(highscore_text)[0]
-    draw_text(surface, highscore_text, 28, s.WIDTH - highscore_width - 10, 10)
-
-    # Combo Meter/Timer
-    if combo_count > 0 and combo_timer > 0:
-         combo_str = f"Combo: x{combo_count}"
-         draw_text(surface, combo_str, 24, 10, 45, color=(255, 200, 100))
-         # Draw combo timer bar
+    highscore_text = f"High Score: {high_score}"
+    highscore_width = render_text(highscore_text, 28)[0].get_width()
+    rects.append(draw_text(surface, highscore_text, 28, s.WIDTH - highscore_width - 10, 10))
+
+    # Combo timer bar
+    if show_combo:
          bar_width = 100; bar_height = 10
          fill_width = int(bar_width * (combo_timer / s.COMBO_TIME_LIMIT))
-         pygame.draw.rect(surface, (100, 100, 100), (10, 75, bar_width, bar_height))
-         pygame.draw.rect(surface, (255, 200, 100), (10, 75, fill_width, bar_height))
+         rects.append(pygame.draw.rect(surface, (100, 100, 100), (10, 75, bar_width, bar_height)))
+         pygame.draw.rect(surface, (255, 200, 100), (10, 75, fill_width, bar_height)) # Inside the bar's rect
 
     # Frenzy Timer
     if frenzy_active:
          frenzy_str = f"FRENZY!"
-         frenzy_color = (255, 50 + int(random.random()*100), 50 + int(random.random()*100)) # Flickering
-         draw_text(surface, frenzy_str, 36, s.WIDTH // 2, 20, color=frenzy_color, center=True)
+         # Flickering; stepped by 10 so the flicker reuses a bounded set of cached renders
+         frenzy_color = (255, 50 + 10 * rng.randrange(10), 50 + 10 * rng.randrange(10))
+         rects.append(draw_text(surface, frenzy_str, 36, s.WIDTH // 2, 20, color=frenzy_color, center=True))
          # Draw frenzy timer bar
          bar_width = 150; bar_height = 12
          fill_width = int(bar_width * (frenzy_timer / s.FRENZY_DURATION))
          bar_x = (s.WIDTH - bar_width) // 2
-         pygame.draw.rect(surface, (100, 0, 0), (bar_x, 55, bar_width, bar_height))
-         pygame.draw.rect(surface, frenzy_color, (bar_x, 55, fill_width, bar_height))
-
-    # Active Powerups (Draw below combo/frenzy bars)
-    if player_snake:
-        y_offset = 95 # Start y-position for powerup text
-        powerup_icon_size = 8
-        for p_type, timer in player_snake.powerup_timers.items():
-             if timer > 0:
-                 icon_color = s.POWERUP_COLORS.get(p_type, (255,255,255)) # Default white if not found
-                 text = f"{p_type.upper()}: {timer:.1f}s"
-                 # Draw simple circle icon
-                 pygame.draw.circle(surface, icon_color, (25, y_offset + (get_font(18).get_height()//2) ), powerup_icon_size)
-                 draw_text(surface, text, 18, 45, y_offset, color=icon_color)
-                 y_offset += 25 # Move down for next powerup
+         rects.append(pygame.draw.rect(surface, (100, 0, 0), (bar_x, 55, bar_width, bar_height)))
+         pygame.draw.rect(surface, frenzy_color, (bar_x, 55, fill_width, bar_height)) # Inside the bar's rect
+    return rects
 
 def draw_menu_screen(surface, high_score):
-    """Draws the main menu."""
-    draw_text(surface, "Bio-luminescent Snake", 64, s.WIDTH // 2, s.HEIGHT // 3, center=True)
-    draw_text(surface, "Battle!", 48, s.WIDTH // 2, s.HEIGHT // 3 + 70, center=True)
-    draw_text(surface, "Press SPACE or ENTER to Start", 32, s.WIDTH // 2, s.HEIGHT // 2 + 50, center=True)
-    draw_text(surface, "Arrow Keys or WASD to Move", 22, s.WIDTH // 2, s.HEIGHT * 2 // 3 + 20, center=True)
-    draw_text(surface, f"High Score: {high_score}", 26, s.WIDTH // 2, s.HEIGHT * 3 // 4 + 20, center=True)
+    """Draws the main menu (a cached layer, rebuilt when the high score changes). Returns the screen rects it touched."""
+    _menu_layer.update(high_score, lambda: [
+        *text_pieces("Bio-luminescent Snake", 64, s.WIDTH // 2, s.HEIGHT // 3, center=True),
+        *text_pieces("Battle!", 48, s.WIDTH // 2, s.HEIGHT // 3 + 70, center=True),
+        *text_pieces("Press SPACE or ENTER to Start", 32, s.WIDTH // 2, s.HEIGHT // 2 + 50, center=True),
+        *text_pieces("Arrow Keys or WASD to Move", 22, s.WIDTH // 2, s.HEIGHT * 2 // 3 + 20, center=True),
+        *text_pieces(f"High Score: {high_score}", 26, s.WIDTH // 2, s.HEIGHT * 3 // 4 + 20, center=True),
+    ])
+    return [_menu_layer.draw(surface)]
 
-def draw_game_over_screen(surface, score, is_new_highscore):
-    """Draws the game over overlay and text."""
-    # Semi-transparent overlay
+def _game_over_pieces(score, is_new_highscore):
+    # Semi-transparent full-screen dimming under the text
     overlay = pygame.Surface((s.WIDTH, s.HEIGHT), pygame.SRCALPHA)
     overlay.fill((0, 0, 0, 180))
-    surface.blit(overlay, (0,0))
-
-    draw_text(surface, "GAME OVER", 72, s.WIDTH // 2, s.HEIGHT // 3, color=(255, 80, 80), center=True)
-    draw_text(surface, f"Final Score: {score}", 40, s.WIDTH // 2, s.HEIGHT // 2, center=True)
+    pieces = [(overlay, (0, 0))]
+    pieces += text_pieces("GAME OVER", 72, s.WIDTH // 2, s.HEIGHT // 3, color=(255, 80, 80), center=True)
+    pieces += text_pieces(f"Final Score: {score}", 40, s.WIDTH // 2, s.HEIGHT // 2, center=True)
     if is_new_highscore:
-         draw_text(surface, "New High Score!", 30, s.WIDTH // 2, s.HEIGHT // 2 + 50, color=(255, 255, 100), center=True)
-    draw_text(surface, "Press SPACE or ENTER to Restart", 28, s.WIDTH // 2, s.HEIGHT * 2 // 3 + 20, center=True)
\ No newline at end of file
+         pieces += text_pieces("New High Score!", 30, s.WIDTH // 2, s.HEIGHT // 2 + 50, color=(255, 255, 100), center=True)
+    pieces += text_pieces("Press SPACE or ENTER to Restart", 28, s.WIDTH // 2, s.HEIGHT * 2 // 3 + 20, center=True)
+    return pieces
+
+def draw_game_over_screen(surface, score, is_new_highscore):
+    """Draws the game over overlay and text (one cached layer per result). Returns the screen rects it touched (the whole screen)."""
+    _game_over_layer.update((score, is_new_highscore), lambda: _game_over_pieces(score, is_new_highscore))
+    return [_game_over_layer.draw(surface)]
@@ -0,0 +1,98 @@
+import random
+from . import settings as s
+
+# Occupancy kinds, one counter layer per kind
+FOOD = 0
+POWERUP = 1
+HAZARD = 2
+PLAYER = 3
+COMPETITOR = 4
+NUM_KINDS = 5
+
+class OccupancyGrid:
+    """Game-wide WORLD_GRID_WIDTH x WORLD_GRID_HEIGHT record of what occupies each cell.
+
+    Each kind keeps a per-cell counter in a bytearray (a snake can overlap itself
+    while phasing), plus a `total` layer so "is this cell free" is a single lookup.
+    Entities update it incrementally with add()/remove() as they move, spawn or die.
+
+    Free cells are also kept in a swap-remove array with a cell -> slot map, so a
+    uniformly random free cell can be drawn in O(1) however full the board is.
+    """
+    def __init__(self, width=None, height=None):
+        # Defaults are read per grid, so runtime world overrides (batch --set) apply
+        if width is None: width = s.WORLD_GRID_WIDTH
+        if height is None: height = s.WORLD_GRID_HEIGHT
+        self.width = width
+        self.height = height
+        self.layers = [bytearray(width * height) for _ in range(NUM_KINDS)]
+        self.total = bytearray(width * height)
+        self._reset_free_index()
+
+    def _reset_free_index(self):
+        self._free = list(range(self.width * self.height)) # Indices of free cells, unordered
+        self._slot = list(range(self.width * self.height)) # Cell index -> position in _free (-1 if occupied)
+
+    def clear(self):
+        """Empties every cell."""
+        for layer in self.layers:
+            layer[:] = bytes(len(layer))
+        self.total[:] = bytes(len(self.total))
+        self._reset_free_index()
+
+    def in_bounds(self, pos):
+        return 0 <= pos[0] < self.width and 0 <= pos[1] < self.height
+
+    def add(self, kind, pos):
+        """Marks one occupant of `kind` in the cell at `pos`."""
+        idx = pos[1] * self.width + pos[0]
+        self.layers[kind][idx] += 1
+        if self.total[idx] == 0: # Cell becomes occupied: swap-remove it from the free array
+            slot = self._slot[idx]
+            last = self._free.pop()
+            if last != idx:
+                self._free[slot] = last
+                self._slot[last] = slot
+            self._slot[idx] = -1
+        self.total[idx] += 1
+
+    def remove(self, kind, pos):
+        """Removes one occupant of `kind` from the cell at `pos`."""
+        idx = pos[1] * self.width + pos[0]
+        self.layers[kind][idx] -= 1
+        self.total[idx] -= 1
+        if self.total[idx] == 0: # Cell becomes free again
+            self._slot[idx] = len(self._free)
+            self._free.append(idx)
+
+    def count(self, kind, pos):
+        """Number of `kind` occupants in the cell (0 for out-of-bounds cells)."""
+        if not self.in_bounds(pos): return 0
+        return self.layers[kind][pos[1] * self.width + pos[0]]
+
+    def has(self, kind, pos):
+        return self.count(kind, pos) > 0
+
+    def is_free(self, pos):
+        """True if the cell is inside the grid and nothing occupies it."""
+        return self.in_bounds(pos) and self.total[pos[1] * self.width + pos[0]] == 0
+
+    def blocks_movement(self, pos):
+        """True if a snake moving into `pos` would die: wall, any snake, or a hazard."""
+        if not self.in_bounds(pos): return True
+        idx = pos[1] * self.width + pos[0]
+        return bool(self.layers[PLAYER][idx] or self.layers[COMPETITOR][idx] or self.layers[HAZARD][idx])
+
+    @property
+    def free_count(self):
+        return len(self._free)
+
+    @property
+    def is_full(self):
+        return not self._free
+
+    def random_free_cell(self, rng=random):
+        """Returns a uniformly random unoccupied cell in O(1), or None if the board is full."""
+        if not self._free: return None
+        idx = self._free[rng.randrange(len(self._free))]
+        return (idx % self.width, idx // self.width)
@@ -1,3 +1,6 @@
+import time
+STARTED = time.perf_counter() # Before the heavy imports, so the startup report can time them
+
 import pygame
 import sys # To ensure clean exit
 
@@ -6,8 +9,8 @@ from .game import Game
 
 def run_game():
     """Initializes Pygame and runs the main game loop."""
-    # Note: Pygame initialization is now handled inside Game.__init__
-    game_instance = Game()
+    # Note: Pygame initialization is now handled inside Game.__init__ (staged, see startup.py)
+    game_instance = Game(started=STARTED)
     try:
         game_instance.run() # run() contains the main loop and pygame.quit()
     except Exception as e:
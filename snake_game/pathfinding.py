@@ -0,0 +1,62 @@
+from collections import deque
+
+# Grid step directions: up, down, left, right
+DIRECTIONS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+
+class NodeBudget:
+    """Caps how many grid nodes the AI may expand in one tick, and records usage."""
+    def __init__(self, limit):
+        self.limit = limit
+        self.used = 0
+
+    def spend(self):
+        """Consumes one node. Returns False once the budget is exhausted."""
+        if self.used >= self.limit: return False
+        self.used += 1
+        return True
+
+
+def bfs_first_step(start, goal, is_blocked, budget, first_moves=DIRECTIONS):
+    """Breadth-first search from `start` to `goal` over unblocked cells.
+
+    Returns (direction, distance) for the first step of a shortest path, or
+    (None, None) if the goal is unreachable or the budget runs out first.
+    """
+    frontier = deque()
+    seen = {start}
+    for d in first_moves:
+        nxt = (start[0] + d[0], start[1] + d[1])
+        if nxt in seen or is_blocked(nxt): continue
+        if nxt == goal: return d, 1
+        seen.add(nxt)
+        frontier.append((nxt, d, 1))
+
+    while frontier:
+        if not budget.spend(): return None, None
+        pos, first, dist = frontier.popleft()
+        for d in DIRECTIONS:
+            nxt = (pos[0] + d[0], pos[1] + d[1])
+            if nxt in seen or is_blocked(nxt): continue
+            if nxt == goal: return first, dist + 1
+            seen.add(nxt)
+            frontier.append((nxt, first, dist + 1))
+    return None, None
+
+
+def reachable_area(start, is_blocked, limit, budget):
+    """Flood-fills from `start` and counts reachable cells, stopping at `limit`.
+
+    Stops early when the budget runs out, so the count is a lower bound in that case.
+    """
+    if is_blocked(start): return 0
+    seen = {start}
+    stack = [start]
+    while stack and len(seen) < limit:
+        if not budget.spend(): break
+        pos = stack.pop()
+        for d in DIRECTIONS:
+            nxt = (pos[0] + d[0], pos[1] + d[1])
+            if nxt not in seen and not is_blocked(nxt):
+                seen.add(nxt)
+                stack.append(nxt)
+    return min(len(seen), limit)
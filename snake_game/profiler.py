@@ -0,0 +1,159 @@
+import csv
+import time
+from collections import deque
+import pygame
+from . import settings as s
+from .graphics.ui import draw_text
+
+# Known phases, in frame order (also the CSV column order)
+PHASES = (
+    "events",
+    "background_update", "hazards", "snakes", "food", "powerups", "particles_update",
+    "background_draw", "projection", "entities_draw", "particles_draw", "hud", "flip",
+    "frame",
+)
+COUNT_KEYS = ("snake_segments", "particles", "hazards", "powerups", "food", "sprite_cache")
+
+class _Scope:
+    """Reusable context manager that adds its elapsed time to one phase."""
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        current = self.profiler.current
+        current[self.name] = current.get(self.name, 0.0) + (time.perf_counter() - self.start) * 1000
+
+
+class _NullScope:
+    __slots__ = ()
+    def __enter__(self): return self
+    def __exit__(self, *exc): return False
+
+class NullProfiler:
+    """Profiler stand-in for headless runs: scopes cost almost nothing and record nothing."""
+    _scope = _NullScope()
+    def scope(self, name): return self._scope
+
+NULL_PROFILER = NullProfiler()
+
+
+class FrameProfiler:
+    """Per-phase frame timings with rolling histories, an on-screen overlay and CSV export.
+
+    Wrap each phase in `with profiler.scope("name"):`, then call end_frame() once per
+    frame to roll the timings into the history (and the CSV file, if enabled).
+    """
+    def __init__(self, history=s.PROFILER_HISTORY_FRAMES, csv_path=s.PROFILER_CSV_PATH):
+        self.history = {name: deque(maxlen=history) for name in PHASES}
+        self.current = {}
+        self.counts = {}
+        self.frame_index = 0
+        self.overlay_visible = False
+        self._scopes = {}
+        self._backdrop = None
+        self._csv_file = None
+        self._csv_writer = None
+        if csv_path: self.start_csv(csv_path)
+
+    def scope(self, name):
+        scope = self._scopes.get(name)
+        if scope is None:
+            scope = self._scopes[name] = _Scope(self, name)
+        return scope
+
+    def end_frame(self, counts=None):
+        """Commits this frame's timings (and entity counts) and starts a new frame."""
+        for name, samples in self.history.items():
+            samples.append(self.current.get(name, 0.0))
+        self.counts = counts or {}
+        if self._csv_writer:
+            self._csv_writer.writerow([self.frame_index]
+                                      + [f"{self.current.get(name, 0.0):.4f}" for name in PHASES]
+                                      + [self.counts.get(key, "") for key in COUNT_KEYS])
+        self.current = {}
+        self.frame_index += 1
+
+    # --- Statistics ---
+    def stats(self, name):
+        """Returns (average, p95, max) in ms over the rolling history of a phase."""
+        samples = self.history[name]
+        if not samples: return 0.0, 0.0, 0.0
+        ordered = sorted(samples)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        return sum(ordered) / len(ordered), p95, ordered[-1]
+
+    def histogram(self, name, bin_ms=2.0, bins=12):
+        """Bucket counts of a phase's rolling history; the last bucket collects overflow."""
+        counts = [0] * bins
+        for value in self.history[name]:
+            counts[min(bins - 1, int(value / bin_ms))] += 1
+        return counts
+
+    # --- CSV export ---
+    def start_csv(self, csv_path):
+        self.stop_csv()
+        try:
+            self._csv_file = open(csv_path, "w", newline="")
+        except IOError:
+            print(f"Warning: Could not open profiler CSV file: {csv_path}")
+            return
+        self._csv_writer = csv.writer(self._csv_file)
+        self._csv_writer.writerow(["frame"] + [f"{name}_ms" for name in PHASES] + list(COUNT_KEYS))
+
+    def stop_csv(self):
+        if self._csv_file:
+            self._csv_file.close()
+        self._csv_file = None
+        self._csv_writer = None
+
+    # --- Overlay ---
+    def toggle_overlay(self):
+        self.overlay_visible = not self.overlay_visible
+
+    def draw_overlay(self, surface):
+        """Draws per-phase avg/p95/max ms, entity counts and a frame-time histogram. Returns the panel rect."""
+        if not self.overlay_visible: return None
+        row_h = 16
+        panel = pygame.Rect(s.WIDTH - 330, 40, 320, (len(PHASES) + 4) * row_h + 60)
+        if self._backdrop is None: # Built once, reused every frame
+            self._backdrop = pygame.Surface(panel.size, pygame.SRCALPHA)
+            self._backdrop.fill((0, 0, 0, 170))
+        surface.blit(self._backdrop, panel.topleft)
+
+        x, y = panel.x + 8, panel.y + 6
+        columns = (x + 150, x + 205, x + 260) # avg, p95, max
+        draw_text(surface, "phase (ms)", 18, x, y, shadow_color=None)
+        for col_x, label in zip(columns, ("avg", "p95", "max")):
+            draw_text(surface, label, 18, col_x, y, shadow_color=None)
+        for name in PHASES:
+            y += row_h
+            over_budget = name == "frame" and self.stats(name)[1] > 1000.0 / s.FPS
+            color = (255, 120, 120) if over_budget else s.UI_TEXT_COLOR
+            draw_text(surface, name, 18, x, y, color=color, shadow_color=None)
+            for col_x, value in zip(columns, self.stats(name)):
+                draw_text(surface, f"{value:.2f}", 18, col_x, y, color=color, shadow_color=None, cache=False)
+
+        y += row_h + 4
+        counts = "  ".join(f"{key}={self.counts.get(key, 0)}" for key in COUNT_KEYS[:4])
+        draw_text(surface, counts, 16, x, y, shadow_color=None, cache=False)
+        y += row_h
+        draw_text(surface, f"sprite_cache={self.counts.get('sprite_cache', 0)}", 16, x, y, shadow_color=None, cache=False)
+
+        # Frame-time histogram, 2 ms buckets
+        y += row_h + 4
+        buckets = self.histogram("frame")
+        tallest = max(buckets) or 1
+        bar_w = (panel.width - 16) // len(buckets)
+        for i, count in enumerate(buckets):
+            bar_h = int(40 * count / tallest)
+            color = (255, 120, 120) if (i + 1) * 2.0 > 1000.0 / s.FPS else (120, 220, 150)
+            pygame.draw.rect(surface, color, (x + i * bar_w, y + 40 - bar_h, bar_w - 2, bar_h))
+        return panel
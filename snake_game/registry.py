@@ -0,0 +1,228 @@
+import math
+import numpy as np
+from . import utils
+
+HANDLE_ID_BITS = 32 # A handle packs (generation << HANDLE_ID_BITS) | slot id
+
+class KindView:
+    """View of one entity in an EntityRegistry, as the chunk index and renderer see it.
+
+    Holds no state of its own: fields are read from the registry's row for its slot.
+    Each kind subclasses it for its own type alias and draw().
+    """
+    def __init__(self, registry, slot):
+        self.registry = registry
+        self.slot = slot
+
+    @property
+    def e_type(self):
+        return self.registry.types[self.registry.row(self.slot)]
+
+    @property
+    def grid_pos(self):
+        return self.registry.cells[self.registry.row(self.slot)]
+
+    @property
+    def visual_pos(self):
+        return self.registry.visual_pos[self.registry.row(self.slot)]
+
+    @property
+    def age(self):
+        return self.registry.age.item(self.registry.row(self.slot))
+
+    @property
+    def lifetime(self):
+        return self.registry.lifetime.item(self.registry.row(self.slot))
+
+    @lifetime.setter
+    def lifetime(self, seconds):
+        self.registry.lifetime[self.registry.row(self.slot)] = seconds
+
+    @property
+    def phase(self):
+        return self.registry.phase.item(self.registry.row(self.slot))
+
+    def screen_points(self):
+        """Screen position handed to the projection stage."""
+        return (self.visual_pos,)
+
+    previous_screen_points = screen_points # Never moves, so there's nothing to interpolate
+
+
+class EntityRegistry:
+    """Compact store of one kind of 1-cell board entity (hazards, powerups) as parallel arrays.
+
+    Live entities occupy the first `count` rows of the dense arrays. Removal swaps the
+    last row into the hole, so the rows stay packed and per-tick aging and pulsing are one
+    NumPy pass with no per-tick list rebuilding. `by_cell` finds the entity on a cell in O(1).
+
+    Callers hold handles instead of rows: a slot id plus the slot's generation, which is
+    bumped when the entity goes away, so a stale handle is detected rather than aliasing a
+    newer entity. Each slot has one view object (`view_class(registry, slot)`, a KindView
+    subclass), created on first use and reused, that the chunk index and renderer see as the entity.
+
+    Subclasses roll their own spawns (keeping the game's RNG draw order) and call add().
+    """
+    def __init__(self, game, kind, view_class, capacity=64):
+        self.game = game
+        self.kind = kind # Occupancy grid / chunk index layer
+        self.view_class = view_class
+        self.count = 0
+        # Dense rows
+        self.cells = [] # Row -> grid cell
+        self.visual_pos = [] # Row -> world pixel centre
+        self.types = [] # Row -> type name
+        self.ids = [] # Row -> slot id
+        self.age = np.zeros(capacity)
+        self.lifetime = np.zeros(capacity)
+        self.phase = np.zeros(capacity) # Animation phase (powerup pulse)
+        self.order = np.zeros(capacity, dtype=np.int64) # Spawn sequence, to expire in spawn order
+        self._spawned = 0
+        # Sparse slots
+        self._row = [] # Slot id -> row (-1 while free)
+        self._gen = [] # Slot id -> generation
+        self._views = [] # Slot id -> reused view
+        self._free_ids = []
+        self.by_cell = {} # Cell -> slot id
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        """Views of the live entities (row order, which changes as entities are removed)."""
+        views = self._views
+        return iter([views[slot] for slot in self.ids])
+
+    def _grow(self):
+        capacity = len(self.age) * 2
+        for name in ("age", "lifetime", "phase", "order"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    # --- Handles ---
+    def handle(self, slot):
+        return (self._gen[slot] << HANDLE_ID_BITS) | slot
+
+    def _slot(self, handle):
+        """Slot id of a live handle, or None if it is stale."""
+        slot = handle & ((1 << HANDLE_ID_BITS) - 1)
+        if slot >= len(self._gen) or self._gen[slot] != handle >> HANDLE_ID_BITS or self._row[slot] < 0:
+            return None
+        return slot
+
+    def is_alive(self, handle):
+        return self._slot(handle) is not None
+
+    def view(self, handle):
+        """The entity's view, or None for a stale handle."""
+        slot = self._slot(handle)
+        return self._views[slot] if slot is not None else None
+
+    def row(self, slot):
+        """Current dense row of a live slot (views read their fields through it)."""
+        return self._row[slot]
+
+    def type_at(self, cell):
+        """Type of the entity on `cell`, or None."""
+        slot = self.by_cell.get(cell)
+        return self.types[self._row[slot]] if slot is not None else None
+
+    def handle_at(self, cell):
+        """Handle of the entity on `cell`, or None."""
+        slot = self.by_cell.get(cell)
+        return self.handle(slot) if slot is not None else None
+
+    # --- Adding and removing ---
+    def add(self, cell, e_type, lifetime=math.inf, phase=0.0):
+        """Places an entity on a free `cell`, registering it in the grid and chunk index. Returns its handle."""
+        if self.count == len(self.age): self._grow()
+        if self._free_ids:
+            slot = self._free_ids.pop()
+        else:
+            slot = len(self._row)
+            self._row.append(-1)
+            self._gen.append(0)
+            self._views.append(self.view_class(self, slot))
+        row = self.count
+        self.count += 1
+        self._row[slot] = row
+        self.ids.append(slot)
+        self.cells.append(cell)
+        self.visual_pos.append(utils.grid_to_screen(cell))
+        self.types.append(e_type)
+        self.age[row] = 0.0
+        self.lifetime[row] = lifetime
+        self.phase[row] = phase
+        self.order[row] = self._spawned
+        self._spawned += 1
+        self.by_cell[cell] = slot
+        self.game.grid.add(self.kind, cell)
+        self.game.chunks.add(self.kind, cell, self._views[slot])
+        return self.handle(slot)
+
+    def remove(self, handle):
+        """Removes the entity, freeing its cell. Returns False for a stale handle."""
+        slot = self._slot(handle)
+        if slot is None: return False
+        self._remove_slot(slot)
+        return True
+
+    def _remove_slot(self, slot):
+        row = self._row[slot]
+        cell = self.cells[row]
+        self.game.grid.remove(self.kind, cell)
+        self.game.chunks.remove(self.kind, cell, self._views[slot])
+        del self.by_cell[cell]
+        # Swap the last row into the hole
+        last = self.count - 1
+        if row != last:
+            moved = self.ids[last]
+            self.ids[row] = moved
+            self.cells[row] = self.cells[last]
+            self.visual_pos[row] = self.visual_pos[last]
+            self.types[row] = self.types[last]
+            for arr in (self.age, self.lifetime, self.phase, self.order):
+                arr[row] = arr[last]
+            self._row[moved] = row
+        self.ids.pop()
+        self.cells.pop()
+        self.visual_pos.pop()
+        self.types.pop()
+        self.count = last
+        self._row[slot] = -1
+        self._gen[slot] += 1 # Invalidates outstanding handles
+        self._free_ids.append(slot)
+
+    def clear(self):
+        """Forgets every entity without touching the grid or chunks (cleared by the game first)."""
+        for slot in self.ids:
+            self._row[slot] = -1
+            self._gen[slot] += 1
+            self._free_ids.append(slot)
+        self.ids.clear()
+        self.cells.clear()
+        self.visual_pos.clear()
+        self.types.clear()
+        self.by_cell.clear()
+        self.count = 0
+
+    # --- Bulk updates ---
+    def age_all(self, dt):
+        """Ages every entity by `dt` and removes the expired ones, oldest spawn first. Returns how many expired."""
+        n = self.count
+        if not n: return 0
+        self.age[:n] += dt
+        expired = np.flatnonzero(self.age[:n] >= self.lifetime[:n])
+        if not len(expired): return 0
+        # Free cells in spawn order, so the grid's free list evolves as it always has
+        slots = [self.ids[row] for row in sorted(expired.tolist(), key=lambda row: self.order[row])]
+        for slot in slots:
+            self._remove_slot(slot)
+        return len(slots)
+
+    def advance_phase(self, dt, rate):
+        """Advances every entity's animation phase by `dt * rate` radians."""
+        n = self.count
+        if n: self.phase[:n] = (self.phase[:n] + dt * rate) % (2 * math.pi)
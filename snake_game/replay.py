@@ -0,0 +1,96 @@
+import json
+import struct
+import sys
+import zlib
+
+from . import settings as s
+from .pathfinding import DIRECTIONS
+from .simulation import SimulationCore
+
+# File layout: MAGIC, header (version, metadata length), JSON metadata, zlib-compressed tick records
+MAGIC = b"SNKR"
+VERSION = 2 # 2: snake step timers keep their remainder, so version 1 games no longer re-simulate
+_HEADER = struct.Struct("<HI")
+_TICK = struct.Struct("<dB") # dt in seconds, player steering code (index into DIRECTIONS)
+
+class ReplayRecorder:
+    """Records a game's seed and per-tick player input so it can be re-simulated exactly.
+
+    Attach it as `core.recorder`; the core calls begin() on each new game and
+    record_tick() at the start of every simulated tick.
+    """
+    def __init__(self):
+        self.seed = None
+        self.ticks = bytearray()
+        self.tick_count = 0
+
+    def begin(self, seed):
+        self.seed = seed
+        self.ticks = bytearray()
+        self.tick_count = 0
+
+    def record_tick(self, core, dt):
+        """Stores the tick's dt and the steering the player snake will apply this tick."""
+        code = DIRECTIONS.index(core.player_snake.next_direction) if core.player_snake else 0
+        self.ticks += _TICK.pack(dt, code)
+        self.tick_count += 1
+
+    def save(self, file_path, core=None):
+        """Writes the replay. Passing the core stores its final score and reason for verification."""
+        meta = {"seed": self.seed, "ticks": self.tick_count}
+        if core is not None:
+            meta.update(score=core.score, reason=core.game_over_reason)
+        meta_bytes = json.dumps(meta).encode("utf-8")
+        with open(file_path, "wb") as f:
+            f.write(MAGIC)
+            f.write(_HEADER.pack(VERSION, len(meta_bytes)))
+            f.write(meta_bytes)
+            f.write(zlib.compress(bytes(self.ticks), 9))
+
+
+class ReplayPlayer:
+    """Loads a replay file and re-simulates it headless."""
+    def __init__(self, meta, ticks):
+        self.meta = meta
+        self.ticks = ticks # List of (dt, steering code)
+
+    @classmethod
+    def load(cls, file_path):
+        with open(file_path, "rb") as f:
+            data = f.read()
+        if data[:4] != MAGIC:
+            raise ValueError(f"Not a replay file: {file_path}")
+        version, meta_len = _HEADER.unpack_from(data, 4)
+        if version != VERSION:
+            raise ValueError(f"Unsupported replay version {version} in {file_path}")
+        body_start = 4 + _HEADER.size
+        meta = json.loads(data[body_start:body_start + meta_len].decode("utf-8"))
+        ticks = list(_TICK.iter_unpack(zlib.decompress(data[body_start + meta_len:])))
+        return cls(meta, ticks)
+
+    def play(self, core=None):
+        """Re-simulates the recorded game on `core` (a fresh SimulationCore by default) and returns it."""
+        if core is None: core = SimulationCore()
+        core.start_new_game(seed=self.meta["seed"])
+        for dt, code in self.ticks:
+            if core.game_state != "PLAYING": break
+            core.player_snake.next_direction = DIRECTIONS[code]
+            core.update(dt)
+        return core
+
+
+def main(argv=None):
+    """Re-simulates a replay file and checks it against the recorded result."""
+    argv = sys.argv[1:] if argv is None else argv
+    file_path = argv[0] if argv else s.REPLAY_FILE
+    player = ReplayPlayer.load(file_path)
+    core = player.play()
+    print(f"Replayed {core.tick_count} ticks: score {core.score}, reason: {core.game_over_reason}")
+    recorded = player.meta
+    if "score" in recorded and (recorded["score"], recorded["reason"]) != (core.score, core.game_over_reason):
+        print(f"Mismatch! Recorded score {recorded['score']}, reason: {recorded['reason']}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,7 +6,13 @@ HEIGHT = 720
 GRID_SIZE = 30
 GRID_WIDTH = WIDTH // GRID_SIZE
 GRID_HEIGHT = HEIGHT // GRID_SIZE
-FPS = 60
+# World size in cells; anything larger than the screen grid scrolls with a camera following the player
+WORLD_GRID_WIDTH = GRID_WIDTH
+WORLD_GRID_HEIGHT = GRID_HEIGHT
+CHUNK_SIZE = 16 # Cells per side of the spatial index chunks used to find on-screen entities
+FPS = 60 # Render frame cap
+SIMULATION_HZ = 60 # Fixed game-rule tick rate, independent of the render rate
+MAX_CATCHUP_TICKS = 5 # Most ticks run in one frame after a stall; the rest of the backlog is dropped
 
 # Colors (Bio-luminescent Theme)
 DARK_BG = (5, 10, 20)
@@ -39,16 +45,21 @@ BORDER_THICKNESS = 5
 SNAKE_START_LEN = 3
 SNAKE_SPEED_BASE = 10.5 # Updates per second (Increased Speed)
 COMPETITOR_SPEED_BASE = 8 # AI snake speed
+COMPETITOR_COUNT = 1 # AI snakes per game (arena mode: dozens to hundreds, in a large world)
+AI_MODE = "greedy" # "greedy" (Manhattan distance) or "pathfinding" (BFS + flood-fill safety; opt-in, much costlier per decision)
+AI_NODE_BUDGET = 2000 # Max grid nodes the pathfinding AI may expand per decision
 INTERPOLATION_SPEED = 0.3
 COMBO_TIME_LIMIT = 2.0
+FOOD_COUNT = 1 # Food items kept on the board (raise for arenas in large worlds)
 FRENZY_THRESHOLD = 10
 FRENZY_DURATION = 8.0
+FRENZY_FOOD_BURST = 0 # Extra food items spawned when frenzy starts (not replaced once eaten)
 POWERUP_DURATION = 10.0
-HAZARD_SPAWN_CHANCE = 0.005
+HAZARD_SPAWN_CHANCE = 0.005 # Per simulation tick
 HAZARD_LIFETIME_MIN = 5.0
 HAZARD_LIFETIME_MAX = 15.0
 HAZARD_MAX_COUNT = 5 # Limit number of hazards
-POWERUP_SPAWN_CHANCE = 0.003
+POWERUP_SPAWN_CHANCE = 0.003 # Per simulation tick
 POWERUP_MAX_COUNT = 3 # Limit number of powerups
 MAGNET_RANGE_GRID = 7 # Range in grid units
 MAGNET_PULL_SPEED_CLOSE = 150 # Speed when very close
@@ -58,9 +69,35 @@ MAGNET_PULL_SPEED_FAR = 30 # Speed at max range
 MIN_SCALE = 0.8
 MAX_SCALE = 1.2
 
+# Audio
+SOUND_CHANNELS = 8 # Mixer channels in the sound effect pool
+SOUND_VOICE_LIMITS = {"eat": 2, "combo": 2, "powerup": 2, "event": 1} # Max simultaneous voices per category
+SOUND_PRIORITIES = {"event": 3, "powerup": 2, "combo": 1, "eat": 0} # A full pool steals voices ranked no higher
+SOUND_MIN_INTERVAL = 0.05 # Seconds before the same sound may retrigger
+AMBIENT_VOLUME = 0.3 # Streamed ambient loop (SOUND_AMBIENT_PATH)
+
+# Rendering
+SPRITE_CACHE_SIZE = 1024 # Max pre-rendered glow sprites kept (LRU eviction)
+SEGMENT_SPRITE_CACHE_SIZE = 2048 # Max pre-rendered snake segment sprites kept (LRU eviction)
+PARTICLE_CAPACITY = 8192 # Preallocated particle pool size
+PARTICLE_COUNT_MULTIPLIER = 1 # Scales particles spawned per effect
+FIREFLY_COUNT = 100 # Background fireflies (vectorized, thousands are fine)
+FIREFLY_BRIGHTNESS_LEVELS = 16 # Pre-baked glow sprites per firefly size
+TEXT_CACHE_SIZE = 512 # Max rendered text strings kept (LRU eviction)
+DIRTY_RECTS = False # Redraw and push only the screen regions that changed (helps software rendering)
+DIRTY_TILE_SIZE = 32 # Granularity (px) of dirty-region tracking
+DIRTY_MAX_COVERAGE = 0.5 # Above this fraction of the screen dirty, do a full redraw + flip instead
+
+# Profiling (toggle the in-game overlay with F3)
+PROFILER_HISTORY_FRAMES = 240 # Rolling window for per-phase stats and histograms
+STARTUP_REPORT = False # Print a startup-time breakdown (imports, init stages, background loading) once assets are ready
+PROFILER_CSV_PATH = None # Set a path (e.g. "frame_times.csv") to dump per-frame phase timings
+
 # File Paths (relative to project root often, adjust as needed)
 ASSET_DIR = "assets" # Base asset directory name
 HIGHSCORE_FILE = f"{ASSET_DIR}/data/snake_highscore.json"
+REPLAY_FILE = f"{ASSET_DIR}/data/last_game.snkr" # Replay of the most recent game
+RECORD_REPLAYS = True # Record each game's seed + input stream (replay with: python -m snake_game.replay)
 FONT_NAME = None # Use default pygame font if None (or specify path like f"{ASSET_DIR}/fonts/your_font.ttf")
 # Add paths for images/sounds if you load them, e.g.:
 # BACKGROUND_IMG_PATH = f"{ASSET_DIR}/images/background.png"
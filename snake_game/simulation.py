@@ -0,0 +1,333 @@
+import random
+import math
+
+# Import settings and utilities
+from . import settings as s
+from . import utils
+from .grid import OccupancyGrid
+from .chunks import ChunkIndex
+from .profiler import NULL_PROFILER
+
+# Import entity classes using relative paths
+from .entities.snake import Snake
+from .entities.food import FoodField
+from .entities.powerup import PowerUpRegistry
+from .entities.hazard import HazardRegistry
+
+class SimulationCore:
+    """Runs the full game rules without a display, mixer or wall clock.
+
+    The core is advanced by explicit ticks, so it can fast-forward games headless.
+    `Game` subclasses it and adds rendering, input, sound and particles on top.
+
+    All randomness comes from per-game seeded streams: `rng` for gameplay and
+    `fx_rng` for cosmetics, so a seed plus the player's input stream reproduces a
+    game exactly (see replay.py).
+    """
+    tracks_visuals = False # Headless runs skip purely visual work (interpolation, magnet pull)
+
+    def __init__(self, seed=None):
+        """Initializes the rule state. Touches no pygame subsystem.
+
+        `seed` seeds the sequence of per-game seeds; None draws it from the OS.
+        """
+        self.game_state = "MENU" # MENU, PLAYING, GAME_OVER
+
+        # Random streams (reseeded per game in start_new_game)
+        self._seed_source = random.Random(seed) # Draws one seed per game
+        self.game_seed = None
+        self.rng = random.Random() # Gameplay stream: spawns, lifetimes, start directions
+        self.fx_rng = random.Random() # Cosmetic stream: pulses, particles, shake
+        self.recorder = None # Optional ReplayRecorder capturing the per-tick input stream
+        self.profiler = NULL_PROFILER # Game swaps in a FrameProfiler
+
+        # Game elements
+        self.player_snake = None
+        self.competitors = [] # AI snakes
+        self.snakes = [] # Roster in update order: the player, then the competitors
+        self.snake_heads = {} # Head cell -> living snake, for O(1) head-on and eating checks
+        self.food = None # FoodField holding every food item
+        self.powerups = PowerUpRegistry(self) # Array-backed, addressed by generation-tagged handles
+        self.hazards = HazardRegistry(self)
+        self.grid = OccupancyGrid(s.WORLD_GRID_WIDTH, s.WORLD_GRID_HEIGHT) # Shared cell occupancy for collisions and spawns
+        self.chunks = ChunkIndex((self.grid.width, self.grid.height)) # Food, powerups and hazards by world chunk, for on-screen queries
+
+        # Scoring and state
+        self.score = 0
+        self.high_score = 0
+        self.is_new_highscore = False
+        self.game_over_reason = None
+        self.combo_count = 0
+        self.last_eat_time = 0
+        self.combo_timer = 0
+        self.frenzy_active = False
+        self.frenzy_timer = 0
+        self.effective_speed_multiplier = 1.0 # For player speed mods
+
+        # Simulation clock (replaces pygame.time.get_ticks for rules)
+        self.tick_count = 0
+        self.time = 0.0 # Seconds of simulated time in the current game
+
+
+    # --- Presentation hooks (no-ops when headless, overridden by Game) ---
+    def _play_sound(self, name):
+        """Hook for sound playback. The headless core is silent."""
+        pass
+
+    def spawn_particles(self, pos, count, color):
+        """Hook for particle effects. The headless core has no particles."""
+        pass
+
+
+    def start_new_game(self, seed=None):
+        """Resets the game state for a new round, seeding it with `seed` (or the next seed in sequence)."""
+        if seed is None: seed = self._seed_source.getrandbits(64)
+        self.game_seed = seed
+        self.rng.seed(seed)
+        self.fx_rng.seed(seed ^ 0x5EED_F00D) # Independent stream so cosmetic draws never shift gameplay
+        if self.recorder: self.recorder.begin(seed)
+
+        self.score = 0
+        self.grid.clear() # Snakes, food, hazards and powerups re-register below
+        self.chunks.clear()
+        self.snake_heads.clear()
+        # Create or reset snakes
+        if self.player_snake is None:
+             self.player_snake = Snake(self, is_player=True)
+        else:
+             self.player_snake.reset()
+
+        starts = self._competitor_starts(s.COMPETITOR_COUNT)
+        del self.competitors[len(starts):]
+        for i, start_pos in enumerate(starts):
+            if i < len(self.competitors):
+                self.competitors[i].start_pos = start_pos
+                self.competitors[i].reset()
+            else:
+                self.competitors.append(Snake(self, is_player=False, start_pos=start_pos))
+        self.snakes = [self.player_snake] + self.competitors
+
+        # Clear lists and reset state variables
+        self.powerups.clear()
+        self.hazards.clear()
+        self.combo_count = 0
+        self.last_eat_time = 0
+        self.combo_timer = 0
+        self.frenzy_active = False
+        self.frenzy_timer = 0
+        self.effective_speed_multiplier = 1.0
+        self.is_new_highscore = False
+        self.game_over_reason = None
+        self.tick_count = 0
+        self.time = 0.0
+
+        # Create initial food items *after* resetting snakes
+        self.food = FoodField(self)
+
+        self.game_state = "PLAYING"
+
+
+    def _competitor_starts(self, count):
+        """Start cells for `count` AI snakes: the classic spot for the first, then a lattice over the world."""
+        width, height = self.grid.width, self.grid.height
+        taken = {self.player_snake.start_pos}
+        starts = []
+        if count: starts.append((width * 3 // 4, height // 2))
+        side = math.ceil(math.sqrt(count + 2)) # Room to skip the two cells already taken
+        for i in range(side * side):
+            if len(starts) >= count: break
+            cell = (width * (2 * (i % side) + 1) // (2 * side), height * (2 * (i // side) + 1) // (2 * side))
+            if cell not in taken and cell not in starts: starts.append(cell)
+        return starts
+
+
+    def trigger_game_over(self, reason="unknown"):
+        """Transitions to the Game Over state. Returns True if this call ended the game."""
+        if self.game_state != "PLAYING": # Prevent multiple triggers
+            return False
+        self.game_state = "GAME_OVER"
+        self.game_over_reason = reason
+        self.is_new_highscore = self.score > self.high_score
+        if self.is_new_highscore:
+            self.high_score = self.score
+        return True
+
+
+    def advance(self, ticks, dt=None):
+        """Steps the simulation by up to `ticks` ticks of `dt` seconds (default 1/SIMULATION_HZ).
+
+        Stops early once the game is no longer PLAYING. Returns the number of ticks run.
+        """
+        if dt is None: dt = 1.0 / s.SIMULATION_HZ
+        for tick in range(ticks):
+            if self.game_state != "PLAYING":
+                return tick
+            self.update(dt)
+        return ticks
+
+
+    def update(self, dt):
+        """Updates all game rules by one tick of `dt` seconds."""
+        if self.game_state != "PLAYING":
+            return # Don't update game elements if not playing
+
+        if self.recorder: self.recorder.record_tick(self, dt) # Capture input before it is applied
+        self.tick_count += 1
+        self.time += dt
+
+        profiler = self.profiler
+        with profiler.scope("hazards"):
+            self._update_spawns_and_hazards(dt)
+        self._update_frenzy(dt)
+        with profiler.scope("snakes"):
+            self._update_snakes(dt)
+        with profiler.scope("food"):
+            self._update_food(dt)
+        with profiler.scope("powerups"):
+            self._update_powerups(dt)
+
+
+    def _update_spawns_and_hazards(self, dt):
+        """Rolls hazard/powerup spawns, applies hazard speed modifiers and expires hazards."""
+        # --- Spawn Hazards & Powerups ---
+        if self.rng.random() < s.HAZARD_SPAWN_CHANCE * (1 + int(self.frenzy_active)):
+             if len(self.hazards) < s.HAZARD_MAX_COUNT:
+                 self.hazards.spawn() # Does nothing if the board is full
+
+        if self.rng.random() < s.POWERUP_SPAWN_CHANCE:
+             if len(self.powerups) < s.POWERUP_MAX_COUNT:
+                 self.powerups.spawn() # Does nothing if the board is full
+
+
+        # --- Update Hazard Speed Modifiers & Lifetime ---
+        hazard_speed_modifier = 1.0
+        if self.player_snake and self.player_snake.alive:
+            current_snake_grid_pos = self.player_snake.grid_pos[0]
+            # Note: Mist/Current speed logic remains but these types aren't spawned
+            h_type = self.hazards.type_at(current_snake_grid_pos) # O(1) cell lookup
+            if h_type == 'mist': hazard_speed_modifier *= 0.6
+            elif h_type == 'current': hazard_speed_modifier *= 1.5
+
+        # Apply speed modifiers (including frenzy) to player snake
+        self.effective_speed_multiplier = hazard_speed_modifier
+        if self.frenzy_active:
+             self.effective_speed_multiplier *= 1.3 # Base frenzy speedup
+
+        # Age hazards and remove expired ones (freeing their cells), in one pass
+        self.hazards.update(dt)
+
+
+    def _update_frenzy(self, dt):
+        # --- Update Frenzy Mode ---
+        if self.frenzy_active:
+            self.frenzy_timer -= dt
+            if self.frenzy_timer <= 0:
+                self.frenzy_active = False
+                # Maybe play a "frenzy end" sound
+            # Spawn extra food during frenzy
+            if self.rng.random() < 0.05: # Chance per tick
+                if self.food: # Relocate one existing item
+                    items = self.food.items
+                    if items: self.food.respawn(items[self.rng.randrange(len(items))] if len(items) > 1 else items[0])
+
+
+    def _update_snakes(self, dt):
+        # --- Update Snakes ---
+        for snake in self.snakes:
+            snake.update(dt)
+
+
+    def _update_food(self, dt):
+        """Handles eating, scoring, combos and frenzy triggers."""
+        # --- Check Food Collision ---
+        if self.food:
+            self.food.retry_unplaced() # Board was full last time, retry now that cells may have freed up
+            # One cell lookup per head; heads never share a cell, so each item has at most one eater
+            for head, eater in list(self.snake_heads.items()):
+                food = self.food.at(head)
+                if food: self._eat(eater, food)
+
+
+        # --- Update Combo Timer Decay ---
+        if self.combo_timer > 0:
+             self.combo_timer -= dt
+             if self.combo_timer <= 0:
+                 self.combo_count = 0 # Combo expired
+
+
+    def _eat(self, eater, food):
+        """Grows the snake that ate `food`, scores it for the player and replaces the item."""
+        eater.grow()
+        self.spawn_particles(food.visual_pos, 20, s.FOOD_COLOR) # Use settings color
+        self.food.eat(food) # Respawn it, or remove it if it was an extra from a burst
+        self._play_sound("eat") # Play basic eat sound
+
+        # Handle player-specific scoring and combo logic
+        if eater.is_player:
+            base_score = 10
+            combo_bonus = self.combo_count * 5
+            multiplier = 2 if self.player_snake.multiplier_active else 1
+            self.score += (base_score + combo_bonus) * multiplier
+
+            # Combo Logic (timed on the simulation clock)
+            current_time = self.time
+            if current_time - self.last_eat_time <= s.COMBO_TIME_LIMIT:
+                self.combo_count += 1
+                # Play combo sound based on count (capped)
+                combo_sound_level = min(self.combo_count, 5) # Max level 5 for sound example
+                self._play_sound(f"combo_{combo_sound_level}") # Assumes sounds combo_1, combo_2... exist
+            else:
+                self.combo_count = 1 # Reset combo but count this eat
+
+            self.last_eat_time = current_time
+            self.combo_timer = s.COMBO_TIME_LIMIT # Reset visual timer
+
+            # Check for Frenzy Trigger
+            if not self.frenzy_active and self.combo_count >= s.FRENZY_THRESHOLD:
+                self.frenzy_active = True
+                self.frenzy_timer = s.FRENZY_DURATION
+                self.food.spawn(s.FRENZY_FOOD_BURST) # Burst of extra items, gone once eaten
+                # Maybe play frenzy start sound
+
+
+    def _update_powerups(self, dt):
+        """Updates powerups, player pickups and the magnet pull."""
+        # --- Update Powerups & Check Player Collision/Magnet ---
+        if self.player_snake and self.player_snake.alive:
+            player_head_grid = self.player_snake.grid_pos[0]
+            self.powerups.update(dt) # Pulse animations, all at once
+            handle = self.powerups.handle_at(player_head_grid)
+            if handle is not None:
+                powerup = self.powerups.view(handle)
+                p_type, visual_pos, color = powerup.p_type, powerup.visual_pos, powerup.color
+                self.powerups.remove(handle) # Frees the cell; the view now belongs to the free slot
+                self.player_snake.activate_powerup(p_type)
+                self.spawn_particles(visual_pos, 15, color)
+                self._play_sound("powerup")
+
+            # --- Update Orb Magnet Effect (visual only, skipped headless) ---
+            pulled = None
+            if self.tracks_visuals and self.player_snake.magnet_active and self.food:
+                # Pulls the nearest item; twice the range in Manhattan distance covers the circle
+                pulled = self.food.nearest(player_head_grid, s.MAGNET_RANGE_GRID * 2)
+            if pulled and pulled.visual_pos:
+                magnet_range_pixels = s.GRID_SIZE * s.MAGNET_RANGE_GRID
+                magnet_radius_sq = magnet_range_pixels**2
+                head_pos = self.player_snake.visual_pos[0]
+                food_pos = list(pulled.visual_pos)
+                dx, dy = head_pos[0] - food_pos[0], head_pos[1] - food_pos[1]
+                dist_sq = dx*dx + dy*dy
+
+                if 0 < dist_sq < magnet_radius_sq: # Check if within range
+                    dist = math.sqrt(dist_sq)
+                    normalized_dist = min(1.0, dist / magnet_range_pixels) # Clamp normalized distance
+                    # Interpolate speed based on distance
+                    move_speed = utils.lerp(s.MAGNET_PULL_SPEED_CLOSE, s.MAGNET_PULL_SPEED_FAR, normalized_dist)
+
+                    # Calculate movement vector and apply
+                    move_x = (dx / dist) * move_speed * dt
+                    move_y = (dy / dist) * move_speed * dt
+                    food_pos[0] += move_x
+                    food_pos[1] += move_y
+                    pulled.visual_pos = tuple(food_pos)
+                    # Could add logic to snap food's grid_pos if visual pos gets very close
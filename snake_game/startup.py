@@ -0,0 +1,106 @@
+"""Staged startup: only the pygame modules the first frame needs, then everything else on a thread.
+
+Game opens the display and font modules and draws the menu straight away, while an
+AssetLoader opens the mixer, decodes sounds (into a SoundManager), opens fonts and
+renders sprites in the background. Fonts and sprites go into the loader's own dicts,
+which the main thread merges into the shared caches (Game.poll_assets), so the thread
+never writes state the renderer reads. StartupReport times both sides (set
+STARTUP_REPORT in settings.py to print it).
+"""
+import threading
+import time
+from contextlib import contextmanager
+import pygame
+
+from . import settings as s
+from . import utils
+from .graphics.ui import warm_fonts
+from .entities.food import warm_sprites as warm_food_sprites
+from .audio.sound_manager import SoundManager
+
+class StartupReport:
+    """Wall-clock breakdown of startup, in ms, measured from `started` (a perf_counter reading)."""
+    def __init__(self, started=None):
+        self.started = started if started is not None else time.perf_counter()
+        self.stages = [] # (name, ms) on the main thread, in order
+        self.background = [] # (name, ms) on the loader thread
+        self.first_frame_at = None # ms from start until the first frame was shown
+        self.ready_at = None # ms from start until background loading finished
+        self.printed = False
+
+    def elapsed(self):
+        return (time.perf_counter() - self.started) * 1000
+
+    def add(self, name, ms, background=False):
+        (self.background if background else self.stages).append((name, ms))
+
+    @contextmanager
+    def stage(self, name, background=False):
+        """Times the enclosed block as one stage."""
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, (time.perf_counter() - t0) * 1000, background)
+
+    def lines(self):
+        out = ["Startup (ms):"]
+        out += [f"  {name:<16}{ms:8.1f}" for name, ms in self.stages]
+        if self.first_frame_at is not None: out.append(f"  first frame at {self.first_frame_at:8.1f}")
+        out.append("Background loading (ms, overlaps the above):")
+        out += [f"  {name:<16}{ms:8.1f}" for name, ms in self.background]
+        if self.ready_at is not None: out.append(f"  ready at       {self.ready_at:8.1f}")
+        return out
+
+    def print(self):
+        print("\n".join(self.lines()))
+        self.printed = True
+
+
+class AssetLoader:
+    """Opens the mixer, loads sounds and warms caches on a daemon thread.
+
+    `ready` is set once loading has finished (or failed); `sound_manager`, `fonts` and
+    `food_sprites` must only be read after that. `sound_manager` stays None if audio could
+    not be opened; `fonts` (for ui.install_fonts) and `food_sprites` (a SpriteCache to
+    merge into glow_cache) stay None if warming failed. Mixer and sound decoding release
+    the GIL, so the main loop keeps drawing meanwhile.
+
+    pygame.mixer.init() runs on this thread on purpose: it is the slowest startup step.
+    Unlike the display, SDL's audio subsystem may be opened from any thread, and the
+    main thread never touches the mixer before `ready` (Game.sound stays None until
+    poll_assets hands the SoundManager over, and shutdown waits for the loader first).
+    """
+    def __init__(self, report):
+        self.report = report
+        self.ready = threading.Event()
+        self.sound_manager = None
+        self.fonts = None
+        self.food_sprites = None
+        self.thread = threading.Thread(target=self._run, name="asset-loader", daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def wait(self, timeout=None):
+        """Blocks until loading finishes. Returns False on timeout."""
+        return self.ready.wait(timeout)
+
+    def _run(self):
+        report = self.report
+        try:
+            try:
+                with report.stage("mixer init", background=True):
+                    pygame.mixer.init()
+                with report.stage("sounds", background=True):
+                    self.sound_manager = SoundManager().load()
+            except pygame.error as e:
+                print(f"Warning: Could not open audio, continuing without sound: {e}")
+            with report.stage("fonts", background=True):
+                self.fonts = warm_fonts()
+            with report.stage("sprites", background=True):
+                self.food_sprites = warm_food_sprites(utils.perspective_scales(range(s.HEIGHT)))
+        finally:
+            report.ready_at = report.elapsed()
+            self.ready.set()
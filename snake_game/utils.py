@@ -1,4 +1,4 @@
-import math
+import numpy as np
 from . import settings as s # Use 's' alias for brevity
 
 def lerp(a, b, t):
@@ -13,7 +13,6 @@ def screen_to_grid(pos):
      """Convert screen coordinates to grid coordinates"""
      return (pos[0] // s.GRID_SIZE, pos[1] // s.GRID_SIZE)
 
-def get_perspective_scale(y_coord):
-    """ Calculates a scale factor based on Y position """
-    t = max(0, min(1, y_coord / s.HEIGHT)) # Normalize y-coordinate
-    return lerp(s.MIN_SCALE, s.MAX_SCALE, t)
\ No newline at end of file
+def perspective_scales(ys):
+    """Scale factors for an array of screen Y coordinates (smaller towards the top)."""
+    return s.MIN_SCALE + (s.MAX_SCALE - s.MIN_SCALE) * np.clip(np.asarray(ys) / s.HEIGHT, 0, 1)
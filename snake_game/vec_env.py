@@ -0,0 +1,351 @@
+"""Vectorized RL environment: N independent games stepped in lockstep on NumPy arrays.
+
+    env = VecSnakeEnv(256, seed=0)
+    obs = env.reset()                      # (N, WORLD_GRID_HEIGHT, WORLD_GRID_WIDTH, len(CHANNELS)) uint8
+    obs, rewards, dones, info = env.step(actions)  # actions: (N,) indices into DIRECTIONS
+
+One step is one player move; the simulated time it covers (1 / player speed, shorter
+during frenzy) drives every timer and spawn roll. Rewards are score gained, with the
+scoring, combo and frenzy rules of SimulationCore. Finished games reset automatically.
+"""
+import numpy as np
+
+from . import settings as s
+from .pathfinding import DIRECTIONS
+
+CHANNELS = ("player_body", "player_head", "competitor_body", "competitor_head", "food", "powerup", "bomb")
+REASONS = ("", "wall", "self", "hazard: bomb", "head-on collision", "collision with competitor", "max_steps") # info["reason"] codes
+POWERUP_TYPES = tuple(s.POWERUP_COLORS) # Powerup cells hold index + 1 (0 = empty)
+PHASE, MULTIPLIER, BURST = (POWERUP_TYPES.index(p) for p in ("phase", "multiplier", "burst"))
+
+_DX = np.array([d[0] for d in DIRECTIONS])
+_DY = np.array([d[1] for d in DIRECTIONS])
+_OPPOSITE = np.array([DIRECTIONS.index((-dx, -dy)) for dx, dy in DIRECTIONS])
+_FAR = 1 << 20 # Greedy AI distance for "no food" (ties, so the heading is kept)
+_BLOCKED = 1 << 21 # Greedy AI distance for blocked moves
+
+class _SnakeBatch:
+    """One snake per game: ring-buffered bodies of flat cell indices plus an occupancy count layer."""
+    def __init__(self, num_envs, cells, capacity):
+        self.ring = np.zeros((num_envs, capacity), dtype=np.int64)
+        self.head_slot = np.zeros(num_envs, dtype=np.int64)
+        self.size = np.zeros(num_envs, dtype=np.int64) # Cells in the body
+        self.length = np.zeros(num_envs, dtype=np.int64) # Target length (size < length while growing)
+        self.direction = np.zeros(num_envs, dtype=np.int64) # Index into DIRECTIONS
+        self.alive = np.zeros(num_envs, dtype=bool)
+        self.timer = np.zeros(num_envs)
+        self.occ = np.zeros((num_envs, cells), dtype=np.int16) # A phasing snake can overlap itself
+
+    def reset(self, envs, start_cell, directions):
+        self.occ[envs] = 0
+        self.ring[envs, 0] = start_cell
+        self.head_slot[envs] = 0
+        self.size[envs] = 1
+        self.length[envs] = s.SNAKE_START_LEN
+        self.direction[envs] = directions
+        self.alive[envs] = True
+        self.timer[envs] = 0
+        self.occ[envs, start_cell] += 1
+
+    def heads(self, envs):
+        return self.ring[envs, self.head_slot[envs]]
+
+    def steer(self, envs, directions):
+        """Like Snake.change_direction: 180-degree turns are ignored."""
+        allowed = directions != _OPPOSITE[self.direction[envs]]
+        self.direction[envs[allowed]] = directions[allowed]
+
+    def advance(self, envs, cells):
+        """Pushes new heads, then pops the tails of snakes that aren't growing."""
+        capacity = self.ring.shape[1]
+        slots = (self.head_slot[envs] + 1) % capacity
+        self.ring[envs, slots] = cells
+        self.head_slot[envs] = slots
+        self.size[envs] += 1
+        self.occ[envs, cells] += 1 # One cell per game, so no index repeats
+        over = envs[self.size[envs] > self.length[envs]]
+        tails = self.ring[over, (self.head_slot[over] - self.size[over] + 1) % capacity]
+        self.occ[over, tails] -= 1
+        self.size[over] -= 1
+
+    def grow(self, envs):
+        self.length[envs] = np.minimum(self.length[envs] + 1, self.ring.shape[1])
+
+    def kill(self, envs):
+        """Kills the snakes and frees their cells."""
+        self.alive[envs] = False
+        self.occ[envs] = 0
+
+
+class VecSnakeEnv:
+    """N games of the player-vs-competitor ruleset, batched into NumPy arrays.
+
+    Follows SimulationCore and Snake.update for the classic board only: one food item,
+    one competitor and no frenzy food burst (COMPETITOR_COUNT=1, FOOD_COUNT=1,
+    FRENZY_FOOD_BURST=0; other values raise ValueError). Covers bombs, powerups (phase,
+    multiplier and burst; the magnet is visual only), combos and frenzy. The competitor
+    always uses the greedy AI, since the pathfinding AI's search doesn't batch.
+    Per-tick spawn chances are compounded over the ticks each step covers.
+    """
+    SUPPORTED = {"COMPETITOR_COUNT": 1, "FOOD_COUNT": 1, "FRENZY_FOOD_BURST": 0} # Settings the arrays assume
+
+    def __init__(self, num_envs, seed=None, max_steps=None):
+        unsupported = [f"{name}={getattr(s, name)}" for name, value in self.SUPPORTED.items() if getattr(s, name) != value]
+        if unsupported:
+            raise ValueError(f"VecSnakeEnv only supports {', '.join(f'{k}={v}' for k, v in self.SUPPORTED.items())}; got {', '.join(unsupported)}")
+        self.num_envs = num_envs
+        self.width, self.height = s.WORLD_GRID_WIDTH, s.WORLD_GRID_HEIGHT
+        self.cells = self.width * self.height
+        self.max_steps = max_steps # Episodes longer than this end with reason "max_steps"
+        self.rng = np.random.default_rng(seed)
+        self._rows = np.arange(num_envs)
+
+        self.player = _SnakeBatch(num_envs, self.cells, 2 * self.cells)
+        self.competitor = _SnakeBatch(num_envs, self.cells, 2 * self.cells)
+        self.bombs = np.zeros((num_envs, self.cells), dtype=bool)
+        self.bomb_cell = np.full((num_envs, s.HAZARD_MAX_COUNT), -1, dtype=np.int64) # Bomb slots (-1 = empty)
+        self.bomb_life = np.zeros((num_envs, s.HAZARD_MAX_COUNT)) # Seconds left per slot
+        self.powerup = np.zeros((num_envs, self.cells), dtype=np.int8)
+        self.powerup_count = np.zeros(num_envs, dtype=np.int64)
+        self.food = np.full(num_envs, -1, dtype=np.int64) # Flat cell index (-1 = board full)
+        self.powerup_timers = np.zeros((num_envs, len(POWERUP_TYPES)))
+
+        self.score = np.zeros(num_envs, dtype=np.int64)
+        self.combo_count = np.zeros(num_envs, dtype=np.int64)
+        self.combo_timer = np.zeros(num_envs)
+        self.last_eat_time = np.zeros(num_envs)
+        self.frenzy_active = np.zeros(num_envs, dtype=bool)
+        self.frenzy_timer = np.zeros(num_envs)
+        self.time = np.zeros(num_envs) # Simulated seconds in the current episode
+        self.steps = np.zeros(num_envs, dtype=np.int64)
+        self.reason = np.zeros(num_envs, dtype=np.int8) # REASONS code of this step's game over
+
+    # --- Episode control ---
+    def reset(self):
+        """Starts a new game in every env. Returns the observations."""
+        self._reset_envs(self._rows)
+        return self.observe()
+
+    def _reset_envs(self, envs):
+        start_player = (self.height // 2) * self.width + self.width // 4
+        start_competitor = (self.height // 2) * self.width + self.width * 3 // 4
+        self.player.reset(envs, start_player, self.rng.integers(0, 4, len(envs)))
+        self.competitor.reset(envs, start_competitor, self.rng.integers(0, 4, len(envs)))
+        self.bombs[envs] = False
+        self.bomb_cell[envs] = -1
+        self.bomb_life[envs] = 0
+        self.powerup[envs] = 0
+        self.powerup_count[envs] = 0
+        self.powerup_timers[envs] = 0
+        for name in ("score", "combo_count", "combo_timer", "last_eat_time", "frenzy_timer", "time", "steps"):
+            getattr(self, name)[envs] = 0
+        self.frenzy_active[envs] = False
+        self.food[envs] = -1
+        self.food[envs] = self._random_free_cells(envs)
+
+    def step(self, actions):
+        """Applies one steering action per game and advances each by one player move.
+
+        Returns (observations, rewards, dones, info). info holds each game's "score",
+        "reason" (REASONS codes, 0 while playing) and "steps" as of this step, before
+        finished games are reset.
+        """
+        actions = np.asarray(actions, dtype=np.int64)
+        every = self._rows
+        score_before = self.score.copy()
+        self.reason[:] = 0
+        self.player.steer(every, actions)
+
+        # Simulated time this move takes, as in Snake.update's step timer
+        speed_multiplier = np.where(self.frenzy_active, 1.3, 1.0) # Base frenzy speedup
+        dt = 1.0 / (s.SNAKE_SPEED_BASE * speed_multiplier)
+        ticks = dt * s.SIMULATION_HZ
+        self.time += dt
+        self.steps += 1
+
+        self._update_spawns_and_hazards(dt, ticks)
+        self._update_frenzy(dt, ticks)
+        self._update_snakes(dt)
+        self._update_food(dt)
+        self._update_powerups()
+
+        if self.max_steps:
+            truncated = self.player.alive & (self.steps >= self.max_steps)
+            self.reason[truncated] = REASONS.index("max_steps")
+        rewards = (self.score - score_before).astype(np.float32)
+        dones = self.reason > 0
+        info = {"score": self.score.copy(), "reason": self.reason.copy(), "steps": self.steps.copy()}
+        finished = np.flatnonzero(dones)
+        if finished.size: self._reset_envs(finished)
+        return self.observe(), rewards, dones, info
+
+    def observe(self):
+        """Occupancy tensor of shape (N, WORLD_GRID_HEIGHT, WORLD_GRID_WIDTH, len(CHANNELS))."""
+        # One bit per channel in a byte per cell, unpacked into the channel axis in one pass
+        bits = (self.player.occ > 0).view(np.uint8) | (self.competitor.occ > 0).view(np.uint8) << 2 \
+             | (self.powerup > 0).view(np.uint8) << 5 | self.bombs.view(np.uint8) << 6
+        for bit, snake in ((1, self.player), (3, self.competitor)):
+            alive = self._rows[snake.alive]
+            bits[alive, snake.heads(alive)] |= 1 << bit
+        placed = self._rows[self.food >= 0]
+        bits[placed, self.food[placed]] |= 1 << 4
+        obs = np.unpackbits(bits.ravel(), bitorder="little").reshape(self.num_envs, self.height, self.width, 8)
+        return obs[..., :len(CHANNELS)] # View that skips the unused eighth bit
+
+    # --- Rules ---
+    def _random_free_cells(self, envs):
+        """A uniformly random free cell per game in `envs` (-1 where the board is full)."""
+        free = (self.player.occ[envs] == 0) & (self.competitor.occ[envs] == 0) \
+             & ~self.bombs[envs] & (self.powerup[envs] == 0)
+        food = self.food[envs]
+        placed = food >= 0
+        free[np.flatnonzero(placed), food[placed]] = False
+        keys = self.rng.random(free.shape)
+        keys[~free] = -1.0
+        return np.where(free.any(axis=1), keys.argmax(axis=1), -1)
+
+    def _spawn_envs(self, chance, ticks, room):
+        """Games whose per-tick `chance`, compounded over `ticks`, fires this step and that have `room`."""
+        return self._rows[(self.rng.random(self.num_envs) < 1.0 - (1.0 - chance) ** ticks) & room]
+
+    def _update_spawns_and_hazards(self, dt, ticks):
+        empty_slots = self.bomb_cell < 0
+        hazard_chance = s.HAZARD_SPAWN_CHANCE * (1 + self.frenzy_active)
+        envs = self._spawn_envs(hazard_chance, ticks, empty_slots.any(axis=1))
+        cells = self._random_free_cells(envs)
+        placed = cells >= 0
+        envs, cells = envs[placed], cells[placed]
+        slots = empty_slots[envs].argmax(axis=1)
+        self.bomb_cell[envs, slots] = cells
+        self.bomb_life[envs, slots] = self.rng.uniform(s.HAZARD_LIFETIME_MIN, s.HAZARD_LIFETIME_MAX, len(envs))
+        self.bombs[envs, cells] = True
+
+        envs = self._spawn_envs(s.POWERUP_SPAWN_CHANCE, ticks, self.powerup_count < s.POWERUP_MAX_COUNT)
+        cells = self._random_free_cells(envs)
+        placed = cells >= 0
+        envs, cells = envs[placed], cells[placed]
+        self.powerup[envs, cells] = self.rng.integers(1, len(POWERUP_TYPES) + 1, len(envs))
+        self.powerup_count[envs] += 1
+
+        # Expire bombs (a bomb spawned this step has already aged by dt, as in the core)
+        self.bomb_life -= dt[:, None]
+        envs, slots = np.nonzero((self.bomb_life <= 0) & (self.bomb_cell >= 0))
+        self.bombs[envs, self.bomb_cell[envs, slots]] = False
+        self.bomb_cell[envs, slots] = -1
+
+    def _update_frenzy(self, dt, ticks):
+        self.frenzy_timer[self.frenzy_active] -= dt[self.frenzy_active]
+        self.frenzy_active &= self.frenzy_timer > 0
+        envs = self._spawn_envs(0.05, ticks, self.frenzy_active) # Extra food respawns during frenzy
+        self.food[envs] = -1
+        self.food[envs] = self._random_free_cells(envs)
+
+    def _update_snakes(self, dt):
+        # Player: powerup timers run on real time, then one move (two with burst)
+        np.maximum(self.powerup_timers - dt[:, None], 0.0, out=self.powerup_timers)
+        every = self._rows
+        self._move(self.player, self.competitor, every, phase=self.powerup_timers[:, PHASE] > 0)
+        self._move(self.player, self.competitor, every[self.powerup_timers[:, BURST] > 0], phase=self.powerup_timers[:, PHASE] > 0)
+
+        # Competitor: its own step timer at its own speed, steered by the greedy AI
+        competitor = self.competitor
+        competitor.timer[competitor.alive] += dt[competitor.alive]
+        interval = 1.0 / s.COMPETITOR_SPEED_BASE
+        no_phase = np.zeros(self.num_envs, dtype=bool)
+        while True: # As many steps as the timer holds, like Snake.update
+            stepping = every[competitor.alive & (competitor.timer >= interval)]
+            if not stepping.size: break
+            competitor.timer[stepping] -= interval
+            self._steer_greedy(stepping)
+            self._move(competitor, self.player, stepping, phase=no_phase)
+
+    def _move(self, snake, other, envs, phase):
+        """One grid step with Snake.update's collision rules. Game overs are recorded in self.reason."""
+        envs = envs[snake.alive[envs] & self.player.alive[envs]]
+        if not envs.size: return
+        head = snake.heads(envs)
+        direction = snake.direction[envs]
+        x = head % self.width + _DX[direction]
+        y = head // self.width + _DY[direction]
+        wall = (x < 0) | (x >= self.width) | (y < 0) | (y >= self.height)
+        cells = np.where(wall, 0, y * self.width + x)
+
+        other_alive = other.alive[envs]
+        self_hit = ~wall & ~phase[envs] & (snake.occ[envs, cells] > 0)
+        bomb = ~wall & self.bombs[envs, cells]
+        head_on = ~wall & other_alive & (cells == other.heads(envs))
+        body_hit = ~wall & other_alive & (other.occ[envs, cells] > 0)
+        reason = np.select([wall, self_hit, bomb, head_on, body_hit], [1, 2, 3, 4, 5], 0)
+
+        dead = reason > 0
+        snake.kill(envs[dead])
+        other.kill(envs[head_on]) # Head-on: both die
+        # The player dying ends the game; the competitor only ends it with a head-on collision
+        game_over = dead if snake is self.player else head_on
+        self.reason[envs[game_over]] = reason[game_over]
+        snake.advance(envs[~dead], cells[~dead])
+
+    def _steer_greedy(self, envs):
+        """Vectorized Snake._update_ai_greedy: safe neighbour closest to the food, keeping the heading on ties."""
+        if not envs.size: return
+        snake = self.competitor
+        head = snake.heads(envs)
+        x = (head % self.width)[:, None] + _DX
+        y = (head // self.width)[:, None] + _DY
+        in_bounds = (x >= 0) & (x < self.width) & (y >= 0) & (y < self.height)
+        cells = np.where(in_bounds, y * self.width + x, 0)
+        rows = envs[:, None]
+        current = snake.direction[envs]
+        blocked = ~in_bounds | (snake.occ[rows, cells] > 0) | (self.player.occ[rows, cells] > 0) \
+                | self.bombs[rows, cells] | (np.arange(4) == _OPPOSITE[current][:, None])
+
+        food = self.food[envs][:, None]
+        dist = np.where(food >= 0, np.abs(x - food % self.width) + np.abs(y - food // self.width), _FAR)
+        dist = np.where(blocked, _BLOCKED, dist)
+        best = dist.min(axis=1)
+        keep = dist[np.arange(len(envs)), current] == best
+        choice = np.where(keep, current, dist.argmin(axis=1)) # argmin: first of DIRECTIONS among equals
+        snake.direction[envs] = np.where(best < _BLOCKED, choice, current) # Trapped: keep heading
+
+    def _update_food(self, dt):
+        """Eating, scoring, combos and frenzy triggers, as in SimulationCore._update_food."""
+        missing = self._rows[self.food < 0]
+        self.food[missing] = self._random_free_cells(missing) # Board was full, retry
+
+        has_food = self.food >= 0
+        player_eats = has_food & self.player.alive & (self.player.heads(self._rows) == self.food)
+        competitor_eats = has_food & ~player_eats & self.competitor.alive \
+                        & (self.competitor.heads(self._rows) == self.food)
+        self.player.grow(self._rows[player_eats])
+        self.competitor.grow(self._rows[competitor_eats])
+
+        # Player scoring and combos (timed on the simulation clock)
+        multiplier = np.where(self.powerup_timers[:, MULTIPLIER] > 0, 2, 1)
+        self.score += np.where(player_eats, (10 + self.combo_count * 5) * multiplier, 0)
+        in_combo = self.time - self.last_eat_time <= s.COMBO_TIME_LIMIT
+        self.combo_count = np.where(player_eats, np.where(in_combo, self.combo_count + 1, 1), self.combo_count)
+        self.last_eat_time[player_eats] = self.time[player_eats]
+        self.combo_timer[player_eats] = s.COMBO_TIME_LIMIT
+        frenzy_starts = player_eats & ~self.frenzy_active & (self.combo_count >= s.FRENZY_THRESHOLD)
+        self.frenzy_active |= frenzy_starts
+        self.frenzy_timer[frenzy_starts] = s.FRENZY_DURATION
+
+        eaten = self._rows[player_eats | competitor_eats]
+        self.food[eaten] = -1
+        self.food[eaten] = self._random_free_cells(eaten)
+
+        # Combo timer decay
+        running = self.combo_timer > 0
+        self.combo_timer[running] -= dt[running]
+        self.combo_count[running & (self.combo_timer <= 0)] = 0
+
+    def _update_powerups(self):
+        """Player pickups: the powerup's timer restarts at POWERUP_DURATION."""
+        envs = self._rows[self.player.alive]
+        heads = self.player.heads(envs)
+        kinds = self.powerup[envs, heads]
+        picked = kinds > 0
+        envs, heads, kinds = envs[picked], heads[picked], kinds[picked]
+        self.powerup_timers[envs, kinds - 1] = s.POWERUP_DURATION
+        self.powerup[envs, heads] = 0
+        self.powerup_count[envs] -= 1
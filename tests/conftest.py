@@ -0,0 +1,28 @@
+import os
+import sys
+
+# Headless pygame, and the repo root importable however pytest is started
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from snake_game import settings as s
+
+
+@pytest.fixture
+def make_game(tmp_path, monkeypatch):
+    """Builds Games (dummy display) that keep their highscore out of the repo and record no replays."""
+    monkeypatch.setattr(s, "HIGHSCORE_FILE", str(tmp_path / "highscore.json"))
+    monkeypatch.setattr(s, "RECORD_REPLAYS", False)
+    games = []
+
+    def make(seed=1):
+        from snake_game.game import Game
+        game = Game(seed=seed)
+        games.append(game)
+        return game
+    yield make
+    for game in games:
+        game.assets.wait() # Don't leave a loader thread running into the next test
@@ -0,0 +1,43 @@
+import json
+
+import pytest
+
+from snake_game import batch
+from snake_game import settings as s
+
+
+def test_run_game_restores_overrides_between_jobs():
+    before = (s.FOOD_COUNT, s.SIMULATION_HZ)
+    job = (0, {"FOOD_COUNT": 5, "SIMULATION_HZ": 30}, 4, "safe_random", None)
+    _, result = batch.run_game(job)
+    assert (s.FOOD_COUNT, s.SIMULATION_HZ) == before
+    assert result["seconds"] == result["ticks"] / 30 # Measured at the job's tick rate
+
+    # A reused worker running the next job sees the defaults again
+    _, plain = batch.run_game((1, {}, 4, "safe_random", None))
+    _, again = batch.run_game((1, {}, 4, "safe_random", None))
+    assert plain == again and plain["seconds"] == plain["ticks"] / s.SIMULATION_HZ
+
+
+def test_overrides_are_restored_when_a_job_fails():
+    before = s.FOOD_COUNT
+    with pytest.raises(ValueError):
+        batch.run_game((0, {"FOOD_COUNT": 3}, 1, "no_such_policy", None))
+    assert s.FOOD_COUNT == before
+
+
+def test_default_tick_cap_follows_the_set_tick_rate(monkeypatch):
+    monkeypatch.setattr(batch, "DEFAULT_MAX_SECONDS", 1)
+    for hz in (30, 120):
+        _, result = batch.run_game((0, {"SIMULATION_HZ": hz}, 2, "safe_random", None))
+        assert (result["ticks"], result["seconds"], result["reason"]) == (hz, 1.0, batch.TIMEOUT_REASON)
+
+
+def test_sweep_summary(tmp_path):
+    out = tmp_path / "summary.json"
+    assert batch.main(["--games", "3", "--workers", "1", "--policy", "safe_random", "--max-ticks", "600",
+                       "--sweep", "HAZARD_SPAWN_CHANCE=0.0,0.02", "--out", str(out)]) == 0
+    summary = json.loads(out.read_text())
+    assert [entry["overrides"] for entry in summary["sets"]] == [{"HAZARD_SPAWN_CHANCE": 0.0}, {"HAZARD_SPAWN_CHANCE": 0.02}]
+    assert all(entry["games"] == 3 for entry in summary["sets"])
+    assert batch.main(["--set", "NOT_A_SETTING=1", "--out", str(out)]) == 2
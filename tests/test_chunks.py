@@ -0,0 +1,71 @@
+import random
+
+import pytest
+
+from snake_game import grid
+from snake_game import settings as s
+from snake_game.chunks import ChunkIndex
+from snake_game.grid import OccupancyGrid
+from snake_game.graphics.camera import Camera
+from snake_game.simulation import SimulationCore
+
+
+class Item:
+    """Stand-in entity: the index only needs a hashable object with a grid_pos."""
+    def __init__(self, grid_pos):
+        self.grid_pos = grid_pos
+
+
+def brute_force_distance(items, pos, max_distance=None):
+    dists = [abs(i.grid_pos[0] - pos[0]) + abs(i.grid_pos[1] - pos[1]) for i in items]
+    dists = [d for d in dists if max_distance is None or d <= max_distance]
+    return min(dists, default=None)
+
+
+def distance(item, pos):
+    return None if item is None else abs(item.grid_pos[0] - pos[0]) + abs(item.grid_pos[1] - pos[1])
+
+
+@pytest.mark.parametrize("width,height,chunk_size,count", [(40, 30, 16, 5), (200, 50, 8, 3), (64, 64, 4, 200)])
+def test_nearest_matches_brute_force(width, height, chunk_size, count):
+    rng = random.Random(width * count)
+    index = ChunkIndex((width, height), chunk_size)
+    items = [Item((rng.randrange(width), rng.randrange(height))) for _ in range(count)]
+    for item in items:
+        index.add(grid.FOOD, item.grid_pos, item)
+    for _ in range(300):
+        pos = (rng.randrange(width), rng.randrange(height))
+        max_distance = rng.choice([None, 3, 20])
+        found = index.nearest(grid.FOOD, pos, max_distance)
+        assert distance(found, pos) == brute_force_distance(items, pos, max_distance)
+    assert index.nearest(grid.HAZARD, (0, 0)) is None # Empty kind
+
+
+def test_nearest_after_runtime_world_override(monkeypatch):
+    # Settings changed after import (as batch --set does) must size the index of the next core
+    monkeypatch.setattr(s, "WORLD_GRID_WIDTH", 240)
+    monkeypatch.setattr(s, "WORLD_GRID_HEIGHT", 180)
+    core = SimulationCore(seed=3)
+    core.start_new_game(seed=3)
+    assert (core.grid.width, core.grid.height) == (240, 180)
+    assert len(core.hazards) == 0
+    far = (239, 179)
+    handle = core.hazards.add(far, "bomb")
+    assert core.chunks.nearest(grid.HAZARD, (0, 0)) is core.hazards.view(handle)
+
+    rng = random.Random(9)
+    for _ in range(40):
+        core.hazards.spawn()
+    hazards = list(core.hazards)
+    for _ in range(200):
+        pos = (rng.randrange(240), rng.randrange(180))
+        assert distance(core.chunks.nearest(grid.HAZARD, pos), pos) == brute_force_distance(hazards, pos)
+
+
+def test_world_defaults_follow_runtime_overrides(monkeypatch):
+    monkeypatch.setattr(s, "WORLD_GRID_WIDTH", 120)
+    monkeypatch.setattr(s, "WORLD_GRID_HEIGHT", 90)
+    g = OccupancyGrid()
+    assert (g.width, g.height, g.free_count) == (120, 90, 120 * 90)
+    camera = Camera()
+    assert (camera.max_x, camera.max_y) == (120 * s.GRID_SIZE - s.WIDTH, 90 * s.GRID_SIZE - s.HEIGHT)
@@ -0,0 +1,44 @@
+import hashlib
+
+import pygame
+import pytest
+
+from snake_game import settings as s
+from snake_game.batch import POLICIES
+from snake_game.graphics.dirty_rects import DirtyRectTracker
+
+
+def render_frames(make_game, monkeypatch, dirty, frames=240):
+    """Plays a seeded game, hashing the screen after every drawn frame."""
+    monkeypatch.setattr(s, "DIRTY_RECTS", dirty)
+    game = make_game(seed=21)
+    game.start_new_game(seed=21)
+    game.player_snake.policy = POLICIES["safe_random"](21)
+    hashes = []
+    for frame in range(frames):
+        if frame == 30: game.player_snake.activate_powerup("magnet")
+        if frame % 40 == 0: game.hazards.spawn()
+        game.step_frame(1 / 60)
+        game.draw()
+        hashes.append(hashlib.md5(pygame.image.tobytes(game.screen, "RGB")).hexdigest())
+    return hashes, game
+
+
+def test_dirty_rect_frames_match_full_redraws(make_game, monkeypatch):
+    full, _ = render_frames(make_game, monkeypatch, dirty=False)
+    partial, game = render_frames(make_game, monkeypatch, dirty=True)
+    mismatched = [i for i, (a, b) in enumerate(zip(full, partial)) if a != b]
+    assert not mismatched, f"frames differ from a full redraw: {mismatched[:10]}"
+    assert game.dirty_rects.partial_frames > 0 # The partial path was actually exercised
+
+
+def test_tracker_merges_marked_tiles():
+    tracker = DirtyRectTracker(width=64, height=64, tile=16, max_coverage=0.5)
+    tracker.present(full=True) # Past the initial all-dirty frame
+    tracker.mark([pygame.Rect(1, 1, 4, 4), pygame.Rect(40, 40, 30, 30), None, pygame.Rect(0, 0, 0, 0)])
+    tracker.present()
+    assert sorted(tuple(r) for r in tracker.clear_rects()) == [(0, 0, 16, 16), (32, 32, 32, 32)]
+    assert not tracker.wants_full_redraw()
+    tracker.mark([pygame.Rect(0, 0, 64, 48)])
+    tracker.present()
+    assert tracker.wants_full_redraw() and tracker.coverage == pytest.approx(14 / 16) # Last frame's tiles plus this one's
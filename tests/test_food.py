@@ -0,0 +1,56 @@
+import random
+
+import pytest
+
+from snake_game import grid
+from snake_game import settings as s
+from snake_game.simulation import SimulationCore
+
+
+def new_core(seed=5):
+    core = SimulationCore(seed=seed)
+    core.start_new_game(seed=seed)
+    return core
+
+
+def assert_indexed(core):
+    placed = [f for f in core.food if f.grid_pos is not None]
+    assert core.food.by_cell == {f.grid_pos: f for f in placed}
+    assert all(core.grid.has(grid.FOOD, f.grid_pos) for f in placed)
+
+
+def test_food_count_is_read_when_the_game_starts(monkeypatch):
+    monkeypatch.setattr(s, "FOOD_COUNT", 7) # As batch --set does, after import
+    core = new_core()
+    assert len(core.food) == 7 and core.food.target == 7
+    assert_indexed(core)
+
+
+def test_eat_respawns_up_to_target_and_removes_extras(monkeypatch):
+    monkeypatch.setattr(s, "FOOD_COUNT", 3)
+    core = new_core()
+    food = core.food
+    item = food.items[0]
+    old_cell = item.grid_pos
+    food.eat(item)
+    assert len(food) == 3 and item.grid_pos != old_cell and food.at(old_cell) is None
+    extras = food.spawn(2) # A frenzy burst
+    food.eat(extras[0])
+    food.eat(food.items[0])
+    assert len(food) == 3
+    assert_indexed(core)
+
+
+@pytest.mark.parametrize("count", [4, 80]) # Linear scan, then the chunk index
+def test_nearest_matches_brute_force(monkeypatch, count):
+    monkeypatch.setattr(s, "FOOD_COUNT", count)
+    core = new_core()
+    rng = random.Random(count)
+    for _ in range(200):
+        pos = (rng.randrange(core.grid.width), rng.randrange(core.grid.height))
+        max_distance = rng.choice([None, 4])
+        dists = [abs(c[0] - pos[0]) + abs(c[1] - pos[1]) for c in core.food.by_cell]
+        dists = [d for d in dists if max_distance is None or d <= max_distance]
+        found = core.food.nearest(pos, max_distance)
+        found_dist = None if found is None else abs(found.grid_pos[0] - pos[0]) + abs(found.grid_pos[1] - pos[1])
+        assert found_dist == min(dists, default=None)
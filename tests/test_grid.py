@@ -0,0 +1,106 @@
+import random
+from collections import Counter
+
+from snake_game import grid
+from snake_game import settings as s
+from snake_game.batch import POLICIES
+from snake_game.grid import OccupancyGrid
+from snake_game.entities.snake_body import SnakeBody
+from snake_game.simulation import SimulationCore
+
+
+def assert_free_index_consistent(g):
+    free = {(x, y) for y in range(g.height) for x in range(g.width) if g.total[y * g.width + x] == 0}
+    assert g.free_count == len(free)
+    assert {(idx % g.width, idx // g.width) for idx in g._free} == free
+
+def test_add_remove_counts():
+    g = OccupancyGrid(6, 4)
+    g.add(grid.FOOD, (1, 1))
+    g.add(grid.PLAYER, (1, 1))
+    g.add(grid.HAZARD, (5, 3))
+    assert g.count(grid.FOOD, (1, 1)) == 1 and g.count(grid.PLAYER, (1, 1)) == 1
+    assert not g.is_free((1, 1)) and g.blocks_movement((5, 3)) and not g.blocks_movement((0, 0))
+    assert g.blocks_movement((-1, 0)) and g.count(grid.FOOD, (6, 0)) == 0
+
+    g.remove(grid.FOOD, (1, 1))
+    assert not g.is_free((1, 1)) # The player is still there
+    g.remove(grid.PLAYER, (1, 1))
+    assert g.is_free((1, 1))
+
+
+def test_free_index_tracks_occupancy():
+    g = OccupancyGrid(7, 5)
+    rng = random.Random(1)
+    occupied = []
+    for _ in range(400):
+        if occupied and rng.random() < 0.4:
+            kind, pos = occupied.pop(rng.randrange(len(occupied)))
+            g.remove(kind, pos)
+        else:
+            kind, pos = rng.choice([grid.FOOD, grid.HAZARD]), (rng.randrange(7), rng.randrange(5)) # May stack
+            g.add(kind, pos)
+            occupied.append((kind, pos))
+        assert_free_index_consistent(g)
+    g.clear()
+    assert g.free_count == 35
+
+
+def test_random_free_cell_only_returns_free_cells():
+    g = OccupancyGrid(5, 5)
+    rng = random.Random(3)
+    for _ in range(24):
+        g.add(grid.HAZARD, g.random_free_cell(rng))
+    last = g.random_free_cell(rng)
+    assert g.is_free(last) and g.free_count == 1
+    g.add(grid.FOOD, last)
+    assert g.is_full and g.random_free_cell(rng) is None
+
+def test_snake_body_mirrors_grid():
+    g = OccupancyGrid(8, 8)
+    body = SnakeBody(g, grid.PLAYER)
+    body.reset((3, 3))
+    rng = random.Random(7)
+    for _ in range(500):
+        # Random walk that may cross itself, as a phasing snake does
+        if len(body) > 1 and rng.random() < 0.45:
+            body.pop_tail()
+        else:
+            x, y = body.head
+            dx, dy = rng.choice([(0, 1), (0, -1), (1, 0), (-1, 0)])
+            body.push_head(((x + dx) % 8, (y + dy) % 8))
+        expected = Counter(body)
+        assert expected == Counter({pos: body.count(pos) for pos in expected})
+        for y in range(8):
+            for x in range(8):
+                assert g.count(grid.PLAYER, (x, y)) == expected.get((x, y), 0)
+                assert ((x, y) in body) == ((x, y) in expected)
+        assert_free_index_consistent(g)
+
+    body.release()
+    assert all(g.count(grid.PLAYER, (x, y)) == 0 for y in range(8) for x in range(8))
+    assert len(body) > 0 # Released cells stay readable
+
+
+def test_simulation_grid_matches_entities(monkeypatch):
+    monkeypatch.setattr(s, "COMPETITOR_COUNT", 3)
+    monkeypatch.setattr(s, "FOOD_COUNT", 4)
+    monkeypatch.setattr(s, "HAZARD_SPAWN_CHANCE", 0.05)
+    core = SimulationCore(seed=11)
+    core.start_new_game(seed=11)
+    core.player_snake.policy = POLICIES["safe_random"](11)
+    for _ in range(60):
+        if core.advance(20) < 20: break
+        layers = {kind: Counter() for kind in range(grid.NUM_KINDS)}
+        for snake in core.snakes:
+            if snake.alive: layers[snake.body.kind].update(snake.body)
+        for item in core.food.items:
+            if item.grid_pos is not None: layers[grid.FOOD][item.grid_pos] += 1
+        for registry in (core.powerups, core.hazards):
+            layers[registry.kind].update(registry.cells)
+        for kind, cells in layers.items():
+            actual = Counter({(i % core.grid.width, i // core.grid.width): n
+                              for i, n in enumerate(core.grid.layers[kind]) if n})
+            assert actual == cells, f"occupancy kind {kind}"
+        assert_free_index_consistent(core.grid)
+    assert core.tick_count > 200 # Long enough to have eaten, grown and spawned
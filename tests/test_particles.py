@@ -0,0 +1,44 @@
+import numpy as np
+import pygame
+import pytest
+
+from snake_game import settings as s
+from snake_game.entities.particle import ParticleSystem
+
+
+def test_emit_fills_rows_and_caps_at_capacity():
+    ps = ParticleSystem(capacity=10, rng=np.random.default_rng(0))
+    ps.emit((100, 50), 4, (255, 10, 20, 128), life_range=(1, 1), speed_range=(2, 2))
+    assert len(ps) == 4
+    assert (ps.pos[:4] == (100, 50)).all() and (ps.color[:4] == (255, 10, 20)).all()
+    assert np.hypot(ps.vel[:4, 0], ps.vel[:4, 1]) == pytest.approx([2] * 4)
+    ps.emit((0, 0), 20, (1, 2, 3))
+    assert len(ps) == 10 # The rest are dropped
+    ps.emit((0, 0), 5, (1, 2, 3))
+    assert len(ps) == 10
+
+
+def test_update_moves_shrinks_and_expires():
+    ps = ParticleSystem(capacity=16, rng=np.random.default_rng(1))
+    ps.emit((0, 0), 3, (255, 255, 255), life_range=(0.25, 0.25), size_range=(4, 4), gravity=0.0)
+    ps.emit((0, 0), 2, (0, 255, 0), life_range=(2.0, 2.0), size_range=(4, 4), gravity=0.0)
+    vel = ps.vel[:5].copy()
+    ps.update(0.1)
+    assert ps.pos[:5] == pytest.approx(vel * 0.1 * s.FPS)
+    assert ps.size[:3] == pytest.approx([4 * 0.15 / 0.25] * 3) # Linear shrink with remaining life
+    ps.update(0.2) # Short-lived ones run out...
+    assert len(ps) == 5
+    ps.update(0.1) # ...and are compacted away on the next update
+    assert len(ps) == 2 and (ps.color[:2] == (0, 255, 0)).all()
+    assert ps.life[:2] == pytest.approx([1.6, 1.6])
+
+
+def test_draw_blits_live_particles_only():
+    surface = pygame.Surface((200, 200), pygame.SRCALPHA)
+    ps = ParticleSystem(capacity=8, rng=np.random.default_rng(2))
+    assert ps.draw(surface) == []
+    ps.emit((100, 100), 3, (255, 0, 0), size_range=(6, 6), speed_range=(0, 0))
+    rects = ps.draw(surface)
+    assert len(rects) == 3 and surface.get_at((100, 100)).r > 0
+    ps.life[:3] = 0
+    assert ps.draw(surface) == []
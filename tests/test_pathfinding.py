@@ -0,0 +1,52 @@
+from snake_game import settings as s
+from snake_game.batch import POLICIES
+from snake_game.pathfinding import NodeBudget, bfs_first_step, reachable_area
+from snake_game.simulation import SimulationCore
+
+
+def open_board(width, height, walls=()):
+    walls = set(walls)
+    return lambda pos: not (0 <= pos[0] < width and 0 <= pos[1] < height) or pos in walls
+
+
+def test_bfs_finds_a_shortest_first_step():
+    # A wall across x=2 with a gap at the bottom: the path must go down first
+    is_blocked = open_board(5, 5, walls=[(2, 0), (2, 1), (2, 2), (2, 3)])
+    step, dist = bfs_first_step((0, 0), (4, 0), is_blocked, NodeBudget(1000))
+    assert step == (0, 1) and dist == 12
+
+
+def test_bfs_gives_up_when_the_budget_runs_out():
+    is_blocked = open_board(50, 50)
+    budget = NodeBudget(10)
+    assert bfs_first_step((0, 0), (49, 49), is_blocked, budget) == (None, None)
+    assert budget.used == 10 and not budget.spend()
+    assert bfs_first_step((0, 0), (49, 49), is_blocked, NodeBudget(5000))[1] == 98
+
+
+def test_unreachable_goal():
+    is_blocked = open_board(5, 5, walls=[(3, 4), (4, 3)])
+    assert bfs_first_step((0, 0), (4, 4), is_blocked, NodeBudget(1000)) == (None, None)
+
+
+def test_flood_fill_counts_up_to_the_limit_or_the_budget():
+    is_blocked = open_board(10, 10, walls=[(x, 3) for x in range(10)]) # Rows 0-2 cut off from the rest
+    assert reachable_area((0, 0), is_blocked, 1000, NodeBudget(1000)) == 30
+    assert reachable_area((0, 0), is_blocked, 12, NodeBudget(1000)) == 12
+    budget = NodeBudget(3)
+    assert reachable_area((0, 5), is_blocked, 1000, budget) < 60 and budget.used == 3 # A lower bound
+    assert reachable_area((0, 3), is_blocked, 1000, NodeBudget(1000)) == 0
+
+
+def test_pathfinding_ai_stays_within_its_node_budget(monkeypatch):
+    monkeypatch.setattr(s, "AI_MODE", "pathfinding")
+    monkeypatch.setattr(s, "AI_NODE_BUDGET", 50)
+    monkeypatch.setattr(s, "COMPETITOR_COUNT", 3)
+    core = SimulationCore(seed=6)
+    core.start_new_game(seed=6)
+    core.player_snake.policy = POLICIES["safe_random"](6)
+    used = []
+    for _ in range(600):
+        if core.advance(1) < 1: break
+        used += [snake.ai_nodes_used for snake in core.competitors if snake.alive]
+    assert used and max(used) <= 50
@@ -0,0 +1,80 @@
+import random
+from types import SimpleNamespace
+
+from snake_game import grid
+from snake_game.chunks import ChunkIndex
+from snake_game.grid import OccupancyGrid
+from snake_game.registry import HANDLE_ID_BITS
+from snake_game.entities.hazard import HazardRegistry
+from snake_game.entities.powerup import PowerUpRegistry
+
+
+def make_registry(width=20, height=20):
+    game = SimpleNamespace(grid=OccupancyGrid(width, height), chunks=ChunkIndex((width, height), 4))
+    return HazardRegistry(game), game
+
+
+def test_removed_handle_is_stale():
+    reg, game = make_registry()
+    handle = reg.add((2, 3), "bomb")
+    assert reg.is_alive(handle) and reg.view(handle).grid_pos == (2, 3)
+    assert reg.remove(handle)
+    assert not reg.is_alive(handle) and reg.view(handle) is None
+    assert not reg.remove(handle) # Second removal is a no-op
+    assert game.grid.is_free((2, 3)) and reg.handle_at((2, 3)) is None
+
+
+def test_reused_slot_does_not_revive_old_handle():
+    reg, _ = make_registry()
+    old = reg.add((1, 1), "bomb")
+    reg.remove(old)
+    new = reg.add((5, 5), "bomb") # Takes the freed slot
+    assert new != old and new & ((1 << HANDLE_ID_BITS) - 1) == old & ((1 << HANDLE_ID_BITS) - 1)
+    assert not reg.is_alive(old) and reg.view(old) is None
+    assert not reg.remove(old)
+    assert reg.is_alive(new) and len(reg) == 1
+
+
+def test_swap_remove_keeps_other_handles_valid():
+    reg, game = make_registry()
+    handles = [reg.add((i, i), "bomb") for i in range(6)]
+    reg.remove(handles[1])
+    reg.remove(handles[4])
+    for i in (0, 2, 3, 5):
+        assert reg.view(handles[i]).grid_pos == (i, i)
+        assert reg.handle_at((i, i)) == handles[i]
+    assert sorted(v.grid_pos for v in reg) == [(0, 0), (2, 2), (3, 3), (5, 5)]
+    assert game.grid.free_count == 20 * 20 - 4
+
+
+def test_expiry_and_clear_invalidate_handles():
+    reg, game = make_registry()
+    short = reg.add((0, 0), "bomb", lifetime=1.0)
+    long = reg.add((1, 0), "bomb", lifetime=5.0)
+    assert reg.age_all(2.0) == 1
+    assert not reg.is_alive(short) and reg.is_alive(long)
+    assert game.chunks.nearest(grid.HAZARD, (0, 0)) is reg.view(long)
+    reg.clear()
+    assert not reg.is_alive(long) and len(reg) == 0
+
+
+def test_views_read_their_row_after_swaps():
+    reg, _ = make_registry()
+    a = reg.add((0, 0), "bomb", lifetime=3.0)
+    b = reg.add((1, 0), "bomb", lifetime=4.0)
+    view = reg.view(b)
+    reg.remove(a) # Moves b's row
+    assert (view.grid_pos, view.e_type, view.h_type, view.lifetime) == ((1, 0), "bomb", "bomb", 4.0)
+    view.lifetime = 9.0
+    assert reg.lifetime[reg.row(view.slot)] == 9.0
+    assert view.screen_points() == view.previous_screen_points() == (view.visual_pos,)
+
+
+def test_powerup_spawn_on_full_board_leaves_streams_alone():
+    game = SimpleNamespace(grid=OccupancyGrid(2, 1), chunks=ChunkIndex((2, 1), 4),
+                           rng=random.Random(1), fx_rng=random.Random(2))
+    reg = PowerUpRegistry(game)
+    assert reg.spawn() is not None and reg.spawn() is not None
+    fx_state = game.fx_rng.getstate()
+    assert reg.spawn() is None and len(reg) == 2
+    assert game.fx_rng.getstate() == fx_state
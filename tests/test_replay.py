@@ -0,0 +1,55 @@
+import random
+
+import pytest
+
+from snake_game import replay
+from snake_game.pathfinding import DIRECTIONS
+from snake_game.replay import ReplayRecorder, ReplayPlayer
+from snake_game.simulation import SimulationCore
+
+
+def record_game(seed, file_path, max_ticks=3000):
+    """Plays a game with seeded random steering between ticks (as a player would) and saves it."""
+    core = SimulationCore()
+    core.recorder = ReplayRecorder()
+    core.start_new_game(seed=seed)
+    steer = random.Random(seed)
+    rng_dt = random.Random(seed + 1)
+    for _ in range(max_ticks):
+        if core.game_state != "PLAYING": break
+        if steer.random() < 0.1: core.player_snake.change_direction(steer.choice(DIRECTIONS))
+        core.update(rng_dt.choice([1 / 120, 1 / 60, 1 / 45])) # Uneven frame times must replay too
+    core.recorder.save(file_path, core)
+    return core
+
+
+@pytest.mark.parametrize("seed", [1, 42, 2024])
+def test_round_trip_reproduces_the_game(tmp_path, seed):
+    file_path = tmp_path / "game.snkr"
+    recorded = record_game(seed, file_path)
+    player = ReplayPlayer.load(file_path)
+    assert player.meta["seed"] == seed and player.meta["ticks"] == recorded.tick_count
+    replayed = player.play()
+    assert (replayed.tick_count, replayed.score, replayed.game_over_reason) == \
+           (recorded.tick_count, recorded.score, recorded.game_over_reason)
+    assert [sn.body[:] for sn in replayed.snakes] == [sn.body[:] for sn in recorded.snakes]
+    assert replay.main([str(file_path)]) == 0
+
+
+def test_main_reports_a_mismatch(tmp_path):
+    file_path = tmp_path / "game.snkr"
+    core = record_game(5, file_path)
+    core.score += 1 # Claim a result the input stream doesn't produce
+    core.recorder.save(file_path, core)
+    assert replay.main([str(file_path)]) == 1
+
+
+def test_load_rejects_other_files(tmp_path):
+    bad = tmp_path / "bad.snkr"
+    bad.write_bytes(b"NOPE" + bytes(16))
+    with pytest.raises(ValueError, match="Not a replay"):
+        ReplayPlayer.load(bad)
+    old = tmp_path / "old.snkr"
+    old.write_bytes(replay.MAGIC + replay._HEADER.pack(replay.VERSION - 1, 2) + b"{}")
+    with pytest.raises(ValueError, match="Unsupported replay version"):
+        ReplayPlayer.load(old)
@@ -0,0 +1,60 @@
+import pygame
+import pytest
+
+from snake_game import settings as s
+from snake_game.audio.sound_manager import SoundManager
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    """A 4-channel SoundManager on the dummy audio driver, with 2 s silent buffers as its sounds."""
+    monkeypatch.setattr(s, "SOUND_CHANNELS", 4)
+    monkeypatch.setattr(s, "SOUND_VOICE_LIMITS", {"eat": 2, "combo": 4, "powerup": 4, "event": 1})
+    try:
+        pygame.mixer.init(44100, -16, 2, 512)
+    except pygame.error as e:
+        pytest.skip(f"No audio device: {e}")
+    sm = SoundManager().load()
+    silence = pygame.mixer.Sound(buffer=bytes(44100 * 4 * 2)) # Long enough to stay busy during a test
+    sm.sounds = dict.fromkeys(["eat", "powerup", "gameover"] + [f"combo_{i}" for i in range(1, 6)], silence)
+    yield sm
+    pygame.mixer.stop()
+    pygame.mixer.quit()
+
+
+def test_plays_only_on_pooled_channels(manager):
+    used = [manager.play(f"combo_{i}", now=i) for i in range(1, 5)]
+    assert len(set(used)) == 4 and set(used) <= set(manager.channels)
+    assert manager.stats["played"] == 4
+
+
+def test_finished_voices_free_their_channel(manager):
+    first = manager.play("combo_1", now=0)
+    for i in range(2, 5): manager.play(f"combo_{i}", now=0)
+    first.stop()
+    assert manager.play("combo_5", now=1) is first # Reused without stealing
+    assert manager.stats["stolen"] == 0 and manager.stats["dropped"] == 0
+
+
+def test_category_voice_limit_cuts_the_oldest(manager):
+    first = manager.play("eat", now=0.0)
+    manager.play("eat", now=1.0)
+    assert manager.play("eat", now=2.0) is first
+    assert manager.stats["limited"] == 1 and len([v for v in manager.voices if v.category == "eat"]) == 2
+
+
+def test_full_pool_steals_low_priority_and_drops_lower(manager):
+    eat = manager.play("eat", now=0)
+    for i in range(1, 4): manager.play(f"combo_{i}", now=0)
+    assert manager.play("powerup", now=0) is eat # Eat ranks lowest: its voice is stolen
+    assert manager.stats["stolen"] == 1
+    assert manager.play("eat", now=1) is None # Nothing ranks at or below eat now
+    assert manager.stats["dropped"] == 1
+
+
+def test_retriggers_are_rate_limited(manager):
+    assert manager.play("combo_1", now=10.0) is not None
+    assert manager.play("combo_1", now=10.0 + s.SOUND_MIN_INTERVAL / 2) is None
+    assert manager.play("combo_1", now=10.0 + s.SOUND_MIN_INTERVAL) is not None
+    assert manager.stats["rate_limited"] == 1
+    assert manager.play("not_loaded") is None
@@ -0,0 +1,50 @@
+import pytest
+
+from snake_game import settings as s
+from snake_game.simulation import SimulationCore
+
+
+def test_accumulator_runs_whole_ticks_and_carries_the_rest(make_game):
+    game = make_game()
+    game.start_new_game(seed=3)
+    tick = game.tick_dt
+    assert game.step_frame(2.5 * tick) == 2
+    assert game.render_alpha == pytest.approx(0.5)
+    assert game.step_frame(0.5 * tick) == 1 # The carried half tick completes
+    assert game.tick_count == 3 and game.dropped_ticks == 0
+
+
+def test_stall_is_capped_and_the_backlog_dropped(make_game):
+    game = make_game()
+    game.start_new_game(seed=3)
+    tick = game.tick_dt
+    assert game.step_frame(20.25 * tick) == s.MAX_CATCHUP_TICKS
+    assert game.dropped_ticks == 20 - s.MAX_CATCHUP_TICKS
+    assert game.sim_accumulator == pytest.approx(0.25 * tick)
+    assert game.step_frame(0.75 * tick) == 1 # Back to normal pacing, no burst of old ticks
+
+
+def test_rules_do_not_depend_on_the_frame_rate(make_game):
+    runs = []
+    for frame_dt in (1 / 30, 1 / 144):
+        game = make_game()
+        game.start_new_game(seed=8)
+        for _ in range(round(2.0 / frame_dt)): # Two seconds of play
+            game.step_frame(frame_dt)
+        runs.append((game.tick_count, game.score, game.game_over_reason, list(game.player_snake.body)))
+    assert runs[0] == runs[1]
+
+
+def test_step_rate_holds_below_the_snake_speed(monkeypatch):
+    # Ticks slower than the snakes step: each tick must take every step that fell due
+    heads = {}
+    for hz in (60, 4):
+        monkeypatch.setattr(s, "SIMULATION_HZ", hz)
+        core = SimulationCore(seed=1)
+        core.start_new_game(seed=1)
+        core.advance(hz) # One simulated second
+        assert core.game_state == "PLAYING"
+        for snake in core.snakes:
+            assert snake.timer < 1.0 / snake.speed # No backlog of untaken steps
+        heads[hz] = core.player_snake.body.head
+    assert heads[4] == heads[60]
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from snake_game import settings as s
+from snake_game.vec_env import VecSnakeEnv, CHANNELS, REASONS
+
+N = 16
+
+
+def channel(obs, name):
+    return obs[..., CHANNELS.index(name)]
+
+
+def assert_observation_consistent(env, obs):
+    assert obs.shape == (env.num_envs, env.height, env.width, len(CHANNELS)) and obs.dtype == np.uint8
+    flat = obs.reshape(env.num_envs, -1, len(CHANNELS))
+    for name, snake in (("player", env.player), ("competitor", env.competitor)):
+        body = flat[..., CHANNELS.index(f"{name}_body")]
+        head = flat[..., CHANNELS.index(f"{name}_head")]
+        assert (body == (snake.occ > 0)).all()
+        assert (head.sum(axis=1) == snake.alive).all()
+        assert (body[head == 1] == 1).all() # Heads lie on their bodies
+    assert (flat[..., CHANNELS.index("food")].sum(axis=1) == (env.food >= 0)).all()
+    assert (flat[..., CHANNELS.index("bomb")].sum(axis=1) == (env.bomb_cell >= 0).sum(axis=1)).all()
+    assert (flat[..., CHANNELS.index("powerup")].sum(axis=1) == env.powerup_count).all()
+
+
+def test_reset_shapes_and_start_state():
+    env = VecSnakeEnv(N, seed=0)
+    obs = env.reset()
+    assert_observation_consistent(env, obs)
+    assert (channel(obs, "player_head").sum(axis=(1, 2)) == 1).all()
+    assert (channel(obs, "food").sum(axis=(1, 2)) == 1).all()
+    assert not channel(obs, "bomb").any() and not env.score.any()
+
+
+def test_step_outputs_and_channels_stay_consistent():
+    env = VecSnakeEnv(N, seed=1)
+    env.reset()
+    rng = np.random.default_rng(1)
+    finished = 0
+    for _ in range(300):
+        obs, rewards, dones, info = env.step(rng.integers(0, 4, N))
+        assert rewards.shape == (N,) and rewards.dtype == np.float32 and dones.shape == (N,)
+        assert set(info) == {"score", "reason", "steps"}
+        assert ((info["reason"] > 0) == dones).all()
+        assert (env.steps[dones] == 0).all() # Finished games were reset
+        assert_observation_consistent(env, obs)
+        finished += int(dones.sum())
+    assert finished > 0
+
+
+def test_same_seed_same_games():
+    runs = []
+    for _ in range(2):
+        env = VecSnakeEnv(4, seed=7)
+        env.reset()
+        actions = np.random.default_rng(3)
+        runs.append([env.step(actions.integers(0, 4, 4))[1].tolist() for _ in range(200)] + [env.score.tolist()])
+    assert runs[0] == runs[1]
+
+
+def test_max_steps_truncates():
+    env = VecSnakeEnv(N, seed=2, max_steps=3)
+    env.reset()
+    for _ in range(3):
+        _, _, dones, info = env.step(np.zeros(N, dtype=np.int64))
+    survived = info["steps"] == 3 # Games that didn't die (and restart) along the way
+    assert survived.any() and dones[survived].all()
+    assert (info["reason"][survived] == REASONS.index("max_steps")).all()
+
+
+@pytest.mark.parametrize("name,value", [("COMPETITOR_COUNT", 2), ("FOOD_COUNT", 3), ("FRENZY_FOOD_BURST", 2)])
+def test_rejects_unsupported_settings(monkeypatch, name, value):
+    monkeypatch.setattr(s, name, value)
+    with pytest.raises(ValueError, match=name):
+        VecSnakeEnv(2)